@@ -5,12 +5,17 @@ Main command-line interface for automated kernel bisection.
 """
 
 import argparse
+import copy
+import functools
+import hashlib
+import json
 import logging
+import os
 import shutil
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, cast
 
 import yaml
 
@@ -24,6 +29,12 @@ from kbisect.power.factory import create_power_controller
 
 # Constants
 DEFAULT_CONFIG_PATH = "bisect.yaml"
+# libyaml-backed safe loader/dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+CONFIG_CACHE_NAME = ".{}.json"  # JSON copy of a parsed config, kept next to the YAML file
+CONFIG_CACHE_MODE = 0o600  # Owner-only permissions for the JSON config copy
+CONFIG_SECRET_KEY_PARTS = ("password", "secret", "token")  # Configs with these keys are not cached
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -42,25 +53,44 @@ def setup_logging(verbose: bool = False) -> None:
 def load_config(config_path: str) -> Dict[str, Any]:
     """Load configuration from YAML file.
 
+    Parsed configs are cached per process, keyed by the file's path and
+    modification time, so repeated loads of an unchanged file skip parsing.
+
     Args:
         config_path: Path to YAML configuration file
 
     Returns:
-        Configuration dictionary
+        Configuration dictionary (a private copy the caller may modify)
 
     Raises:
-        SystemExit: If config file not found
+        SystemExit: If config file not found or is not a YAML mapping
     """
-    path = Path(config_path)
+    path = Path(config_path).absolute()
 
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         logger.error(f"Config file not found: {config_path}")
         logger.info("Please create a config file. See example at:")
         logger.info("  kernel-bisect/config/bisect.conf.example")
         sys.exit(1)
 
-    with path.open() as f:
-        config_dict = yaml.safe_load(f)
+    return copy.deepcopy(_load_config_cached(str(path), mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, _mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config and resolve its relative paths (cached by load_config).
+
+    Args:
+        config_path: Absolute path to YAML configuration file
+        _mtime_ns: File modification time; part of the cache key only
+
+    Returns:
+        Configuration dictionary, shared between cache hits
+    """
+    path = Path(config_path)
+    config_dict = _read_config_file(path)
 
     # Resolve relative paths in config relative to config file location
     config_dir = path.parent.resolve()
@@ -90,6 +120,79 @@ def load_config(config_path: str) -> Dict[str, Any]:
     return config_dict
 
 
+def _has_secret_keys(value: Any) -> bool:
+    """Check whether a parsed config contains credential keys at any depth.
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        True if any mapping key looks like a password, secret or token
+    """
+    if isinstance(value, dict):
+        return any(
+            (isinstance(key, str) and any(part in key.lower() for part in CONFIG_SECRET_KEY_PARTS))
+            or _has_secret_keys(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return any(_has_secret_keys(item) for item in value)
+    return False
+
+
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    """Parse a YAML config, preferring its JSON sidecar cache when up to date.
+
+    JSON parses much faster than YAML. The sidecar records the SHA-256 of the
+    YAML it was built from and is only used while that hash matches, so
+    restored or quickly re-edited files are never served stale. It is written
+    owner-only after a YAML parse whose result survives a JSON round trip
+    unchanged, and never for configs holding credentials; failures to write
+    it (e.g. read-only directory) are ignored.
+
+    Args:
+        path: Path to YAML configuration file
+
+    Returns:
+        Parsed configuration dictionary
+
+    Raises:
+        SystemExit: If the YAML top level is not a mapping
+    """
+    cache_path = path.with_name(CONFIG_CACHE_NAME.format(path.name))
+    source = path.read_bytes()
+    source_hash = hashlib.sha256(source).hexdigest()
+
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["source_sha256"] == source_hash:
+            return cast("Dict[str, Any]", cached["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    parsed = yaml.load(source, Loader=YAML_LOADER)
+    if not isinstance(parsed, dict):
+        logger.error(f"Config file {path} must contain a mapping at the top level")
+        sys.exit(1)
+    config_dict = cast("Dict[str, Any]", parsed)
+
+    if _has_secret_keys(config_dict):
+        return config_dict
+
+    try:
+        cache_text = json.dumps({"source_sha256": source_hash, "config": config_dict})
+        if json.loads(cache_text)["config"] == config_dict:
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, CONFIG_CACHE_MODE)
+            with os.fdopen(fd, "w") as f:
+                f.write(cache_text)
+            tmp_path.replace(cache_path)
+    except (OSError, TypeError, ValueError) as exc:
+        logger.debug(f"Not caching parsed config {path}: {exc}")
+
+    return config_dict
+
+
 def create_bisect_config(config_dict: Dict[str, Any], _args: Any) -> BisectConfig:
     """Create BisectConfig from config dict and CLI args.
 
@@ -103,12 +206,16 @@ def create_bisect_config(config_dict: Dict[str, Any], _args: Any) -> BisectConfi
     Raises:
         SystemExit: If hosts configuration is missing or invalid
     """
-    # Get kernel config settings from config file only
-    kernel_config_file = config_dict.get("kernel_config", {}).get("config_file")
-
-    # Get metadata settings from config
+    # Look up each config section once
+    timeouts = config_dict.get("timeouts", {})
+    test_config = config_dict.get("test", {})
+    kernel_repo = config_dict.get("kernel_repo", {})
+    kernel_config = config_dict.get("kernel_config", {})
     metadata_config = config_dict.get("metadata", {})
 
+    # Get kernel config settings from config file only
+    kernel_config_file = kernel_config.get("config_file")
+
     # Parse hosts configuration (REQUIRED)
     if "hosts" not in config_dict:
         logger.error("Config file missing 'hosts' section")
@@ -150,19 +257,19 @@ def create_bisect_config(config_dict: Dict[str, Any], _args: Any) -> BisectConfi
 
     return BisectConfig(
         hosts=hosts,
-        boot_timeout=config_dict.get("timeouts", {}).get("boot", 300),
-        test_timeout=config_dict.get("timeouts", {}).get("test", 600),
-        build_timeout=config_dict.get("timeouts", {}).get("build", 1800),
-        ssh_connect_timeout=config_dict.get("timeouts", {}).get("ssh_connect", 15),
-        test_type=config_dict.get("test", {}).get("type", "boot"),
+        boot_timeout=timeouts.get("boot", 300),
+        test_timeout=timeouts.get("test", 600),
+        build_timeout=timeouts.get("build", 1800),
+        ssh_connect_timeout=timeouts.get("ssh_connect", 15),
+        test_type=test_config.get("type", "boot"),
         state_dir=config_dict.get("state_dir", "."),
         db_path=config_dict.get("database_path", "bisect.db"),
         kernel_config_file=kernel_config_file,
         collect_baseline=metadata_config.get("collect_baseline", True),
         collect_per_iteration=metadata_config.get("collect_per_iteration", True),
         collect_kernel_config=metadata_config.get("collect_kernel_config", True),
-        kernel_repo_source=config_dict.get("kernel_repo", {}).get("source"),
-        kernel_repo_branch=config_dict.get("kernel_repo", {}).get("branch"),
+        kernel_repo_source=kernel_repo.get("source"),
+        kernel_repo_branch=kernel_repo.get("branch"),
     )
 
 
@@ -278,7 +385,7 @@ def _resume_session(session, state: StateManager, config_dict: dict) -> bool:
         print("✗ Config file must have 'hosts' section")
         return False
 
-    from kbisect.remote import SSHClient
+    from kbisect.remote import SSHClient, check_alive
 
     ssh_connect_timeout = config_dict.get("timeouts", {}).get("ssh_connect", 15)
     all_reachable = True
@@ -289,62 +396,68 @@ def _resume_session(session, state: StateManager, config_dict: dict) -> bool:
         ssh = SSHClient(host_name, host_user, ssh_connect_timeout)
         ssh_clients.append((host_name, ssh, host_dict))
 
-        if not ssh.is_alive():
-            print(f"  ✗ {host_name} is unreachable!")
-            all_reachable = False
-        else:
-            print(f"  ✓ {host_name} is reachable")
-
-    if not all_reachable:
-        print("\n✗ One or more hosts are still unreachable!")
-        print("\nPlease fix the host machines and try again.")
-        return False
+    try:
+        reachable = check_alive([ssh for _host_name, ssh, _host_dict in ssh_clients])
+        for (host_name, _ssh, _host_dict), alive in zip(ssh_clients, reachable):
+            if not alive:
+                print(f"  ✗ {host_name} is unreachable!")
+                all_reachable = False
+            else:
+                print(f"  ✓ {host_name} is reachable")
 
-    print("\n✓ All hosts are reachable")
-    print("Resuming bisection from halted state...")
+        if not all_reachable:
+            print("\n✗ One or more hosts are still unreachable!")
+            print("\nPlease fix the host machines and try again.")
+            return False
 
-    # Check if there's a pending commit to mark
-    if iterations:
-        last_iteration = iterations[-1]
-        if last_iteration.error_message and "(git mark pending" in last_iteration.error_message:
-            print(f"Marking pending commit {last_iteration.commit_sha[:7]}...")
-
-            # Determine what to mark based on error message
-            if "Boot timeout" in last_iteration.error_message or "Kernel panic" in last_iteration.error_message:
-                # Determine mark type based on original test type
-                test_type = config_dict.get("test", {}).get("type", "boot")
-                if test_type == "boot":
-                    mark_as = "bad"
-                    print("  Boot test mode: marking as BAD")
-                else:
-                    mark_as = "skip"
-                    print("  Custom test mode: marking as SKIP (cannot test if kernel doesn't boot)")
-
-                # Mark the commit via SSH (use first host since all share git state)
-                _first_host_name, first_ssh, first_host_dict = ssh_clients[0]
-                kernel_path = first_host_dict.get("kernel_path", "/root/kernel")
-                mark_cmd = f"cd {kernel_path} && git bisect {mark_as}"
-                ret, _, stderr = first_ssh.run_command(mark_cmd, timeout=first_ssh.connect_timeout)
-
-                if ret == 0:
-                    print(f"✓ Commit marked as {mark_as}")
-                    # Update iteration with final result
-                    state.update_iteration(
-                        last_iteration.iteration_id,
-                        final_result=mark_as,
-                        error_message=last_iteration.error_message.replace(" (git mark pending - slave down)", ""),
-                    )
-                else:
-                    print(f"✗ Failed to mark commit: {stderr}")
-                    print("  Please mark manually and try again")
-                    return False
+        print("\n✓ All hosts are reachable")
+        print("Resuming bisection from halted state...")
+
+        # Check if there's a pending commit to mark
+        if iterations:
+            last_iteration = iterations[-1]
+            if last_iteration.error_message and "(git mark pending" in last_iteration.error_message:
+                print(f"Marking pending commit {last_iteration.commit_sha[:7]}...")
+
+                # Determine what to mark based on error message
+                if "Boot timeout" in last_iteration.error_message or "Kernel panic" in last_iteration.error_message:
+                    # Determine mark type based on original test type
+                    test_type = config_dict.get("test", {}).get("type", "boot")
+                    if test_type == "boot":
+                        mark_as = "bad"
+                        print("  Boot test mode: marking as BAD")
+                    else:
+                        mark_as = "skip"
+                        print("  Custom test mode: marking as SKIP (cannot test if kernel doesn't boot)")
+
+                    # Mark the commit via SSH (use first host since all share git state)
+                    _first_host_name, first_ssh, first_host_dict = ssh_clients[0]
+                    kernel_path = first_host_dict.get("kernel_path", "/root/kernel")
+                    mark_cmd = f"cd {kernel_path} && git bisect {mark_as}"
+                    ret, _, stderr = first_ssh.run_command(mark_cmd, timeout=first_ssh.connect_timeout)
+
+                    if ret == 0:
+                        print(f"✓ Commit marked as {mark_as}")
+                        # Update iteration with final result
+                        state.update_iteration(
+                            last_iteration.iteration_id,
+                            final_result=mark_as,
+                            error_message=last_iteration.error_message.replace(" (git mark pending - slave down)", ""),
+                        )
+                    else:
+                        print(f"✗ Failed to mark commit: {stderr}")
+                        print("  Please mark manually and try again")
+                        return False
 
-    print("Bisection will continue from next commit.")
-    print("=" * 70 + "\n")
+        print("Bisection will continue from next commit.")
+        print("=" * 70 + "\n")
 
-    # Update session status back to running
-    state.update_session(session.session_id, status="running")
-    return True
+        # Update session status back to running
+        state.update_session(session.session_id, status="running")
+        return True
+    finally:
+        for _host_name, ssh, _host_dict in ssh_clients:
+            ssh.close()
 
 
 def cmd_start(args: argparse.Namespace) -> int:
@@ -505,31 +618,35 @@ def cmd_monitor(args: argparse.Namespace) -> int:
 
     print(f"=== Host Monitor ({len(monitors)} hosts) ===\n")
 
-    if args.continuous:
-        print(f"Monitoring {len(monitors)} host(s) (Ctrl+C to stop)...\n")
-        try:
-            while True:
-                for hostname, monitor in monitors:
-                    status = monitor.check_health()
-                    print(f"[{status.last_check}] {hostname}: Alive={status.is_alive} | Kernel={status.kernel_version or 'N/A'}")
-                print()  # Blank line between intervals
-                time.sleep(args.interval)
-        except KeyboardInterrupt:
-            print("\nMonitoring stopped")
-    else:
-        for hostname, monitor in monitors:
-            status = monitor.check_health()
-            print(f"Host: {hostname}")
-            print(f"  Alive:  {status.is_alive}")
-            print(f"  Ping:   {status.ping_responsive}")
-            print(f"  SSH:    {status.ssh_responsive}")
-            if status.kernel_version:
-                print(f"  Kernel: {status.kernel_version}")
-            if status.uptime:
-                print(f"  Uptime: {status.uptime}")
-            if status.error:
-                print(f"  Error:  {status.error}")
-            print()
+    try:
+        if args.continuous:
+            print(f"Monitoring {len(monitors)} host(s) (Ctrl+C to stop)...\n")
+            try:
+                while True:
+                    for hostname, monitor in monitors:
+                        status = monitor.check_health()
+                        print(f"[{status.last_check}] {hostname}: Alive={status.is_alive} | Kernel={status.kernel_version or 'N/A'}")
+                    print()  # Blank line between intervals
+                    time.sleep(args.interval)
+            except KeyboardInterrupt:
+                print("\nMonitoring stopped")
+        else:
+            for hostname, monitor in monitors:
+                status = monitor.check_health()
+                print(f"Host: {hostname}")
+                print(f"  Alive:  {status.is_alive}")
+                print(f"  Ping:   {status.ping_responsive}")
+                print(f"  SSH:    {status.ssh_responsive}")
+                if status.kernel_version:
+                    print(f"  Kernel: {status.kernel_version}")
+                if status.uptime:
+                    print(f"  Uptime: {status.uptime}")
+                if status.error:
+                    print(f"  Error:  {status.error}")
+                print()
+    finally:
+        for _hostname, monitor in monitors:
+            monitor.close()
 
     return 0
 
@@ -714,7 +831,7 @@ def _handle_logs_list(state: StateManager, args: argparse.Namespace) -> int:
 
 def _handle_logs_show(state: StateManager, args: argparse.Namespace) -> int:
     """Handle 'logs show' subcommand."""
-    log_data = state.get_build_log(args.log_id)
+    log_data = state.get_build_log(args.log_id, include_content=False)
 
     if not log_data:
         print(f"Log {args.log_id} not found")
@@ -729,7 +846,9 @@ def _handle_logs_show(state: StateManager, args: argparse.Namespace) -> int:
     print(f"Size:          {size_kb:.1f} KB (compressed)")
     print(f"Timestamp:     {log_data['timestamp']}")
     print("\n" + "=" * 80 + "\n")
-    print(log_data["content"])
+    for chunk in state.stream_build_log(args.log_id):
+        sys.stdout.write(chunk)
+    print()
     return 0
 
 
@@ -774,7 +893,7 @@ def _handle_logs_iteration(state: StateManager, args: argparse.Namespace) -> int
 
 def _handle_logs_export(state: StateManager, args: argparse.Namespace) -> int:
     """Handle 'logs export' subcommand."""
-    log_data = state.get_build_log(args.log_id)
+    log_data = state.get_build_log(args.log_id, include_content=False)
 
     if not log_data:
         print(f"Log {args.log_id} not found")
@@ -784,7 +903,7 @@ def _handle_logs_export(state: StateManager, args: argparse.Namespace) -> int:
 
     try:
         with output_path.open("w") as f:
-            f.write(log_data["content"])
+            f.writelines(state.stream_build_log(args.log_id))
         print(f"Log {args.log_id} exported to: {output_path}")
         file_size = output_path.stat().st_size
         size_kb = file_size / 1024 if file_size else 0
@@ -949,8 +1068,6 @@ def cmd_metadata(args: argparse.Namespace) -> int:
         print("\n" + "=" * 80 + "\n")
 
         # Display metadata content
-        import json
-
         metadata_content = metadata["metadata"]
 
         # If metadata is a dict, pretty print as JSON
@@ -997,15 +1114,11 @@ def cmd_metadata(args: argparse.Namespace) -> int:
         output_path = Path(args.output) if args.output else Path(f"metadata-{args.metadata_id}.json")
 
         try:
-            import json
-
             with output_path.open("w") as f:
                 if args.format == "json":
                     json.dump(metadata["metadata"], f, indent=2)
                 else:  # yaml
-                    import yaml
-
-                    yaml.dump(metadata["metadata"], f, default_flow_style=False)
+                    yaml.dump(metadata["metadata"], f, Dumper=YAML_DUMPER, default_flow_style=False)
 
             print(f"Metadata {args.metadata_id} exported to: {output_path}")
         except Exception as exc:
@@ -1038,14 +1151,35 @@ def cmd_deploy(args: argparse.Namespace) -> int:
 
     ssh_connect_timeout = config_dict.get("timeouts", {}).get("ssh_connect", 15)
     all_success = True
-    for i, host_dict in enumerate(config_dict["hosts"], 1):
-        host_name = host_dict["hostname"]
-        host_user = host_dict.get("ssh_user", "root")
-        deploy_path = host_dict.get("bisect_path", "/root/kernel-bisect/lib")
+    deploy_args = [
+        {
+            "slave_host": host_dict["hostname"],
+            "slave_user": host_dict.get("ssh_user", "root"),
+            "deploy_path": host_dict.get("bisect_path", "/root/kernel-bisect/lib"),
+            "connect_timeout": ssh_connect_timeout,
+        }
+        for host_dict in config_dict["hosts"]
+    ]
+
+    # Full deployment runs on all hosts in parallel; results are reported per host below
+    full_results = []
+    if not args.verify_only and not args.update_only:
+        print("Deploying...\n")
+        full_results = SlaveDeployer.deploy_many(deploy_args)
 
-        print(f"[{i}/{len(config_dict['hosts'])}] Host: {host_name}")
+    for i, host_kwargs in enumerate(deploy_args, 1):
+        print(f"[{i}/{len(deploy_args)}] Host: {host_kwargs['slave_host']}")
 
-        deployer = SlaveDeployer(host_name, host_user, deploy_path, connect_timeout=ssh_connect_timeout)
+        if full_results:
+            if full_results[i - 1]:
+                print("  ✓ Deployment successful")
+            else:
+                print("  ✗ Deployment failed")
+                all_success = False
+            print()
+            continue
+
+        deployer = SlaveDeployer(**host_kwargs)
 
         if args.verify_only:
             # Just verify deployment
@@ -1068,15 +1202,7 @@ def cmd_deploy(args: argparse.Namespace) -> int:
                 print("  ✗ Library update failed")
                 all_success = False
 
-        else:
-            # Full deployment
-            print("  Deploying...")
-            if deployer.deploy_full():
-                print("  ✓ Deployment successful")
-            else:
-                print("  ✗ Deployment failed")
-                all_success = False
-
+        deployer.close()
         print()
 
     # Deploy kernel source if configured (only for full deployment, not verify/update)
@@ -77,7 +77,7 @@ class ConsoleCollector(ABC):
             Duration in seconds, or None if not started
         """
         if self.start_time:
-            return time.time() - self.start_time
+            return time.monotonic() - self.start_time
         return None
 
     def get_buffer_stats(self) -> dict:
@@ -85,7 +85,7 @@ class ConserverCollector(ConsoleCollector):
             self.reader_thread.start()
 
             self.is_active = True
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             logger.info(f"✓ Started console log collection (conserver: {self.hostname})")
             return True
 
@@ -22,8 +22,8 @@ logger = logging.getLogger(__name__)
 class IPMISOLCollector(ConsoleCollector):
     """IPMI Serial-Over-LAN console log collector.
 
-    Uses IPMI SOL to capture console output. This is a synchronous wrapper
-    around the existing IPMI controller functionality.
+    Uses IPMI SOL to capture console output. A background thread streams the
+    IPMI controller's SOL output into the buffer line by line as it arrives.
 
     Attributes:
         ipmi_host: IPMI hostname or IP address
@@ -58,13 +58,16 @@ class IPMISOLCollector(ConsoleCollector):
         self.cipher_suite = cipher_suite
         self.collection_thread: Optional[threading.Thread] = None
         self.stop_requested = False
+        self._stop_event = threading.Event()
         self.lock = threading.Lock()
 
     def start(self) -> bool:
         """Start console log collection via IPMI SOL.
 
         Spawns background thread to activate IPMI SOL and capture output.
-        Note: IPMI SOL is blocking, so we run it in a thread.
+        Note: IPMI SOL is blocking, so we run it in a thread. Each start gets a
+        fresh stop event and an empty buffer, so a collector can be reused
+        across reboots.
 
         Returns:
             True if started successfully, False on error
@@ -72,16 +75,22 @@ class IPMISOLCollector(ConsoleCollector):
         try:
             logger.debug(f"Starting IPMI SOL collection for {self.hostname}")
 
+            self.stop_requested = False
+            self._stop_event = threading.Event()
+            with self.lock:
+                self.buffer.clear()
+
             # Start background SOL capture thread
             self.collection_thread = threading.Thread(
                 target=self._capture_sol,
+                args=(self._stop_event,),
                 daemon=True,
                 name=f"ipmi-sol-{self.hostname}",
             )
             self.collection_thread.start()
 
             self.is_active = True
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             logger.info(f"✓ Started console log collection (IPMI SOL: {self.hostname})")
             return True
 
@@ -89,11 +98,14 @@ class IPMISOLCollector(ConsoleCollector):
             logger.error(f"Failed to start IPMI SOL collection: {exc}")
             return False
 
-    def _capture_sol(self) -> None:
+    def _capture_sol(self, stop_event: threading.Event) -> None:
         """Background thread function to capture IPMI SOL output.
 
-        Creates IPMI controller and runs activate_serial_console.
-        Stores output in buffer when complete or interrupted.
+        Creates IPMI controller and streams its serial console into the buffer
+        until the collection timeout or stop().
+
+        Args:
+            stop_event: Event set by stop() to end this capture
         """
         try:
             # Import here to avoid circular dependency
@@ -108,14 +120,12 @@ class IPMISOLCollector(ConsoleCollector):
             )
 
             # Use a very long duration - we'll stop it manually
-            output = ipmi.activate_serial_console(duration=DEFAULT_COLLECTION_TIMEOUT)
-
-            if not self.stop_requested and output:
+            for line in ipmi.stream_serial_console(
+                duration=DEFAULT_COLLECTION_TIMEOUT, stop_event=stop_event
+            ):
                 with self.lock:
-                    # Split into lines for consistent buffer handling
-                    lines = output.splitlines(keepends=True)
                     # deque with maxlen automatically maintains size limit
-                    self.buffer.extend(lines)
+                    self.buffer.append(line)
 
         except Exception as exc:
             logger.debug(f"IPMI SOL capture exception: {exc}")
@@ -123,17 +133,17 @@ class IPMISOLCollector(ConsoleCollector):
     def stop(self) -> str:
         """Stop console log collection and retrieve output.
 
-        Note: IPMI SOL cannot be cleanly interrupted, so this waits for
-        the SOL session to complete or timeout.
+        Signals the SOL stream to end and waits for the capture thread to
+        tear the session down.
 
         Returns:
             Collected console output as string
         """
         self.stop_requested = True
+        self._stop_event.set()
         output = ""
 
         try:
-            # SOL cannot be interrupted cleanly, wait for thread
             if self.collection_thread and self.collection_thread.is_alive():
                 logger.debug("Waiting for IPMI SOL session to complete...")
                 self.collection_thread.join(timeout=10.0)
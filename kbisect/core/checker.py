@@ -2,6 +2,7 @@
 
 import logging
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, List, Optional
@@ -160,6 +161,7 @@ class SystemChecker:
         """
         results = []
         hostname = host_config.hostname
+        ssh: Optional[SSHClient] = None
 
         try:
             ssh = SSHClient(
@@ -200,6 +202,9 @@ class SystemChecker:
                     message=f"Connection failed: {e!s}",
                 )
             )
+        finally:
+            if ssh is not None:
+                ssh.close()
 
         return results
 
@@ -214,6 +219,7 @@ class SystemChecker:
         """
         results = []
         hostname = host_config.hostname
+        ssh: Optional[SSHClient] = None
 
         try:
             ssh = SSHClient(
@@ -317,6 +323,9 @@ class SystemChecker:
                     message=f"Unable to perform slave checks: {e!s}",
                 )
             )
+        finally:
+            if ssh is not None:
+                ssh.close()
 
         return results
 
@@ -462,8 +471,17 @@ class SystemChecker:
         logger.info("Validating configuration...")
         self.results.extend(self.check_config_validity())
 
+        # Power controller health checks (bkr whoami, BMC queries) are slow and
+        # independent of each other, so start them for all hosts up front
+        executor = ThreadPoolExecutor()
+        power_futures = [
+            executor.submit(self.check_power_controller, host_config)
+            for host_config in self.config.hosts
+        ]
+        executor.shutdown(wait=False)
+
         # Per-host checks
-        for host_config in self.config.hosts:
+        for host_config, power_future in zip(self.config.hosts, power_futures):
             hostname = host_config["hostname"]
             logger.info(f"Checking host: {hostname}")
 
@@ -488,7 +506,7 @@ class SystemChecker:
             self.results.extend(self.check_slave_deployment(host_config))
 
             # Power controller
-            self.results.extend(self.check_power_controller(host_config))
+            self.results.extend(power_future.result())
 
             # Console collector
             self.results.extend(self.check_console_collector(host_config))
@@ -5,24 +5,38 @@ Monitors network connectivity, SSH access, and can trigger IPMI recovery if need
 """
 
 import logging
-import subprocess
+import socket
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TypeVar
+
+from kbisect.remote import SSHClient
+from kbisect.remote.ssh import SSH_PORT
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Constants
 DEFAULT_PING_TIMEOUT = 5
 DEFAULT_SSH_TIMEOUT = 10
 DEFAULT_BOOT_TIMEOUT = 300
 DEFAULT_CHECK_INTERVAL = 5
+BOOT_POLL_MIN_INTERVAL = 0.25  # First delay between boot checks; grows up to check_interval
+BOOT_POLL_BACKOFF = 1.5  # Delay growth factor per failed boot check
+BOOT_PING_TIMEOUT = 1  # Short network probe timeout while polling for boot
+BOOT_SSH_FALLBACK_INTERVAL = 15  # Seconds between full checks while the network probe fails
 STATUS_LOG_INTERVAL = 30
 SHUTDOWN_POLL_INTERVAL = 2
 SHUTDOWN_TIMEOUT = 60
 POST_BOOT_SETTLE_TIME = 10
+# One SSH round trip for liveness, kernel and uptime; each query prints exactly one line
+REMOTE_PROBE_COMMAND = "echo alive; uname -r || echo; uptime -p || echo"
+HEALTH_CHECK_TIMEOUT = 15  # Upper bound on check_health wall time; a stuck probe counts as failed
 
 
 @dataclass
@@ -31,7 +45,7 @@ class HealthStatus:
 
     Attributes:
         is_alive: Overall health status (True if both ping and SSH work)
-        ping_responsive: Whether system responds to ICMP ping
+        ping_responsive: Whether system's network stack answers a TCP probe
         ssh_responsive: Whether SSH service is accessible
         last_check: ISO timestamp of when check was performed
         uptime: System uptime string (if available)
@@ -52,12 +66,14 @@ class SlaveMonitor:
     """Monitor slave machine health and boot status.
 
     Provides methods to check system health, wait for boot/shutdown,
-    and verify kernel versions.
+    and verify kernel versions. All SSH probes share one multiplexed
+    connection, so repeated checks skip the handshake.
 
     Attributes:
         slave_host: Hostname or IP address of slave machine
         slave_user: SSH username for slave access
         connect_timeout: SSH connection timeout in seconds
+        ssh: SSH client used for all remote probes
     """
 
     def __init__(
@@ -73,25 +89,28 @@ class SlaveMonitor:
         self.slave_host = slave_host
         self.slave_user = slave_user
         self.connect_timeout = connect_timeout
+        self.ssh = SSHClient(slave_host, slave_user, connect_timeout)
 
     def ping(self, timeout: int = DEFAULT_PING_TIMEOUT) -> bool:
-        """Check if slave responds to ping.
+        """Check if slave responds on the network.
+
+        Probes in-process with a TCP connect to the SSH port instead of
+        spawning ping(8). A refused connection still means the host is up.
+        A failure is only a hint: ssh may reach the host through ~/.ssh/config
+        (HostName aliases, Port, ProxyJump), which this probe ignores.
 
         Args:
-            timeout: Ping timeout in seconds
+            timeout: Probe timeout in seconds
 
         Returns:
-            True if slave responds to ping, False otherwise
+            True if slave responds, False otherwise
         """
         try:
-            result = subprocess.run(
-                ["ping", "-c", "1", "-W", str(timeout), self.slave_host],
-                capture_output=True,
-                timeout=timeout + 1,
-                check=False,
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, Exception) as exc:
+            with socket.create_connection((self.slave_host, SSH_PORT), timeout=timeout):
+                return True
+        except ConnectionRefusedError:
+            return True
+        except OSError as exc:
             logger.debug(f"Ping failed: {exc}")
             return False
 
@@ -104,31 +123,13 @@ class SlaveMonitor:
         Returns:
             Tuple of (success, error_message)
         """
-        ssh_command = [
-            "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            f"ConnectTimeout={self.connect_timeout}",
-            "-o",
-            "BatchMode=yes",
-            f"{self.slave_user}@{self.slave_host}",
-            "echo alive",
-        ]
+        ret, stdout, stderr = self.ssh.run_command("echo alive", timeout=timeout)
 
-        try:
-            result = subprocess.run(
-                ssh_command, capture_output=True, text=True, timeout=timeout, check=False
-            )
-
-            if result.returncode == 0 and "alive" in result.stdout:
-                return True, None
-            return False, f"SSH failed: {result.stderr}"
-
-        except subprocess.TimeoutExpired:
+        if ret == 0 and "alive" in stdout:
+            return True, None
+        if ret == -1 and stderr == "Timeout":
             return False, "SSH timeout"
-        except Exception as exc:
-            return False, str(exc)
+        return False, f"SSH failed: {stderr}"
 
     def get_kernel_version(self) -> Optional[str]:
         """Get current kernel version from slave.
@@ -136,27 +137,12 @@ class SlaveMonitor:
         Returns:
             Kernel version string or None if unable to retrieve
         """
-        ssh_command = [
-            "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            f"ConnectTimeout={self.connect_timeout}",
-            f"{self.slave_user}@{self.slave_host}",
-            "uname -r",
-        ]
+        ret, stdout, stderr = self.ssh.run_command("uname -r", timeout=10)
 
-        try:
-            result = subprocess.run(
-                ssh_command, capture_output=True, text=True, timeout=10, check=False
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
-
-        except Exception as exc:
-            logger.debug(f"Failed to get kernel version: {exc}")
+        if ret == 0:
+            return stdout.strip()
 
+        logger.debug(f"Failed to get kernel version: {stderr}")
         return None
 
     def get_uptime(self) -> Optional[str]:
@@ -165,89 +151,151 @@ class SlaveMonitor:
         Returns:
             Uptime string or None if unable to retrieve
         """
-        ssh_command = [
-            "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            f"ConnectTimeout={self.connect_timeout}",
-            f"{self.slave_user}@{self.slave_host}",
-            "uptime -p",
-        ]
+        ret, stdout, _stderr = self.ssh.run_command("uptime -p", timeout=10)
 
-        try:
-            result = subprocess.run(
-                ssh_command, capture_output=True, text=True, timeout=10, check=False
-            )
+        if ret == 0:
+            return stdout.strip()
 
-            if result.returncode == 0:
-                return result.stdout.strip()
+        return None
 
-        except Exception:
-            pass
+    def _probe_remote(
+        self, timeout: int = DEFAULT_SSH_TIMEOUT
+    ) -> Tuple[bool, Optional[str], Optional[str], Optional[str]]:
+        """Check SSH and query kernel version and uptime in one SSH invocation.
 
-        return None
+        Args:
+            timeout: SSH command timeout in seconds
+
+        Returns:
+            Tuple of (ssh_ok, error_message, kernel_version, uptime)
+        """
+        ret, stdout, stderr = self.ssh.run_command(REMOTE_PROBE_COMMAND, timeout=timeout)
+        lines = [line.strip() for line in stdout.splitlines()]
+
+        if not lines or lines[0] != "alive":
+            if ret == -1 and stderr == "Timeout":
+                return False, "SSH timeout", None, None
+            return False, f"SSH failed: {stderr}", None, None
 
-    def check_health(self) -> HealthStatus:
+        kernel_version = lines[1] if len(lines) > 1 and lines[1] else None
+        uptime = lines[2] if len(lines) > 2 and lines[2] else None
+        return True, None, kernel_version, uptime
+
+    def check_health(self, ping_ok: Optional[bool] = None) -> HealthStatus:
         """Perform comprehensive health check.
 
+        Ping runs concurrently with a single SSH probe that also collects the
+        kernel version and uptime, so a check takes as long as the slower of
+        the two rather than the sum of four separate probes. A successful SSH
+        probe marks the slave alive even if the direct network probe failed.
+
+        Args:
+            ping_ok: Result of a network probe the caller just ran; when given,
+                the probe is not repeated
+
         Returns:
             HealthStatus object with current system state
         """
         logger.debug(f"Checking health of {self.slave_host}...")
 
-        ping_ok = self.ping()
-        ssh_ok, ssh_error = self.ssh_check()
+        deadline = time.monotonic() + HEALTH_CHECK_TIMEOUT
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            ping_future = executor.submit(self.ping) if ping_ok is None else None
+            probe_future = executor.submit(self._probe_remote)
+            ping_responsive = (
+                bool(ping_ok)
+                if ping_future is None
+                else self._result_by(ping_future, deadline, False)
+            )
+            ssh_ok, ssh_error, kernel_version, uptime = self._result_by(
+                probe_future, deadline, (False, "SSH timeout", None, None)
+            )
+        finally:
+            # Don't let a stuck probe hold the caller past the deadline
+            executor.shutdown(wait=False)
 
-        is_alive = ping_ok and ssh_ok
+        is_alive = ssh_ok
 
-        status = HealthStatus(
+        return HealthStatus(
             is_alive=is_alive,
-            ping_responsive=ping_ok,
+            ping_responsive=ping_responsive,
             ssh_responsive=ssh_ok,
             last_check=datetime.now(timezone.utc).isoformat(),
+            uptime=uptime if is_alive else None,
+            kernel_version=kernel_version if is_alive else None,
             error=ssh_error if not ssh_ok else None,
         )
 
-        if is_alive:
-            status.kernel_version = self.get_kernel_version()
-            status.uptime = self.get_uptime()
+    @staticmethod
+    def _result_by(future: "Future[T]", deadline: float, default: T) -> T:
+        """Get a probe result, giving up at the health check deadline.
 
-        return status
+        Args:
+            future: Future of a submitted probe
+            deadline: time.monotonic() value after which the probe counts as failed
+            default: Value returned if the probe does not finish in time
+
+        Returns:
+            Probe result, or default on timeout
+        """
+        try:
+            return future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            logger.debug("Health probe did not finish before the deadline")
+            return default
 
     def wait_for_boot(
         self, timeout: int = DEFAULT_BOOT_TIMEOUT, check_interval: int = DEFAULT_CHECK_INTERVAL
     ) -> bool:
         """Wait for slave to boot up.
 
+        Polls quickly at first and backs off exponentially, so a fast boot is
+        noticed within a fraction of a second while a long one costs few probes.
+        The full health check (and its ssh process) runs once the in-process
+        network probe succeeds, and every BOOT_SSH_FALLBACK_INTERVAL seconds
+        regardless, since ssh may reach hosts the probe cannot.
+
         Args:
             timeout: Maximum time to wait in seconds
-            check_interval: How often to check status in seconds
+            check_interval: Maximum delay between checks in seconds
 
         Returns:
             True if slave booted successfully, False if timeout
         """
         logger.info(f"Waiting for slave to boot (timeout: {timeout}s)...")
 
-        start_time = time.time()
-
-        while time.time() - start_time < timeout:
-            status = self.check_health()
-
-            if status.is_alive:
-                elapsed = int(time.time() - start_time)
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        next_log_at = start_time + STATUS_LOG_INTERVAL
+        delay = BOOT_POLL_MIN_INTERVAL
+        next_full_check = start_time
+
+        while time.monotonic() < deadline:
+            status = None
+            ping_ok = self.ping(timeout=BOOT_PING_TIMEOUT)
+            if ping_ok or time.monotonic() >= next_full_check:
+                status = self.check_health(ping_ok=ping_ok)
+                next_full_check = time.monotonic() + BOOT_SSH_FALLBACK_INTERVAL
+
+            if status is not None and status.is_alive:
+                elapsed = int(time.monotonic() - start_time)
                 logger.info(f"✓ Slave is alive after {elapsed}s")
                 logger.info(f"  Kernel: {status.kernel_version}")
                 logger.info(f"  Uptime: {status.uptime}")
                 return True
 
-            # Log status every 30 seconds
-            elapsed = int(time.time() - start_time)
-            if elapsed % STATUS_LOG_INTERVAL == 0 and elapsed > 0:
-                logger.info(f"Still waiting... ({elapsed}/{timeout}s)")
-                logger.debug(f"  Ping: {status.ping_responsive}, SSH: {status.ssh_responsive}")
+            now = time.monotonic()
+            if now >= next_log_at:
+                logger.info(f"Still waiting... ({int(now - start_time)}/{timeout}s)")
+                if status is None:
+                    logger.debug("  Ping: False, SSH: not probed")
+                else:
+                    logger.debug(f"  Ping: {status.ping_responsive}, SSH: {status.ssh_responsive}")
+                next_log_at = now + STATUS_LOG_INTERVAL
 
-            time.sleep(check_interval)
+            time.sleep(max(0.0, min(delay, deadline - now)))
+            delay = min(check_interval, delay * BOOT_POLL_BACKOFF)
 
         logger.error(f"Slave failed to boot within {timeout}s timeout")
         return False
@@ -263,11 +311,11 @@ class SlaveMonitor:
         """
         logger.info("Waiting for slave to shut down...")
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             if not self.ping():
-                elapsed = int(time.time() - start_time)
+                elapsed = int(time.monotonic() - start_time)
                 logger.info(f"✓ Slave is down after {elapsed}s")
                 return True
 
@@ -299,6 +347,10 @@ class SlaveMonitor:
         logger.error("Boot failed or timed out")
         return False, None
 
+    def close(self) -> None:
+        """Close the multiplexed SSH connection to the slave."""
+        self.ssh.close()
+
 
 def main() -> int:
     """Test the monitor."""
@@ -316,27 +368,30 @@ def main() -> int:
 
     monitor = SlaveMonitor(args.slave_host, args.user)
 
-    if args.wait_boot:
-        success, kernel = monitor.monitor_boot(args.timeout)
-        if success:
-            print(f"Boot successful: {kernel}")
-            return 0
-
-        print("Boot failed")
-        return 1
-
-    status = monitor.check_health()
-    print(f"Alive: {status.is_alive}")
-    print(f"Ping: {status.ping_responsive}")
-    print(f"SSH: {status.ssh_responsive}")
-    if status.kernel_version:
-        print(f"Kernel: {status.kernel_version}")
-    if status.uptime:
-        print(f"Uptime: {status.uptime}")
-    if status.error:
-        print(f"Error: {status.error}")
-
-    return 0 if status.is_alive else 1
+    try:
+        if args.wait_boot:
+            success, kernel = monitor.monitor_boot(args.timeout)
+            if success:
+                print(f"Boot successful: {kernel}")
+                return 0
+
+            print("Boot failed")
+            return 1
+
+        status = monitor.check_health()
+        print(f"Alive: {status.is_alive}")
+        print(f"Ping: {status.ping_responsive}")
+        print(f"SSH: {status.ssh_responsive}")
+        if status.kernel_version:
+            print(f"Kernel: {status.kernel_version}")
+        if status.uptime:
+            print(f"Uptime: {status.uptime}")
+        if status.error:
+            print(f"Error: {status.error}")
+
+        return 0 if status.is_alive else 1
+    finally:
+        monitor.close()
 
 
 if __name__ == "__main__":
@@ -6,17 +6,18 @@ Orchestrates the kernel bisection process across master and slave machines.
 
 import json
 import logging
+import re
 import shlex
 import shutil
 import subprocess
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 
 if TYPE_CHECKING:
@@ -25,7 +26,15 @@ if TYPE_CHECKING:
 
 from kbisect.collectors import create_console_collector
 from kbisect.config.config import BisectConfig, HostConfig
-from kbisect.remote import SSHClient
+from kbisect.persistence import StateManager
+from kbisect.power.factory import create_power_controller
+from kbisect.remote import SSHClient, check_alive
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 logger = logging.getLogger(__name__)
@@ -35,6 +44,10 @@ DEFAULT_REBOOT_SETTLE_TIME = 10
 DEFAULT_POST_BOOT_SETTLE_TIME = 10
 COMMIT_HASH_LENGTH = 40
 SHORT_COMMIT_LENGTH = 7
+FIRST_BAD_COMMIT_RE = re.compile(r"^([0-9a-f]{40}) is (?:the )?first bad commit", re.MULTILINE)
+BOOT_POLL_MAX_INTERVAL = 10  # Cap for the Fibonacci backoff between boot probes
+BOOT_TCP_PROBE_TIMEOUT = 2
+BOOT_SSH_FALLBACK_INTERVAL = 15  # Seconds between full SSH checks while the TCP probe fails
 
 
 class BisectState(Enum):
@@ -131,8 +144,6 @@ class HostManager:
         self.ssh = SSHClient(host_config.hostname, host_config.ssh_user, ssh_connect_timeout)
 
         # Create power controller based on configured type
-        from kbisect.power.factory import create_power_controller
-
         self.power_controller: Optional["PowerController"] = create_power_controller(  # noqa: UP037
             host_config, ssh_connect_timeout
         )
@@ -214,10 +225,12 @@ class BisectMaster:
         self.iterations: List[BisectIteration] = []
         self.current_iteration: Optional[BisectIteration] = None
         self.iteration_count = 0
+        # commit SHA -> `git log -1 --oneline` output; commits do not change, so never invalidated
+        self._commit_msg_cache: Dict[str, str] = {}
+        # First bad commit SHA as reported by the final `git bisect good/bad`
+        self._first_bad_commit: Optional[str] = None
 
         # Initialize state manager and create/load session
-        from kbisect.persistence import StateManager
-
         self.state = StateManager(db_path=config.db_path)
 
         # Atomically get existing running session or create new one
@@ -394,12 +407,12 @@ class BisectMaster:
                 all_host_metadata[hostname] = {"error": stderr, "status": "failed"}
                 continue
 
-            # Parse JSON response
+            # Parse JSON response (orjson is faster on large metadata payloads)
             try:
-                metadata_dict = json.loads(stdout)
+                metadata_dict = orjson.loads(stdout) if orjson is not None else json.loads(stdout)
                 all_host_metadata[hostname] = metadata_dict
                 success_count += 1
-            except json.JSONDecodeError as exc:
+            except ValueError as exc:  # json.JSONDecodeError and orjson.JSONDecodeError subclass it
                 logger.warning(f"  Invalid JSON from {hostname} metadata collection: {exc}")
                 logger.debug(f"  Raw output: {stdout}")
                 all_host_metadata[hostname] = {"error": str(exc), "status": "parse_failed"}
@@ -457,13 +470,18 @@ class BisectMaster:
         success_count = 0
         all_configs = {}
 
-        for hm in hosts_to_capture:
-            hostname = hm.config.hostname
-            kernel_path = hm.config.kernel_path
-            config_path = f"{kernel_path}/.config"
+        # Download config file content from all hosts concurrently (to memory, not disk)
+        with ThreadPoolExecutor(max_workers=max(1, len(hosts_to_capture))) as executor:
+            outputs = list(
+                executor.map(
+                    lambda hm: hm.ssh.run_command(f"cat {hm.config.kernel_path}/.config", timeout=hm.ssh_connect_timeout),
+                    hosts_to_capture,
+                )
+            )
 
-            # Download config file content from host (to memory, not disk)
-            ret, stdout, stderr = hm.ssh.run_command(f"cat {config_path}", timeout=hm.ssh_connect_timeout)
+        for hm, (ret, stdout, stderr) in zip(hosts_to_capture, outputs):
+            hostname = hm.config.hostname
+            config_path = f"{hm.config.kernel_path}/.config"
 
             if ret != 0:
                 logger.warning(f"  [{hostname}] Failed to read kernel config: {stderr}")
@@ -666,7 +684,7 @@ class BisectMaster:
                 "--exclude=.git/index",
                 "--exclude=.git/index.lock",
                 "-e",
-                f"ssh -o StrictHostKeyChecking=no -o ConnectTimeout={host_manager.ssh_connect_timeout}",
+                host_manager.ssh.rsync_shell,
                 f"{local_repo_path}/",
                 f"{ssh_user}@{hostname}:{kernel_path}/",
             ]
@@ -750,8 +768,9 @@ class BisectMaster:
 
         # Check all hosts are reachable
         logger.info("Checking host connectivity...")
-        for hm in self.host_managers:
-            if not hm.ssh.is_alive():
+        reachable = check_alive([hm.ssh for hm in self.host_managers])
+        for hm, alive in zip(self.host_managers, reachable):
+            if not alive:
                 logger.error(f"Host {hm.config.hostname} is not reachable!")
                 return False
             logger.info(f"  ✓ {hm.config.hostname} is reachable")
@@ -901,27 +920,10 @@ class BisectMaster:
                         logger.error(f"Failed to create test script directory on {hm.config.hostname}: {stderr}")
                         return False
 
-                    # Transfer script using SCP via subprocess
+                    # Transfer script over the host's multiplexed SSH connection
                     try:
-                        scp_cmd = [
-                            "scp",
-                            "-o",
-                            "StrictHostKeyChecking=no",
-                            "-o",
-                            f"ConnectTimeout={hm.ssh_connect_timeout}",
-                            local_path,
-                            f"{hm.config.ssh_user}@{hm.config.hostname}:{remote_path}",
-                        ]
-                        result = subprocess.run(
-                            scp_cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=hm.ssh_connect_timeout,
-                            check=False,
-                        )
-
-                        if result.returncode != 0:
-                            logger.error(f"Failed to transfer test script to {hm.config.hostname}: {result.stderr}")
+                        if not hm.ssh.copy_file(local_path, remote_path):
+                            logger.error(f"Failed to transfer test script to {hm.config.hostname}")
                             return False
 
                         # Make script executable
@@ -932,9 +934,6 @@ class BisectMaster:
 
                         logger.info(f"  ✓ Transferred test script to {hm.config.hostname}: {remote_path}")
 
-                    except subprocess.TimeoutExpired:
-                        logger.error(f"Test script transfer to {hm.config.hostname} timed out")
-                        return False
                     except Exception as exc:
                         logger.error(f"Error transferring test script to {hm.config.hostname}: {exc}")
                         return False
@@ -955,34 +954,14 @@ class BisectMaster:
                         logger.error(f"Failed to create kernel config directory on {hm.config.hostname}: {stderr}")
                         return False
 
-                    # Transfer config using SCP via subprocess
+                    # Transfer config over the host's multiplexed SSH connection
                     try:
-                        scp_cmd = [
-                            "scp",
-                            "-o",
-                            "StrictHostKeyChecking=no",
-                            "-o",
-                            f"ConnectTimeout={hm.ssh_connect_timeout}",
-                            local_path,
-                            f"{hm.config.ssh_user}@{hm.config.hostname}:{remote_path}",
-                        ]
-                        result = subprocess.run(
-                            scp_cmd,
-                            capture_output=True,
-                            text=True,
-                            timeout=hm.ssh_connect_timeout,
-                            check=False,
-                        )
-
-                        if result.returncode != 0:
-                            logger.error(f"Failed to transfer kernel config to {hm.config.hostname}: {result.stderr}")
+                        if not hm.ssh.copy_file(local_path, remote_path):
+                            logger.error(f"Failed to transfer kernel config to {hm.config.hostname}")
                             return False
 
                         logger.info(f"  ✓ Transferred kernel config to {hm.config.hostname}: {remote_path}")
 
-                    except subprocess.TimeoutExpired:
-                        logger.error(f"Kernel config transfer to {hm.config.hostname} timed out")
-                        return False
                     except Exception as exc:
                         logger.error(f"Error transferring kernel config to {hm.config.hostname}: {exc}")
                         return False
@@ -1014,8 +993,13 @@ class BisectMaster:
         first_host = self.host_managers[0]
         kernel_path = first_host.config.kernel_path
 
-        ret, stdout, stderr = first_host.ssh.run_command(
-            f"cd {shlex.quote(kernel_path)} && git rev-parse HEAD",
+        # Fetch the commit message in the same SSH round-trip to warm _commit_msg_cache
+        quoted_path = shlex.quote(kernel_path)
+        (ret, stdout, stderr), (log_ret, log_stdout, _) = first_host.ssh.batch_run(
+            [
+                f"cd {quoted_path} && git rev-parse HEAD",
+                f"cd {quoted_path} && git log -1 --oneline HEAD",
+            ],
             timeout=first_host.ssh_connect_timeout,
         )
 
@@ -1037,6 +1021,9 @@ class BisectMaster:
             logger.error(f"Invalid commit hash format (not hexadecimal): {commit}")
             return None
 
+        if log_ret == 0:
+            self._commit_msg_cache[commit] = log_stdout.strip()
+
         return commit
 
     def mark_commit(self, commit_sha: str, result: TestResult) -> Tuple[bool, bool]:
@@ -1068,17 +1055,16 @@ class BisectMaster:
         # A killed git process (from build timeout or SSH disconnect) can leave
         # this lock file behind, causing all subsequent git operations to fail
         # with "Unable to create '.../.git/index.lock': File exists".
+        # Both commands go through a single SSH round-trip.
         lock_path = f"{shlex.quote(kernel_path)}/.git/index.lock"
-        ret_lock, _, _ = first_host.ssh.run_command(
-            f"rm -f {lock_path}",
+        logger.debug(f"Executing: cd {kernel_path} && {bisect_cmd}")
+        (ret_lock, _, _), (ret, stdout, stderr) = first_host.ssh.batch_run(
+            [f"rm -f {lock_path}", f"cd {shlex.quote(kernel_path)} && {bisect_cmd}"],
             timeout=first_host.ssh_connect_timeout,
         )
         if ret_lock != 0:
             logger.warning(f"Failed to remove {lock_path} (non-fatal)")
 
-        logger.debug(f"Executing: cd {kernel_path} && {bisect_cmd}")
-        ret, stdout, stderr = first_host.ssh.run_command(f"cd {shlex.quote(kernel_path)} && {bisect_cmd}", timeout=first_host.ssh_connect_timeout)
-
         if ret != 0:
             # Tier 1: Check for git index corruption (recoverable)
             if any(
@@ -1221,6 +1207,9 @@ class BisectMaster:
 
         if bisection_complete:
             logger.info("Git bisect reports: First bad commit found!")
+            match = FIRST_BAD_COMMIT_RE.search(stdout) or FIRST_BAD_COMMIT_RE.search(stderr)
+            if match:
+                self._first_bad_commit = match.group(1)
 
         return (True, bisection_complete)
 
@@ -1395,7 +1384,7 @@ class BisectMaster:
         buffer = []
         buffer_size = 0
         buffer_limit = 10 * 1024
-        start_time = time.time()
+        start_time = time.monotonic()
 
         def stream_callback(stdout_chunk: str, stderr_chunk: str) -> None:
             """Handle streaming output chunks."""
@@ -1445,7 +1434,7 @@ class BisectMaster:
         except Exception as exc:
             logger.warning(f"[{hostname}] Failed to finalize log: {exc}")
 
-        elapsed = int(time.time() - start_time)
+        elapsed = int(time.monotonic() - start_time)
 
         if ret != 0:
             logger.error(f"  [{hostname}] Build FAILED in {elapsed // 60}m {elapsed % 60}s")
@@ -1653,18 +1642,15 @@ class BisectMaster:
 
         # Wait for slave to come back online
         logger.debug(f"[{hostname}] Waiting for host to come back online (timeout: {host_manager.boot_timeout}s)...")
-        boot_start = time.time()
 
-        while not host_manager.ssh.is_alive():
-            if time.time() - boot_start > host_manager.boot_timeout:
-                logger.error(f"  [{hostname}] Boot timeout after {host_manager.boot_timeout}s")
+        if not self._wait_for_ssh(host_manager):
+            logger.error(f"  [{hostname}] Boot timeout after {host_manager.boot_timeout}s")
 
-                # Stop and store console log on timeout
-                # This may contain kernel panic or boot failure info
-                self._stop_and_store_console_log(host_manager, iteration_id)
+            # Stop and store console log on timeout
+            # This may contain kernel panic or boot failure info
+            self._stop_and_store_console_log(host_manager, iteration_id)
 
-                return False, None, f"Boot timeout after {host_manager.boot_timeout}s"
-            time.sleep(5)
+            return False, None, f"Boot timeout after {host_manager.boot_timeout}s"
 
         # Settle time after boot
         time.sleep(DEFAULT_POST_BOOT_SETTLE_TIME)
@@ -1698,6 +1684,42 @@ class BisectMaster:
 
             return True, None, None
 
+    def _wait_for_ssh(self, host_manager: HostManager) -> bool:
+        """Wait until a rebooting host accepts SSH, up to its boot timeout.
+
+        Polls the SSH port with a cheap TCP probe using Fibonacci backoff
+        (1, 1, 2, 3, 5, 8, ... capped at BOOT_POLL_MAX_INTERVAL seconds) and
+        attempts a full SSH check once the port is open. A failed probe is not
+        conclusive (ssh may reach the host through ~/.ssh/config aliases, ports
+        or jump hosts), so a full check also runs every
+        BOOT_SSH_FALLBACK_INTERVAL seconds regardless.
+
+        Args:
+            host_manager: HostManager for the host to wait for
+
+        Returns:
+            True if SSH became responsive, False on timeout
+        """
+        deadline = time.monotonic() + host_manager.boot_timeout
+        delay, next_delay = 1, 1
+        next_full_check = time.monotonic()
+
+        while True:
+            if (
+                host_manager.ssh.tcp_probe(BOOT_TCP_PROBE_TIMEOUT)
+                or time.monotonic() >= next_full_check
+            ):
+                if host_manager.ssh.is_alive():
+                    return True
+                next_full_check = time.monotonic() + BOOT_SSH_FALLBACK_INTERVAL
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            time.sleep(min(delay, remaining))
+            delay, next_delay = next_delay, min(delay + next_delay, BOOT_POLL_MAX_INTERVAL)
+
     def _recover_host(self, host_manager: HostManager) -> bool:
         """Power-cycle a failed host and wait for SSH to come back.
 
@@ -1720,7 +1742,7 @@ class BisectMaster:
 
         # Try power_cycle first
         try:
-            if not host_manager.power_controller.power_cycle():
+            if not host_manager.power_controller.power_cycle(ssh_client=host_manager.ssh):
                 logger.warning(f"  [{hostname}] Power cycle failed, attempting emergency recovery...")
                 # Escalate to emergency_recovery (IPMI has real impl, Beaker base returns False)
                 try:
@@ -1743,13 +1765,10 @@ class BisectMaster:
 
         # Wait for SSH to come back
         logger.info(f"  [{hostname}] Waiting for SSH to come back (timeout: {host_manager.boot_timeout}s)...")
-        boot_start = time.time()
 
-        while not host_manager.ssh.is_alive():
-            if time.time() - boot_start > host_manager.boot_timeout:
-                logger.error(f"  [{hostname}] Recovery timeout - host did not come back after {host_manager.boot_timeout}s")
-                return False
-            time.sleep(5)
+        if not self._wait_for_ssh(host_manager):
+            logger.error(f"  [{hostname}] Recovery timeout - host did not come back after {host_manager.boot_timeout}s")
+            return False
 
         logger.info(f"  [{hostname}] Host recovered successfully - SSH is responsive")
         return True
@@ -1781,7 +1800,7 @@ class BisectMaster:
         buffer = []
         buffer_size = 0
         buffer_limit = 10 * 1024
-        start_time = time.time()
+        start_time = time.monotonic()
 
         def stream_callback(stdout_chunk: str, stderr_chunk: str) -> None:
             """Handle streaming output chunks."""
@@ -1825,7 +1844,7 @@ class BisectMaster:
         except Exception as exc:
             logger.warning(f"[{hostname}] Failed to finalize log: {exc}")
 
-        elapsed = int(time.time() - start_time)
+        elapsed = int(time.monotonic() - start_time)
         test_output = stdout + stderr
 
         if ret == 0:
@@ -2140,9 +2159,6 @@ class BisectMaster:
                 }
             )
 
-        # Store all results in a single transaction
-        self.state.create_iteration_results_bulk(bulk_results)
-
         # Aggregate: ALL pass = GOOD, ANY fail = BAD, ANY skip = SKIP
         all_results = [r["result"] for r in test_results.values()]
 
@@ -2160,12 +2176,14 @@ class BisectMaster:
 
         iteration.result = final_result
 
-        # Update iteration in database
-        self.state.update_iteration(
-            iteration_id,
-            final_result=final_result.value,
-            end_time=datetime.now(timezone.utc).isoformat(),
-        )
+        # Store per-host results and the verdict in a single transaction
+        with self.state.transaction():
+            self.state.create_iteration_results_bulk(bulk_results)
+            self.state.update_iteration(
+                iteration_id,
+                final_result=final_result.value,
+                end_time=datetime.now(timezone.utc).isoformat(),
+            )
 
         # Mark in git bisect
         success, bisection_complete = self.mark_commit(commit_sha, final_result)
@@ -2195,6 +2213,8 @@ class BisectMaster:
             Tuple of (updated iteration, bisection_complete flag)
         """
         bisection_complete = False
+        # Monotonic clock for the duration; immune to wall-clock steps during the iteration
+        iteration_start = time.monotonic()
 
         try:
             # Phase 0: Validate commit
@@ -2240,16 +2260,14 @@ class BisectMaster:
 
         finally:
             iteration.end_time = datetime.now(timezone.utc).isoformat()
-            if iteration.start_time and iteration.end_time:
-                start = datetime.fromisoformat(iteration.start_time)
-                end = datetime.fromisoformat(iteration.end_time)
-                iteration.duration = int((end - start).total_seconds())
-
-                # Persist duration to database
-                self.state.update_iteration(iteration_id, end_time=iteration.end_time, duration=iteration.duration)
+            iteration.duration = int(time.monotonic() - iteration_start)
 
             self.iterations.append(iteration)
-            self.save_state()
+
+            # Persist duration and bisection state in one transaction
+            with self.state.transaction():
+                self.state.update_iteration(iteration_id, end_time=iteration.end_time, duration=iteration.duration)
+                self.save_state()
 
         return (iteration, bisection_complete)
 
@@ -2265,13 +2283,7 @@ class BisectMaster:
         self.iteration_count += 1
 
         # Get commit info (use first host's SSH connection)
-        first_host = self.host_managers[0]
-        kernel_path = first_host.config.kernel_path
-        ret, commit_msg, _ = first_host.ssh.run_command(
-            f"cd {kernel_path} && git log -1 --oneline {commit_sha}",
-            timeout=first_host.ssh_connect_timeout,
-        )
-        commit_msg = commit_msg.strip() if ret == 0 else "Unknown"
+        commit_msg = self._get_commit_oneline(commit_sha) or "Unknown"
 
         # Create iteration in database
         iteration_id = self.state.create_iteration(self.session_id, self.iteration_count, commit_sha, commit_msg)
@@ -2286,9 +2298,7 @@ class BisectMaster:
         )
 
         self.current_iteration = iteration
-        logger.info(f"\n=== Iteration {iteration.iteration}: {iteration.commit_short} ===")
-        logger.info(f"Commit: {iteration.commit_message}")
-        logger.info(f"Testing on {len(self.host_managers)} hosts")
+        logger.info(f"\n=== Iteration {iteration.iteration}: {iteration.commit_short} ===\nCommit: {iteration.commit_message}\nTesting on {len(self.host_managers)} hosts")
 
         # Execute multi-host iteration
         return self._run_multihost_iteration(iteration, iteration_id, commit_sha)
@@ -2296,19 +2306,47 @@ class BisectMaster:
     def _extract_first_bad_commit(self) -> Optional[str]:
         """Extract first bad commit SHA from git bisect.
 
-        Uses first host since all hosts share the same git bisect state.
+        Uses the SHA printed by the final mark_commit() when available, otherwise
+        reads git bisect log on the first host (all hosts share the same state).
 
         Returns:
             Commit SHA if found, None otherwise
         """
+        if self._first_bad_commit:
+            return self._first_bad_commit
+
         first_host = self.host_managers[0]
-        kernel_path = first_host.config.kernel_path
 
         ret, stdout, _ = first_host.ssh.run_command(
-            f"cd {shlex.quote(kernel_path)} && git bisect log | grep 'first bad commit' -A 1 | grep '^commit' | head -1 | awk '{{print $2}}'",
+            self._first_bad_commit_command(first_host.config.kernel_path),
             timeout=first_host.ssh_connect_timeout,
         )
 
+        return self._parse_first_bad_commit(ret, stdout)
+
+    @staticmethod
+    def _first_bad_commit_command(kernel_path: str) -> str:
+        """Build the shell command printing the first bad commit SHA from git bisect log.
+
+        Args:
+            kernel_path: Kernel repository path on the host
+
+        Returns:
+            Shell command string
+        """
+        return f"cd {shlex.quote(kernel_path)} && git bisect log | grep 'first bad commit' -A 1 | grep '^commit' | head -1 | awk '{{print $2}}'"
+
+    @staticmethod
+    def _parse_first_bad_commit(ret: int, stdout: str) -> Optional[str]:
+        """Parse output of the command built by _first_bad_commit_command().
+
+        Args:
+            ret: Command return code
+            stdout: Command output
+
+        Returns:
+            Commit SHA if found, None otherwise
+        """
         if ret == 0 and stdout.strip():
             commit_sha = stdout.strip()
             logger.debug(f"Extracted first bad commit: {commit_sha}")
@@ -2507,7 +2545,8 @@ class BisectMaster:
         Returns:
             Dictionary with enum values converted to strings
         """
-        data = asdict(iteration)
+        # All fields are flat, so a shallow copy avoids asdict()'s recursive deepcopy
+        data = {field.name: getattr(iteration, field.name) for field in fields(iteration)}
         # Convert enums to their string values for JSON serialization
         if isinstance(data.get("state"), BisectState):
             data["state"] = data["state"].value
@@ -2516,13 +2555,18 @@ class BisectMaster:
         return data
 
     def save_state(self) -> None:
-        """Save bisection state to database."""
+        """Save bisection state to database.
+
+        Completed iterations are already persisted row by row in the iterations
+        table, so only their count is stored here. This keeps each save O(1)
+        instead of re-serializing the whole history.
+        """
         state = {
             "good_commit": self.good_commit,
             "bad_commit": self.bad_commit,
             "iteration_count": self.iteration_count,
             "current_iteration": (self._iteration_to_dict(self.current_iteration) if self.current_iteration else None),
-            "iterations": [self._iteration_to_dict(it) for it in self.iterations],
+            "completed_iterations": len(self.iterations),
             "last_update": datetime.utcnow().isoformat(),
         }
 
@@ -2531,33 +2575,47 @@ class BisectMaster:
 
     def generate_report(self) -> None:
         """Generate bisection report."""
-        logger.info("\n" + "=" * 60)
-        logger.info("BISECTION REPORT")
-        logger.info("=" * 60)
-
-        logger.info(f"\nGood commit: {self.good_commit}")
-        logger.info(f"Bad commit:  {self.bad_commit}")
-        logger.info(f"Hosts tested: {len(self.host_managers)}")
-        for hm in self.host_managers:
-            logger.info(f"  - {hm.config.hostname}")
-        logger.info(f"Total iterations: {len(self.iterations)}")
-
-        logger.info("\nIteration Summary:")
-        logger.info("-" * 60)
+        # Build the summary as one message so it is emitted with a single logging call
+        parts = [
+            "\n" + "=" * 60,
+            "BISECTION REPORT",
+            "=" * 60,
+            f"\nGood commit: {self.good_commit}",
+            f"Bad commit:  {self.bad_commit}",
+            f"Hosts tested: {len(self.host_managers)}",
+        ]
+        parts.extend(f"  - {hm.config.hostname}" for hm in self.host_managers)
+        parts.append(f"Total iterations: {len(self.iterations)}")
+
+        parts.append("\nIteration Summary:")
+        parts.append("-" * 60)
 
         for iteration in self.iterations:
             status = iteration.result.value if iteration.result else "unknown"
             duration = f"{iteration.duration}s" if iteration.duration else "N/A"
-            logger.info(f"{iteration.iteration:3d}. {iteration.commit_short} | {status:7s} | {duration:6s} | {iteration.commit_message[:50]}")
+            parts.append(f"{iteration.iteration:3d}. {iteration.commit_short} | {status:7s} | {duration:6s} | {iteration.commit_message[:50]}")
+
+        logger.info("\n".join(parts))
 
         # Get final result from git bisect (use first host)
         first_host = self.host_managers[0]
         kernel_path = first_host.config.kernel_path
 
-        ret, stdout, _ = first_host.ssh.run_command(
-            f"cd {shlex.quote(kernel_path)} && git bisect log | grep 'first bad commit' -A 5",
-            timeout=first_host.ssh_connect_timeout,
-        )
+        excerpt_command = f"cd {shlex.quote(kernel_path)} && git bisect log | grep 'first bad commit' -A 5"
+        first_bad = self._first_bad_commit
+
+        if first_bad:
+            # mark_commit already parsed the SHA; only the report excerpt is needed
+            ret, stdout, _ = first_host.ssh.run_command(
+                excerpt_command, timeout=first_host.ssh_connect_timeout
+            )
+        else:
+            # Fetch the report excerpt and the first bad commit SHA in one SSH round-trip
+            (ret, stdout, _), (sha_ret, sha_stdout, _) = first_host.ssh.batch_run(
+                [excerpt_command, self._first_bad_commit_command(kernel_path)],
+                timeout=first_host.ssh_connect_timeout,
+            )
+            first_bad = self._parse_first_bad_commit(sha_ret, sha_stdout)
 
         if ret == 0 and stdout:
             logger.info("\n" + "=" * 60)
@@ -2565,8 +2623,7 @@ class BisectMaster:
             logger.info("=" * 60)
             logger.info(stdout)
 
-            # Extract and save the first bad commit SHA to database
-            first_bad = self._extract_first_bad_commit()
+            # Save the first bad commit SHA to database
             if first_bad:
                 # Get current session to check if result_commit is already set
                 session = self.state.get_session(self.session_id)
@@ -2918,6 +2975,31 @@ class BisectMaster:
         Returns:
             Commit message (first line)
         """
+        oneline = self._get_commit_oneline(commit_sha)
+
+        if oneline:
+            # Remove the commit SHA prefix from oneline output
+            parts = oneline.split(maxsplit=1)
+            if len(parts) > 1:
+                return parts[1]
+            return oneline
+        return "Unknown commit"
+
+    def _get_commit_oneline(self, commit_sha: str) -> Optional[str]:
+        """Get `git log -1 --oneline` output for a commit, memoized per SHA.
+
+        Uses first host since all hosts share the same repository.
+
+        Args:
+            commit_sha: Commit SHA
+
+        Returns:
+            Oneline log output, or None if git log failed
+        """
+        cached = self._commit_msg_cache.get(commit_sha)
+        if cached is not None:
+            return cached
+
         first_host = self.host_managers[0]
         kernel_path = first_host.config.kernel_path
 
@@ -2926,13 +3008,12 @@ class BisectMaster:
             timeout=first_host.ssh_connect_timeout,
         )
 
-        if ret == 0 and stdout.strip():
-            # Remove the commit SHA prefix from oneline output
-            parts = stdout.strip().split(maxsplit=1)
-            if len(parts) > 1:
-                return parts[1]
-            return stdout.strip()
-        return "Unknown commit"
+        if ret != 0 or not stdout.strip():
+            return None
+
+        oneline = stdout.strip()
+        self._commit_msg_cache[commit_sha] = oneline
+        return oneline
 
 
 def main() -> int:
@@ -7,8 +7,10 @@ Handles copying scripts, installing services, and initializing the slave machine
 import logging
 import shlex
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from kbisect.remote import SSHClient
 
@@ -19,6 +21,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_DEPLOY_PATH = "/root/kernel-bisect/lib"
 DEFAULT_STATE_DIR = "/var/lib/kernel-bisect"
 DEFAULT_SSH_TIMEOUT = 30
+PROTECTION_INIT_TIMEOUT = 60
+SSH_FAILURE_EXIT_CODE = 255  # Exit status ssh itself uses for connection errors
+DEPLOY_MAX_WORKERS = 16  # Default parallelism of SlaveDeployer.deploy_many()
+DEPLOY_CACHE_TTL = 30.0  # Seconds a positive is_deployed() result is reused
+LIBRARY_FILES = ("bisect-functions.sh",)  # Deployed from local_lib_path, relative paths
 
 
 class DeploymentError(Exception):
@@ -69,6 +76,10 @@ class SlaveDeployer:
         self.deploy_path = deploy_path
         self.connect_timeout = connect_timeout
         self.ssh_client = SSHClient(slave_host, slave_user, connect_timeout)
+        # Monotonic time of the last positive is_deployed() check
+        self._deployed_at: Optional[float] = None
+        # Result of the last connectivity probe; None until SSH has been exercised
+        self._connectivity_ok: Optional[bool] = None
 
         # Determine local library path
         if local_lib_path:
@@ -100,12 +111,38 @@ class SlaveDeployer:
             logger.error(msg)
             raise SSHError(msg) from exc
 
-    def _copy_to_slave(self, local_path: str, remote_path: str) -> bool:
-        """Copy files to slave using rsync.
+    def _run_checks(self, commands: List[str], timeout: int = DEFAULT_SSH_TIMEOUT) -> List[int]:
+        """Run independent check commands on slave in a single SSH invocation.
 
         Args:
-            local_path: Local file or directory path
-            remote_path: Remote destination path
+            commands: Shell commands to run
+            timeout: Timeout in seconds for all commands together
+
+        Returns:
+            Return code per command; -1 if the command could not be run
+        """
+        try:
+            results = self.ssh_client.batch_run(commands, timeout=timeout)
+        except Exception as exc:
+            logger.error(f"SSH command failed: {exc}")
+            self._connectivity_ok = None
+            return [-1] * len(commands)
+
+        # If the first command ran at all, the SSH path works
+        if results and results[0][0] not in (-1, SSH_FAILURE_EXIT_CODE):
+            self._connectivity_ok = True
+        return [ret for ret, _, _ in results]
+
+    def _rsync_tree(self, local_dir: str, remote_dir: str, files: Sequence[str]) -> bool:
+        """Copy files from a local directory to slave in a single rsync invocation.
+
+        The remote directory is created by rsync itself (via --rsync-path), so
+        no separate SSH command is needed regardless of the number of files.
+
+        Args:
+            local_dir: Local source directory
+            remote_dir: Remote destination directory
+            files: File paths relative to local_dir
 
         Returns:
             True if copy succeeded, False otherwise
@@ -114,25 +151,24 @@ class SlaveDeployer:
             TransferError: If file transfer fails to execute
         """
         try:
-            # Step 1: Create remote directory structure
-            remote_dir = Path(remote_path).parent
-            ret, _, stderr = self._ssh_command(f"mkdir -p {shlex.quote(str(remote_dir))}")
-            if ret != 0:
-                logger.error(f"Failed to create remote directory: {stderr}")
-                return False
-
-            # Step 2: Copy file with rsync
             rsync_cmd = [
                 "rsync",
                 "-az",  # Archive mode (preserves permissions, times, etc.) + compression
+                "--files-from=-",
+                f"--rsync-path=mkdir -p {shlex.quote(remote_dir)} && rsync",
                 "-e",
-                f"ssh -o StrictHostKeyChecking=no -o ConnectTimeout={self.connect_timeout}",
-                local_path,
-                f"{self.slave_user}@{self.slave_host}:{remote_path}",
+                self.ssh_client.rsync_shell,  # Reuse the multiplexed SSH connection
+                f"{local_dir}/",
+                f"{self.slave_user}@{self.slave_host}:{remote_dir}/",
             ]
 
             result = subprocess.run(
-                rsync_cmd, capture_output=True, text=True, timeout=60, check=False
+                rsync_cmd,
+                input="\n".join(files) + "\n",
+                capture_output=True,
+                text=True,
+                timeout=60,
+                check=False,
             )
             if result.returncode == 0:
                 return True
@@ -161,15 +197,28 @@ class SlaveDeployer:
             ret, stdout, stderr = self._ssh_command("echo test", timeout=self.connect_timeout)
         except SSHError:
             logger.error("✗ SSH connectivity failed")
+            self._connectivity_ok = False
             return False
 
-        if ret == 0 and "test" in stdout:
+        self._connectivity_ok = ret == 0 and "test" in stdout
+        if self._connectivity_ok:
             logger.info("✓ SSH connectivity OK")
             return True
 
         logger.error(f"✗ SSH connectivity failed: {stderr}")
         return False
 
+    def _assert_connected(self) -> bool:
+        """Check SSH connectivity unless an earlier step already proved it.
+
+        Returns:
+            True if the slave is reachable via SSH, False otherwise
+        """
+        if self._connectivity_ok:
+            logger.debug(f"SSH connectivity to {self.slave_host} already verified")
+            return True
+        return self.check_connectivity()
+
     def create_directories(self) -> bool:
         """Create required directories on slave.
 
@@ -184,16 +233,19 @@ class SlaveDeployer:
             "/var/log",
         ]
 
-        for directory in directories:
-            try:
-                ret, _, stderr = self._ssh_command(f"mkdir -p {directory}")
-            except SSHError:
-                logger.error(f"Failed to create {directory}")
-                return False
+        # mkdir -p takes several operands, so one SSH command creates them all;
+        # its stderr names any directory that could not be created
+        try:
+            ret, _, stderr = self._ssh_command(
+                "mkdir -p " + " ".join(shlex.quote(d) for d in directories)
+            )
+        except SSHError:
+            logger.error(f"Failed to create {', '.join(directories)}")
+            return False
 
-            if ret != 0:
-                logger.error(f"Failed to create {directory}: {stderr}")
-                return False
+        if ret != 0:
+            logger.error(f"Failed to create directories: {stderr}")
+            return False
 
         logger.info("✓ Directories created")
         return True
@@ -204,50 +256,65 @@ class SlaveDeployer:
         Returns:
             True if library deployed successfully, False otherwise
         """
-        logger.info(f"Deploying library from {self.local_lib_path} to slave...")
-
-        if not self.local_lib_path.exists():
-            logger.error(f"Local library path not found: {self.local_lib_path}")
+        if not self._transfer_library():
             return False
 
-        library_file = self.local_lib_path / "bisect-functions.sh"
-        if not library_file.exists():
-            logger.error(f"Library file not found: {library_file}")
-            return False
-
-        # Ensure remote directory exists
+        # Make library executable
         try:
-            ret, _, _ = self._ssh_command(f"mkdir -p {self.deploy_path}")
+            ret, _, stderr = self._ssh_command(self._chmod_library_command())
         except SSHError:
-            logger.error("Failed to create deploy directory on slave")
-            return False
+            logger.warning("Failed to chmod library")
+            return True  # Not fatal
 
         if ret != 0:
-            logger.error("Failed to create deploy directory on slave")
+            logger.warning(f"Failed to chmod library: {stderr}")
+
+        logger.info("✓ Library deployed")
+        return True
+
+    def _transfer_library(self) -> bool:
+        """Copy the library files to slave without any follow-up remote steps.
+
+        Returns:
+            True if the files were transferred, False otherwise
+        """
+        logger.info(f"Deploying library from {self.local_lib_path} to slave...")
+
+        if not self.local_lib_path.exists():
+            logger.error(f"Local library path not found: {self.local_lib_path}")
             return False
 
-        # Copy library file
+        for name in LIBRARY_FILES:
+            library_file = self.local_lib_path / name
+            if not library_file.exists():
+                logger.error(f"Library file not found: {library_file}")
+                return False
+
+        # Copy library files (rsync also creates the deploy directory)
         try:
-            if not self._copy_to_slave(
-                str(library_file), f"{self.deploy_path}/bisect-functions.sh"
-            ):
+            if not self._rsync_tree(str(self.local_lib_path), self.deploy_path, LIBRARY_FILES):
                 logger.error("Failed to copy library file")
                 return False
         except TransferError:
             return False
 
-        # Make library executable
-        try:
-            ret, _, stderr = self._ssh_command(f"chmod +x {self.deploy_path}/bisect-functions.sh")
-        except SSHError:
-            logger.warning("Failed to chmod library")
-            return True  # Not fatal
+        return True
 
-        if ret != 0:
-            logger.warning(f"Failed to chmod library: {stderr}")
+    def _chmod_library_command(self) -> str:
+        """Build the command that makes the deployed library executable.
 
-        logger.info("✓ Library deployed")
-        return True
+        Returns:
+            Shell command string
+        """
+        return f"chmod +x {self.deploy_path}/bisect-functions.sh"
+
+    def _init_protection_command(self) -> str:
+        """Build the command that initializes kernel protection on slave.
+
+        Returns:
+            Shell command string
+        """
+        return f"source {self.deploy_path}/bisect-functions.sh && init_protection"
 
     def initialize_protection(self) -> bool:
         """Initialize kernel protection on slave.
@@ -258,10 +325,10 @@ class SlaveDeployer:
         logger.info("Initializing kernel protection...")
 
         # Call init_protection function from library
-        init_command = f"source {self.deploy_path}/bisect-functions.sh && init_protection"
-
         try:
-            ret, stdout, stderr = self._ssh_command(init_command, timeout=60)
+            ret, stdout, stderr = self._ssh_command(
+                self._init_protection_command(), timeout=PROTECTION_INIT_TIMEOUT
+            )
         except SSHError:
             logger.error("Failed to initialize protection")
             return False
@@ -282,56 +349,68 @@ class SlaveDeployer:
         """
         logger.info("Verifying deployment...")
 
-        checks = []
-        all_passed = True
+        deployment_checks = self._deployment_checks()
 
-        # Check 1: Library directory exists
-        try:
-            ret, _, _ = self._ssh_command(f"test -d {self.deploy_path}")
-            if ret == 0:
-                checks.append("✓ Library directory exists")
-            else:
-                checks.append("✗ Library directory missing")
-                all_passed = False
-        except SSHError:
-            checks.append("✗ Library directory check failed")
-            all_passed = False
+        # All checks run in a single SSH round trip
+        results = self._run_checks([command for command, *_ in deployment_checks])
 
-        # Check 2: bisect-functions.sh exists and is executable
-        try:
-            ret, _, _ = self._ssh_command(f"test -x {self.deploy_path}/bisect-functions.sh")
-            if ret == 0:
-                checks.append("✓ bisect-functions.sh executable")
-            else:
-                checks.append("✗ bisect-functions.sh not found")
-                all_passed = False
-        except SSHError:
-            checks.append("✗ bisect-functions.sh check failed")
-            all_passed = False
+        return self._report_checks(deployment_checks, results)
 
-        # Check 3: Protection initialized
-        try:
-            ret, _, _ = self._ssh_command(f"test -f {DEFAULT_STATE_DIR}/protected-kernels.list")
-            if ret == 0:
-                checks.append("✓ Kernel protection initialized")
-            else:
-                checks.append("✗ Kernel protection not initialized")
-                all_passed = False
-        except SSHError:
-            checks.append("✗ Kernel protection check failed")
-            all_passed = False
+    def _deployment_checks(self) -> List[Tuple[str, str, str, str]]:
+        """Build the deployment verification checks.
 
-        # Check 4: State directory exists
-        try:
-            ret, _, _ = self._ssh_command(f"test -d {DEFAULT_STATE_DIR}")
+        Returns:
+            List of (command, passed message, failed message, probe error message)
+        """
+        return [
+            (
+                f"test -d {self.deploy_path}",
+                "✓ Library directory exists",
+                "✗ Library directory missing",
+                "✗ Library directory check failed",
+            ),
+            (
+                f"test -x {self.deploy_path}/bisect-functions.sh",
+                "✓ bisect-functions.sh executable",
+                "✗ bisect-functions.sh not found",
+                "✗ bisect-functions.sh check failed",
+            ),
+            (
+                f"test -f {DEFAULT_STATE_DIR}/protected-kernels.list",
+                "✓ Kernel protection initialized",
+                "✗ Kernel protection not initialized",
+                "✗ Kernel protection check failed",
+            ),
+            (
+                f"test -d {DEFAULT_STATE_DIR}",
+                "✓ State directory exists",
+                "✗ State directory missing",
+                "✗ State directory check failed",
+            ),
+        ]
+
+    @staticmethod
+    def _report_checks(
+        deployment_checks: List[Tuple[str, str, str, str]], results: List[int]
+    ) -> Tuple[bool, List[str]]:
+        """Turn check return codes into messages and log them.
+
+        Args:
+            deployment_checks: Checks as returned by _deployment_checks()
+            results: Return code per check (-1 if it could not be run)
+
+        Returns:
+            Tuple of (all_checks_passed, list_of_check_results)
+        """
+        checks = []
+        for (_, passed, failed, errored), ret in zip(deployment_checks, results):
             if ret == 0:
-                checks.append("✓ State directory exists")
+                checks.append(passed)
+            elif ret == 1:
+                checks.append(failed)
             else:
-                checks.append("✗ State directory missing")
-                all_passed = False
-        except SSHError:
-            checks.append("✗ State directory check failed")
-            all_passed = False
+                checks.append(errored)
+        all_passed = all(ret == 0 for ret in results)
 
         for check in checks:
             logger.info(f"  {check}")
@@ -349,29 +428,58 @@ class SlaveDeployer:
         logger.info("=" * 60)
         logger.info("Starting slave deployment")
         logger.info("=" * 60)
+        self.invalidate_deploy_cache()
 
-        # Step 1: Check connectivity
-        if not self.check_connectivity():
+        # Step 1: Check connectivity (skipped if e.g. is_deployed() just reached the slave)
+        if not self._assert_connected():
             logger.error("Deployment failed: No SSH connectivity")
             return False
 
-        # Step 2: Create directories
-        if not self.create_directories():
+        # Steps 2-3: Create directories and transfer library concurrently; rsync
+        # creates the deploy directory itself, so neither waits on the other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            directories_future = executor.submit(self.create_directories)
+            transfer_future = executor.submit(self._transfer_library)
+            directories_ok = directories_future.result()
+            transfer_ok = transfer_future.result()
+
+        if not directories_ok:
             logger.error("Deployment failed: Could not create directories")
             return False
 
-        # Step 3: Deploy library
-        if not self.deploy_library():
+        if not transfer_ok:
             logger.error("Deployment failed: Could not deploy library")
             return False
 
-        # Step 4: Initialize protection
-        if not self.initialize_protection():
+        # Steps 4-6: chmod library, initialize protection and verify, all in
+        # one SSH round trip; each step still reports its own exit status
+        deployment_checks = self._deployment_checks()
+        results = self.ssh_client.batch_run(
+            [
+                self._chmod_library_command(),
+                self._init_protection_command(),
+                *(command for command, *_ in deployment_checks),
+            ],
+            timeout=PROTECTION_INIT_TIMEOUT + DEFAULT_SSH_TIMEOUT,
+        )
+        (chmod_ret, _, chmod_stderr), (init_ret, init_stdout, init_stderr) = results[:2]
+
+        if chmod_ret != 0:
+            logger.warning(f"Failed to chmod library: {chmod_stderr}")
+        logger.info("✓ Library deployed")
+
+        logger.info("Initializing kernel protection...")
+        if init_ret != 0:
+            logger.error(f"Failed to initialize protection: {init_stderr}")
             logger.error("Deployment failed: Could not initialize protection")
             return False
+        logger.info("✓ Kernel protection initialized")
+        logger.debug(f"Protection output: {init_stdout}")
 
-        # Step 5: Verify deployment
-        success, _checks = self.verify_deployment()
+        logger.info("Verifying deployment...")
+        success, _checks = self._report_checks(
+            deployment_checks, [ret for ret, _, _ in results[2:]]
+        )
 
         if success:
             logger.info("=" * 60)
@@ -384,30 +492,77 @@ class SlaveDeployer:
         logger.error("=" * 60)
         return False
 
+    @classmethod
+    def deploy_many(
+        cls, hosts: Sequence[Dict[str, Any]], max_workers: int = DEPLOY_MAX_WORKERS
+    ) -> List[bool]:
+        """Run deploy_full() on several slaves in parallel.
+
+        Each worker uses its own deployer (and SSH master connection), so
+        deployment time is bounded by the slowest host rather than the sum.
+
+        Args:
+            hosts: Constructor keyword arguments (slave_host, slave_user,
+                deploy_path, ...) for each slave
+            max_workers: Maximum number of concurrent deployments
+
+        Returns:
+            Deployment success for each entry of hosts, in the same order
+        """
+        if not hosts:
+            return []
+
+        def deploy(host_kwargs: Dict[str, Any]) -> bool:
+            deployer = cls(**host_kwargs)
+            try:
+                return deployer.deploy_full()
+            except DeploymentError as exc:
+                logger.error(f"Deployment to {deployer.slave_host} failed: {exc}")
+                return False
+            finally:
+                deployer.close()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts))) as executor:
+            return list(executor.map(deploy, hosts))
+
     def is_deployed(self) -> bool:
         """Check if slave is already deployed.
 
+        A positive result is reused for DEPLOY_CACHE_TTL seconds; deploy_full()
+        and update_library() invalidate it.
+
         Returns:
             True if slave appears to be deployed, False otherwise
         """
-        # Quick check: do critical components exist?
+        if (
+            self._deployed_at is not None
+            and time.monotonic() - self._deployed_at < DEPLOY_CACHE_TTL
+        ):
+            return True
+
+        # Quick check: do critical components exist? (one SSH round trip)
         critical_checks = [
             f"test -d {self.deploy_path}",
             f"test -x {self.deploy_path}/bisect-functions.sh",
             f"test -f {DEFAULT_STATE_DIR}/protected-kernels.list",
         ]
 
-        for check in critical_checks:
-            try:
-                ret, _, _ = self._ssh_command(check)
-            except SSHError:
-                return False
-
-            if ret != 0:
-                return False
+        if not all(ret == 0 for ret in self._run_checks(critical_checks)):
+            return False
 
+        # Only positive results are cached
+        self._deployed_at = time.monotonic()
         return True
 
+    def invalidate_deploy_cache(self) -> None:
+        """Forget the cached is_deployed() result."""
+        self._deployed_at = None
+
+    def close(self) -> None:
+        """Close the multiplexed SSH connection to the slave."""
+        self.ssh_client.close()
+        self._connectivity_ok = None
+
     def update_library(self) -> bool:
         """Update only the library file (for updates after initial deployment).
 
@@ -415,6 +570,7 @@ class SlaveDeployer:
             True if library updated successfully, False otherwise
         """
         logger.info("Updating library file...")
+        self.invalidate_deploy_cache()
 
         if not self.deploy_library():
             logger.error("Library update failed")
@@ -11,6 +11,7 @@ from sqlalchemy import (
     BLOB,
     Boolean,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -69,6 +70,7 @@ class Iteration(Base):
     """
 
     __tablename__ = "iterations"
+    __table_args__ = (Index("ix_iteration_session_num", "session_id", "iteration_num"),)
 
     iteration_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[int] = mapped_column(
@@ -113,6 +115,7 @@ class Log(Base):
     """
 
     __tablename__ = "logs"
+    __table_args__ = (Index("ix_log_iter_ts", "iteration_id", "timestamp"),)
 
     log_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     iteration_id: Mapped[int] = mapped_column(
@@ -140,6 +143,11 @@ class BuildLog(Base):
     """
 
     __tablename__ = "build_logs"
+    __table_args__ = (
+        Index("ix_buildlog_iter_ts", "iteration_id", "timestamp"),
+        # SQLite walks this index backwards for list_build_logs' ORDER BY timestamp DESC
+        Index("ix_buildlog_log_type_ts", "log_type", "timestamp"),
+    )
 
     log_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     iteration_id: Mapped[int] = mapped_column(
@@ -171,9 +179,15 @@ class Metadata(Base):
 
     Stores system metadata as text content. The collection_type field specifies
     the nature of the metadata (e.g., kernel_config, rpmqa, etc.).
+
+    File records keep their content in file_content (optionally gzip-compressed)
+    and leave data empty; older databases store file content in data directly.
     """
 
     __tablename__ = "metadata"
+    __table_args__ = (
+        Index("ix_metadata_session_type_time", "session_id", "collection_type", "collection_time"),
+    )
 
     metadata_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[int] = mapped_column(
@@ -188,6 +202,9 @@ class Metadata(Base):
     collection_time: Mapped[str] = mapped_column(String, nullable=False)
     collection_type: Mapped[str] = mapped_column(String, nullable=False)
     data: Mapped[str] = mapped_column(Text, nullable=False)
+    file_content: Mapped[Optional[bytes]] = mapped_column(BLOB, nullable=True)
+    file_compressed: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    uncompressed_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Relationships
     session: Mapped["Session"] = relationship("Session", back_populates="metadata_records")
@@ -208,6 +225,7 @@ class Host(Base):
     """
 
     __tablename__ = "hosts"
+    __table_args__ = (Index("ix_host_session", "session_id"),)
 
     host_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[int] = mapped_column(
@@ -243,6 +261,7 @@ class IterationResult(Base):
     """
 
     __tablename__ = "iteration_results"
+    __table_args__ = (Index("ix_iterresult_iter_host", "iteration_id", "host_id"),)
 
     result_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     iteration_id: Mapped[int] = mapped_column(
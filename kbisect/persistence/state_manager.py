@@ -5,15 +5,35 @@ Tracks bisection progress, test results, and generates reports.
 Migrated from raw sqlite3 to SQLAlchemy 2.0 for better type safety and maintainability.
 """
 
+import contextlib
+import functools
 import gzip
+import io
 import json
 import logging
-from dataclasses import asdict, dataclass
+import threading
+import time
+import zlib
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import bindparam, create_engine, event, func, insert, select, update
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from kbisect.persistence.models import (
@@ -30,16 +50,324 @@ from kbisect.persistence.models import (
 )
 
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine import CursorResult
+    from sqlalchemy.orm import Session
+    from sqlalchemy.sql.dml import Update
+
+    from kbisect.persistence.models import Base as ModelBase
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None  # type: ignore[assignment]
+
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Constants
 DEFAULT_DB_PATH = "bisect.db"
+LOG_STREAM_CHUNK_SIZE = 64 * 1024  # Characters per chunk yielded by stream_build_log()
+LIST_YIELD_PER = 500  # Rows fetched per batch by listing queries
+TEXT_COMPRESS_CHUNK_SIZE = 128 * 1024  # Characters encoded and compressed per step
+GZIP_WBITS = 16 + zlib.MAX_WBITS  # zlib window bits selecting the gzip container
+READ_CACHE_TTL = (
+    1.0  # Seconds get_session()/get_latest_session()/get_baseline_metadata() reuse a read
+)
+LOG_BUFFER_SIZE = 64  # Buffered add_log() entries written per transaction
+SHORT_SHA_LENGTH = 7
+# Applied to every new SQLite connection: WAL keeps readers off the writer's
+# lock and, with synchronous=NORMAL, syncs the log only at checkpoints
+SQLITE_CONNECT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache
+)
+# Session statuses after which a session's summary can no longer change
+FINISHED_SESSION_STATUSES = frozenset({"completed", "failed"})
+
+# Primary-key lookups, built once and reused with bound parameters
+_SELECT_SESSION_BY_ID = select(SessionModel).where(
+    SessionModel.session_id == bindparam("session_id")
+)
+_SELECT_BUILD_LOG_BY_ID = select(BuildLog).where(BuildLog.log_id == bindparam("log_id"))
+_SELECT_METADATA_BY_ID = select(Metadata).where(Metadata.metadata_id == bindparam("metadata_id"))
+_SELECT_HOST_BY_ID = select(Host).where(Host.host_id == bindparam("host_id"))
+_SELECT_ITERATION_SESSION_ID = select(Iteration.session_id).where(
+    Iteration.iteration_id == bindparam("iteration_id")
+)
+
+# Columns the update_* methods accept; other keyword arguments are ignored
+_SESSION_UPDATE_FIELDS = frozenset({"end_time", "status", "result_commit", "session_state"})
+_ITERATION_UPDATE_FIELDS = frozenset(
+    {
+        "build_result",
+        "boot_result",
+        "test_result",
+        "final_result",
+        "end_time",
+        "duration",
+        "error_message",
+        "kernel_version",
+    }
+)
+_ITERATION_RESULT_UPDATE_FIELDS = frozenset(
+    {
+        "build_result",
+        "boot_result",
+        "test_result",
+        "final_result",
+        "error_message",
+        "test_output",
+    }
+)
+
+# Bound once: _utc_now_iso() runs on every write
+_UTC = timezone.utc
+_datetime_now = datetime.now
+
+# Text report formatting (bound once, shared by every export_report call)
+_REPORT_RULE = "=" * 70
+_REPORT_SUBRULE = "-" * 70
+_REPORT_ITERATION_FMT = "\n{:3d}. {:.7s} | {:7s} | {:4d}s".format
 
 
 class DatabaseError(Exception):
     """Base exception for database-related errors."""
 
 
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string.
+
+    Timestamps are stored as ISO-8601 TEXT so existing databases stay readable;
+    with a fixed UTC offset they sort chronologically, so indexes on these
+    columns serve ORDER BY and range predicates.
+
+    Returns:
+        Current UTC timestamp in ISO-8601 format
+    """
+    return _datetime_now(_UTC).isoformat()
+
+
+def _set_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+    """Configure a freshly opened SQLite connection (engine "connect" event).
+
+    Args:
+        dbapi_connection: Raw sqlite3 connection
+        _connection_record: Pool record (unused)
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_CONNECT_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _gzip_text(text: str) -> Tuple[bytes, int]:
+    """Gzip-compress text without materializing its full UTF-8 encoding.
+
+    The text is encoded and fed to the compressor in TEXT_COMPRESS_CHUNK_SIZE
+    slices, so only the compressed output grows with the input. The result is
+    readable with gzip.decompress().
+
+    Args:
+        text: Text to compress
+
+    Returns:
+        Tuple of (gzip data, size of the UTF-8 encoded text in bytes)
+    """
+    compressor = zlib.compressobj(9, zlib.DEFLATED, GZIP_WBITS)
+    parts = []
+    size = 0
+    for start in range(0, len(text), TEXT_COMPRESS_CHUNK_SIZE):
+        chunk = text[start : start + TEXT_COMPRESS_CHUNK_SIZE].encode("utf-8")
+        size += len(chunk)
+        parts.append(compressor.compress(chunk))
+    parts.append(compressor.flush())
+    return b"".join(parts), size
+
+
+def _dumps_metadata(metadata_dict: Dict[str, Any]) -> str:
+    """Serialize metadata to canonical (key-sorted) JSON.
+
+    Uses orjson when installed and falls back to json for payloads orjson
+    cannot represent (e.g. integers wider than 64 bits).
+
+    Args:
+        metadata_dict: Metadata dictionary
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                metadata_dict, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(metadata_dict, sort_keys=True)
+
+
+def _dumps_state(state_dict: Dict[str, Any]) -> str:
+    """Serialize session state to compact JSON.
+
+    Uses orjson when installed, falling back to json like _dumps_metadata.
+
+    Args:
+        state_dict: Session state dictionary
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(state_dict).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(state_dict, separators=(",", ":"))
+
+
+def _parse_metadata_data(data: str) -> Any:
+    """Parse stored metadata data as JSON, returning raw text if it is not JSON.
+
+    File records (e.g. kernel configs) share the data column with JSON
+    metadata, so only payloads that look like a JSON object or array are
+    handed to the parser.
+
+    Args:
+        data: Stored data column value
+
+    Returns:
+        Parsed JSON value, or the raw string
+    """
+    if not data or data.lstrip()[:1] not in ("{", "["):
+        return data
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    except ValueError:  # json.JSONDecodeError and orjson.JSONDecodeError subclass it
+        return data
+
+
+def _metadata_file_text(meta: Metadata) -> str:
+    """Return the text content of a metadata file record.
+
+    Args:
+        meta: Metadata row
+
+    Returns:
+        Decompressed file content, or the data column for legacy rows
+    """
+    if meta.file_content is None:
+        return meta.data
+    if meta.file_compressed:
+        return gzip.decompress(meta.file_content).decode("utf-8")
+    return meta.file_content.decode("utf-8")
+
+
+def _metadata_content(meta: Metadata) -> Any:
+    """Return the parsed content of a metadata record (JSON or raw text).
+
+    Args:
+        meta: Metadata row
+
+    Returns:
+        Parsed JSON value, or the raw text
+    """
+    return _parse_metadata_data(_metadata_file_text(meta))
+
+
+@functools.lru_cache(maxsize=None)
+def _update_by_pk(model: "Type[ModelBase]", pk_name: str, columns: FrozenSet[str]) -> "Update":
+    """Build (once per model and column set) an UPDATE of one row by primary key.
+
+    Execute with ``pk`` bound to the primary key and ``v_<column>`` to each new
+    value; see _update_params().
+
+    Args:
+        model: Mapped model class to update
+        pk_name: Name of the primary key column
+        columns: Columns to set
+
+    Returns:
+        Reusable UPDATE statement
+    """
+    return (
+        update(model)
+        .where(getattr(model, pk_name) == bindparam("pk"))
+        .values({column: bindparam(f"v_{column}") for column in columns})
+    )
+
+
+def _update_params(pk: int, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Bind parameters for a statement built by _update_by_pk().
+
+    Args:
+        pk: Primary key of the row to update
+        values: New column values
+
+    Returns:
+        Parameter dictionary
+    """
+    params = {f"v_{column}": value for column, value in values.items()}
+    params["pk"] = pk
+    return params
+
+
+def _insert_row(session: "Session", model: "Type[ModelBase]", **values: Any) -> int:
+    """Insert a single row with a Core INSERT and return its primary key.
+
+    Skips ORM instance construction and identity-map bookkeeping. The key
+    comes from the cursor's lastrowid, so no RETURNING support is needed
+    (SQLite < 3.35 on older distributions).
+
+    Args:
+        session: Active database session
+        model: Mapped model class to insert into
+        **values: Column values
+
+    Returns:
+        Primary key of the inserted row
+    """
+    result = cast("CursorResult[Any]", session.execute(insert(model).values(**values)))
+    return int(result.lastrowid)
+
+
+def _iter_log_content(
+    log_content: Optional[bytes], compressed: bool, chunk_size: int = LOG_STREAM_CHUNK_SIZE
+) -> Iterator[str]:
+    """Decode stored build log content incrementally.
+
+    Args:
+        log_content: Raw BLOB content as stored in the database
+        compressed: Whether the content is gzip-compressed
+        chunk_size: Maximum number of characters per yielded chunk
+
+    Yields:
+        Decoded log content chunks
+    """
+    if not log_content:
+        return
+
+    raw: Union[io.BytesIO, gzip.GzipFile] = io.BytesIO(log_content)
+    if compressed:
+        raw = gzip.GzipFile(fileobj=raw, mode="rb")
+
+    with io.TextIOWrapper(raw, encoding="utf-8") as reader:
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
 @dataclass
 class BisectSession:
     """Bisection session data.
@@ -100,6 +428,14 @@ class TestIteration:
     kernel_version: Optional[str] = None
 
 
+# Iteration columns in TestIteration field order, for summary rows
+_SELECT_SUMMARY_ITERATIONS = (
+    select(*(getattr(Iteration, field.name) for field in fields(TestIteration)))
+    .where(Iteration.session_id == bindparam("session_id"))
+    .order_by(Iteration.iteration_num)
+)
+
+
 class StateManager:
     """Manage bisection state using SQLAlchemy ORM.
 
@@ -132,10 +468,26 @@ class StateManager:
             connect_args={"check_same_thread": False},
             echo=False,  # Set to True for SQL debugging
         )
+        event.listen(self.engine, "connect", _set_sqlite_pragmas)
+
+        # Session factory; committed objects stay loaded (no refetch after commit)
+        self._sessionmaker = sessionmaker(bind=self.engine, expire_on_commit=False)
+        # Scoped session factory (thread-safe), kept for external callers
+        self.Session = scoped_session(self._sessionmaker)
 
-        # Create scoped session factory (thread-safe)
-        session_factory = sessionmaker(bind=self.engine)
-        self.Session = scoped_session(session_factory)
+        # Summaries of finished sessions, keyed by session ID and stored with
+        # the (status, end_time) they were generated for
+        self._summary_cache: Dict[int, Tuple[Tuple[str, Optional[str]], Dict[str, Any]]] = {}
+
+        # Recent results of hot read queries: key -> (monotonic read time, value)
+        self._read_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+        # Per-thread session of an open transaction() block
+        self._transaction_state = threading.local()
+
+        # Log rows queued by add_log() until the next flush_logs()
+        self._log_buffer: List[Dict[str, Any]] = []
+        self._log_buffer_lock = threading.Lock()
 
         # Initialize database schema
         self._init_database()
@@ -149,6 +501,9 @@ class StateManager:
             # Run migrations for existing databases
             self._run_migrations()
 
+            # create_all() skips indexes of tables that already exist
+            self._create_missing_indexes()
+
             logger.debug(f"Database initialized at {self.db_path}")
         except Exception as exc:
             msg = f"Failed to initialize database: {exc}"
@@ -197,6 +552,17 @@ class StateManager:
                 )
                 conn.commit()
 
+            # Migration: Add dedicated file content columns to metadata table
+            for column, column_type in (
+                ("file_content", "BLOB"),
+                ("file_compressed", "BOOLEAN"),
+                ("uncompressed_size", "INTEGER"),
+            ):
+                if column not in metadata_columns:
+                    logger.info(f"Adding {column} column to metadata table")
+                    cursor.execute(f"ALTER TABLE metadata ADD COLUMN {column} {column_type}")
+                    conn.commit()
+
         except Exception as exc:
             conn.rollback()
             logger.error(f"Migration failed: {exc}")
@@ -204,6 +570,71 @@ class StateManager:
         finally:
             conn.close()
 
+    def _create_missing_indexes(self) -> None:
+        """Create model indexes that are missing from an existing database."""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group the writes made in this block (on this thread) into one transaction.
+
+        Commits once on normal exit and rolls everything back if the block
+        raises. Nested blocks join the outermost transaction.
+
+        Example:
+            with state.transaction():
+                state.create_iteration_results_bulk(results)
+                state.update_iteration(iteration_id, final_result="good")
+        """
+        if getattr(self._transaction_state, "session", None) is not None:
+            yield
+            return
+
+        with self._sessionmaker.begin() as session:
+            self._transaction_state.session = session
+            try:
+                yield
+            finally:
+                self._transaction_state.session = None
+                # Reads made during the block did not see its uncommitted writes
+                self._read_cache.clear()
+
+    @contextlib.contextmanager
+    def _write_session(self) -> Iterator["Session"]:
+        """Session for a write: the open transaction() if any, else a new one.
+
+        Yields:
+            Database session; committed on exit unless a transaction() owns it
+        """
+        session = getattr(self._transaction_state, "session", None)
+        if session is not None:
+            yield session
+            return
+
+        with self._sessionmaker.begin() as session:
+            yield session
+
+    def _cached_read(self, key: Tuple[Any, ...], loader: Callable[[], T]) -> T:
+        """Return a read result younger than READ_CACHE_TTL, or load and remember it.
+
+        Args:
+            key: Cache key identifying the query and its arguments
+            loader: Function running the query
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        now = time.monotonic()
+        entry = self._read_cache.get(key)
+        if entry is not None and now - entry[0] < READ_CACHE_TTL:
+            return cast("T", entry[1])
+
+        value = loader()
+        self._read_cache[key] = (now, value)
+        return value
+
     def create_session(
         self, good_commit: str, bad_commit: str, config: Optional[Dict[str, Any]] = None
     ) -> int:
@@ -220,44 +651,56 @@ class StateManager:
         Raises:
             DatabaseError: If session creation fails
         """
-        session = self.Session()
         try:
-            new_session = SessionModel(
-                good_commit=good_commit,
-                bad_commit=bad_commit,
-                start_time=datetime.now(timezone.utc).isoformat(),
-                status="running",
-                config=json.dumps(config) if config else None,
-            )
+            with self._write_session() as session:
+                new_session = SessionModel(
+                    good_commit=good_commit,
+                    bad_commit=bad_commit,
+                    start_time=_utc_now_iso(),
+                    status="running",
+                    config=json.dumps(config) if config else None,
+                )
 
-            session.add(new_session)
-            session.commit()
-            session_id = new_session.session_id
+                session.add(new_session)
+                session.flush()
+                session_id = new_session.session_id
 
+            self._read_cache.clear()
             logger.info(f"Created bisection session {session_id}")
             return session_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to create session: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_session(self, session_id: int) -> Optional[BisectSession]:
         """Get session by ID.
 
+        Repeated calls within READ_CACHE_TTL share one query and one result
+        object, which callers must not modify.
+
         Args:
             session_id: Session ID to retrieve
 
         Returns:
             BisectSession object or None if not found
         """
-        session = self.Session()
-        try:
-            stmt = select(SessionModel).where(SessionModel.session_id == session_id)
-            result = session.execute(stmt).scalar_one_or_none()
+        return self._cached_read(("session", session_id), lambda: self._load_session(session_id))
+
+    def _load_session(self, session_id: int) -> Optional[BisectSession]:
+        """Query a session by ID (uncached get_session()).
+
+        Args:
+            session_id: Session ID to retrieve
+
+        Returns:
+            BisectSession object or None if not found
+        """
+        with self._sessionmaker() as session:
+            result = session.execute(
+                _SELECT_SESSION_BY_ID, {"session_id": session_id}
+            ).scalar_one_or_none()
 
             if not result:
                 return None
@@ -271,17 +714,24 @@ class StateManager:
                 status=result.status,
                 result_commit=result.result_commit,
             )
-        finally:
-            session.close()
 
     def get_latest_session(self) -> Optional[BisectSession]:
         """Get most recent session.
 
+        Cached like get_session().
+
         Returns:
             BisectSession object or None if no sessions exist
         """
-        session = self.Session()
-        try:
+        return self._cached_read(("latest_session",), self._load_latest_session)
+
+    def _load_latest_session(self) -> Optional[BisectSession]:
+        """Query the most recent session (uncached get_latest_session()).
+
+        Returns:
+            BisectSession object or None if no sessions exist
+        """
+        with self._sessionmaker() as session:
             stmt = select(SessionModel).order_by(SessionModel.session_id.desc()).limit(1)
             result = session.execute(stmt).scalar_one_or_none()
 
@@ -297,8 +747,6 @@ class StateManager:
                 status=result.status,
                 result_commit=result.result_commit,
             )
-        finally:
-            session.close()
 
     def get_or_create_session(
         self, good_commit: str, bad_commit: str, config: Optional[Dict[str, Any]] = None
@@ -319,45 +767,43 @@ class StateManager:
         Raises:
             DatabaseError: If session operation fails
         """
-        session = self.Session()
         try:
-            # Check for existing running session
-            stmt = (
-                select(SessionModel)
-                .where(SessionModel.status == "running")
-                .order_by(SessionModel.session_id.desc())
-                .limit(1)
-            )
-            existing = session.execute(stmt).scalar_one_or_none()
-
-            if existing:
-                session_id = existing.session_id
-                logger.info(f"Found existing running session {session_id}")
-                return session_id
-
-            # No running session found, create new one
-            new_session = SessionModel(
-                good_commit=good_commit,
-                bad_commit=bad_commit,
-                start_time=datetime.now(timezone.utc).isoformat(),
-                status="running",
-                config=json.dumps(config) if config else None,
-            )
+            with self._write_session() as session:
+                # Check for existing running session
+                stmt = (
+                    select(SessionModel)
+                    .where(SessionModel.status == "running")
+                    .order_by(SessionModel.session_id.desc())
+                    .limit(1)
+                )
+                existing = session.execute(stmt).scalar_one_or_none()
+
+                if existing:
+                    session_id = existing.session_id
+                    logger.info(f"Found existing running session {session_id}")
+                    return session_id
+
+                # No running session found, create new one
+                new_session = SessionModel(
+                    good_commit=good_commit,
+                    bad_commit=bad_commit,
+                    start_time=_utc_now_iso(),
+                    status="running",
+                    config=json.dumps(config) if config else None,
+                )
 
-            session.add(new_session)
-            session.commit()
-            session_id = new_session.session_id
+                session.add(new_session)
+                session.flush()
+                session_id = new_session.session_id
 
+            self._read_cache.clear()
             logger.info(f"Created new bisection session {session_id}")
             return session_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to get or create session: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def update_session(self, session_id: int, **kwargs: Any) -> None:
         """Update session fields.
@@ -369,30 +815,29 @@ class StateManager:
         Raises:
             DatabaseError: If update fails
         """
-        session = self.Session()
+        updates = {
+            field: value for field, value in kwargs.items() if field in _SESSION_UPDATE_FIELDS
+        }
+        if not updates:
+            return
+
         try:
-            stmt = select(SessionModel).where(SessionModel.session_id == session_id)
-            db_session = session.execute(stmt).scalar_one_or_none()
+            with self._write_session() as session:
+                result = session.execute(
+                    _update_by_pk(SessionModel, "session_id", frozenset(updates)),
+                    _update_params(session_id, updates),
+                )
 
-            if not db_session:
+            if not cast("CursorResult[Any]", result).rowcount:
                 logger.warning(f"Session {session_id} not found for update")
                 return
 
-            # Update allowed fields
-            valid_fields = {"end_time", "status", "result_commit", "session_state"}
-            for field, value in kwargs.items():
-                if field in valid_fields:
-                    setattr(db_session, field, value)
-
-            session.commit()
-
+            self._summary_cache.pop(session_id, None)
+            self._read_cache.clear()
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to update session: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def update_session_state(self, session_id: int, state_dict: Dict[str, Any]) -> None:
         """Update session state JSON.
@@ -404,28 +849,24 @@ class StateManager:
         Raises:
             DatabaseError: If update fails
         """
-        session = self.Session()
         try:
-            stmt = select(SessionModel).where(SessionModel.session_id == session_id)
-            db_session = session.execute(stmt).scalar_one_or_none()
-
-            if not db_session:
-                logger.warning(f"Session {session_id} not found for state update")
-                return
+            with self._write_session() as session:
+                db_session = session.execute(
+                    _SELECT_SESSION_BY_ID, {"session_id": session_id}
+                ).scalar_one_or_none()
 
-            # Convert state to JSON
-            db_session.session_state = json.dumps(state_dict)
-            session.commit()
+                if not db_session:
+                    logger.warning(f"Session {session_id} not found for state update")
+                    return
 
-            logger.debug(f"Updated session state for session {session_id}")
+                # Convert state to JSON
+                db_session.session_state = _dumps_state(state_dict)
 
+                logger.debug(f"Updated session state for session {session_id}")
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to update session state: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_session_state(self, session_id: int) -> Optional[Dict[str, Any]]:
         """Get session state JSON.
@@ -436,21 +877,21 @@ class StateManager:
         Returns:
             State dictionary or None if not found
         """
-        session = self.Session()
         try:
-            stmt = select(SessionModel).where(SessionModel.session_id == session_id)
-            db_session = session.execute(stmt).scalar_one_or_none()
+            with self._sessionmaker() as session:
+                db_session = session.execute(
+                    _SELECT_SESSION_BY_ID, {"session_id": session_id}
+                ).scalar_one_or_none()
 
-            if not db_session or not db_session.session_state:
-                return None
-
-            return json.loads(db_session.session_state)
+                if not db_session or not db_session.session_state:
+                    return None
 
+                if orjson is not None:
+                    return orjson.loads(db_session.session_state)
+                return json.loads(db_session.session_state)
         except Exception as exc:
             logger.error(f"Failed to get session state: {exc}")
             return None
-        finally:
-            session.close()
 
     def create_iteration(
         self, session_id: int, iteration_num: int, commit_sha: str, commit_message: str
@@ -469,30 +910,28 @@ class StateManager:
         Raises:
             DatabaseError: If iteration creation fails
         """
-        session = self.Session()
         try:
-            new_iteration = Iteration(
-                session_id=session_id,
-                iteration_num=iteration_num,
-                commit_sha=commit_sha,
-                commit_message=commit_message,
-                start_time=datetime.now(timezone.utc).isoformat(),
-            )
+            with self._write_session() as session:
+                new_iteration = Iteration(
+                    session_id=session_id,
+                    iteration_num=iteration_num,
+                    commit_sha=commit_sha,
+                    commit_message=commit_message,
+                    start_time=_utc_now_iso(),
+                )
 
-            session.add(new_iteration)
-            session.commit()
-            iteration_id = new_iteration.iteration_id
+                session.add(new_iteration)
+                session.flush()
+                iteration_id = new_iteration.iteration_id
 
+            self._summary_cache.pop(session_id, None)
             logger.debug(f"Created iteration {iteration_id}")
             return iteration_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to create iteration: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def update_iteration(self, iteration_id: int, **kwargs: Any) -> None:
         """Update iteration fields.
@@ -504,39 +943,35 @@ class StateManager:
         Raises:
             DatabaseError: If update fails
         """
-        session = self.Session()
+        if "end_time" in kwargs:
+            # Iteration finished: persist its buffered logs with it
+            self.flush_logs()
+
+        updates = {
+            field: value for field, value in kwargs.items() if field in _ITERATION_UPDATE_FIELDS
+        }
+        if not updates:
+            return
+
         try:
-            stmt = select(Iteration).where(Iteration.iteration_id == iteration_id)
-            db_iteration = session.execute(stmt).scalar_one_or_none()
+            with self._write_session() as session:
+                session.execute(
+                    _update_by_pk(Iteration, "iteration_id", frozenset(updates)),
+                    _update_params(iteration_id, updates),
+                )
+                session_id = session.execute(
+                    _SELECT_ITERATION_SESSION_ID, {"iteration_id": iteration_id}
+                ).scalar_one_or_none()
 
-            if not db_iteration:
+            if session_id is None:
                 logger.warning(f"Iteration {iteration_id} not found for update")
                 return
 
-            # Update allowed fields
-            valid_fields = {
-                "build_result",
-                "boot_result",
-                "test_result",
-                "final_result",
-                "end_time",
-                "duration",
-                "error_message",
-                "kernel_version",
-            }
-            for field, value in kwargs.items():
-                if field in valid_fields:
-                    setattr(db_iteration, field, value)
-
-            session.commit()
-
+            self._summary_cache.pop(session_id, None)
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to update iteration: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_iterations(self, session_id: int) -> List[TestIteration]:
         """Get all iterations for a session.
@@ -547,8 +982,7 @@ class StateManager:
         Returns:
             List of TestIteration objects
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
             stmt = (
                 select(Iteration)
                 .where(Iteration.session_id == session_id)
@@ -578,8 +1012,6 @@ class StateManager:
                 )
 
             return iterations
-        finally:
-            session.close()
 
     def create_host(
         self,
@@ -614,35 +1046,32 @@ class StateManager:
         Raises:
             DatabaseError: If host creation fails
         """
-        session = self.Session()
         try:
-            new_host = Host(
-                session_id=session_id,
-                hostname=hostname,
-                ssh_user=ssh_user,
-                kernel_path=kernel_path,
-                bisect_path=bisect_path,
-                test_script=test_script,
-                power_control_type=power_control_type,
-                ipmi_host=ipmi_host,
-                ipmi_user=ipmi_user,
-                ipmi_password=ipmi_password,
-            )
+            with self._write_session() as session:
+                new_host = Host(
+                    session_id=session_id,
+                    hostname=hostname,
+                    ssh_user=ssh_user,
+                    kernel_path=kernel_path,
+                    bisect_path=bisect_path,
+                    test_script=test_script,
+                    power_control_type=power_control_type,
+                    ipmi_host=ipmi_host,
+                    ipmi_user=ipmi_user,
+                    ipmi_password=ipmi_password,
+                )
 
-            session.add(new_host)
-            session.commit()
-            host_id = new_host.host_id
+                session.add(new_host)
+                session.flush()
+                host_id = new_host.host_id
 
             logger.info(f"Created host {host_id}: {hostname}")
             return host_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to create host: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_hosts(self, session_id: int) -> List[Dict[str, Any]]:
         """Get all hosts for a session.
@@ -653,8 +1082,7 @@ class StateManager:
         Returns:
             List of host dictionaries
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
             stmt = select(Host).where(Host.session_id == session_id).order_by(Host.host_id)
             results = session.execute(stmt).scalars().all()
 
@@ -673,8 +1101,6 @@ class StateManager:
                 }
                 for host in results
             ]
-        finally:
-            session.close()
 
     def get_host(self, host_id: int) -> Optional[Dict[str, Any]]:
         """Get host by ID.
@@ -685,10 +1111,8 @@ class StateManager:
         Returns:
             Host dictionary or None if not found
         """
-        session = self.Session()
-        try:
-            stmt = select(Host).where(Host.host_id == host_id)
-            host = session.execute(stmt).scalar_one_or_none()
+        with self._sessionmaker() as session:
+            host = session.execute(_SELECT_HOST_BY_ID, {"host_id": host_id}).scalar_one_or_none()
 
             if not host:
                 return None
@@ -705,8 +1129,6 @@ class StateManager:
                 "ipmi_user": host.ipmi_user,
                 "ipmi_password": host.ipmi_password,
             }
-        finally:
-            session.close()
 
     def create_iteration_result(
         self,
@@ -737,34 +1159,31 @@ class StateManager:
         Raises:
             DatabaseError: If result creation fails
         """
-        session = self.Session()
         try:
-            new_result = IterationResult(
-                iteration_id=iteration_id,
-                host_id=host_id,
-                build_result=build_result,
-                boot_result=boot_result,
-                test_result=test_result,
-                final_result=final_result,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                error_message=error_message,
-                test_output=test_output,
-            )
+            with self._write_session() as session:
+                new_result = IterationResult(
+                    iteration_id=iteration_id,
+                    host_id=host_id,
+                    build_result=build_result,
+                    boot_result=boot_result,
+                    test_result=test_result,
+                    final_result=final_result,
+                    timestamp=_utc_now_iso(),
+                    error_message=error_message,
+                    test_output=test_output,
+                )
 
-            session.add(new_result)
-            session.commit()
-            result_id = new_result.result_id
+                session.add(new_result)
+                session.flush()
+                result_id = new_result.result_id
 
             logger.debug(f"Created iteration result {result_id} for host {host_id}")
             return result_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to create iteration result: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def create_iteration_results_bulk(self, results: List[Dict[str, Any]]) -> List[int]:
         """Create multiple per-host iteration results in a single transaction.
@@ -786,43 +1205,36 @@ class StateManager:
         Raises:
             DatabaseError: If bulk creation fails
         """
-        session = self.Session()
         try:
-            result_ids = []
-            current_timestamp = datetime.now(timezone.utc).isoformat()
-
-            for result_data in results:
-                new_result = IterationResult(
-                    iteration_id=result_data["iteration_id"],
-                    host_id=result_data["host_id"],
-                    build_result=result_data.get("build_result"),
-                    boot_result=result_data.get("boot_result"),
-                    test_result=result_data.get("test_result"),
-                    final_result=result_data.get("final_result"),
-                    timestamp=current_timestamp,
-                    error_message=result_data.get("error_message"),
-                    test_output=result_data.get("test_output"),
-                )
-                session.add(new_result)
-
-            # Commit all results at once
-            session.commit()
+            with self._write_session() as session:
+                current_timestamp = _utc_now_iso()
+                new_results = []
+
+                for result_data in results:
+                    new_result = IterationResult(
+                        iteration_id=result_data["iteration_id"],
+                        host_id=result_data["host_id"],
+                        build_result=result_data.get("build_result"),
+                        boot_result=result_data.get("boot_result"),
+                        test_result=result_data.get("test_result"),
+                        final_result=result_data.get("final_result"),
+                        timestamp=current_timestamp,
+                        error_message=result_data.get("error_message"),
+                        test_output=result_data.get("test_output"),
+                    )
+                    session.add(new_result)
+                    new_results.append(new_result)
 
-            # Get result IDs after commit
-            for obj in session.new:
-                if isinstance(obj, IterationResult):
-                    result_ids.append(obj.result_id)
+                # Flush all results at once to assign IDs (committed on exit)
+                session.flush()
+                result_ids = [new_result.result_id for new_result in new_results]
 
             logger.debug(f"Created {len(result_ids)} iteration results in bulk")
             return result_ids
-
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to create iteration results in bulk: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def update_iteration_result(self, result_id: int, **kwargs: Any) -> None:
         """Update iteration result fields.
@@ -834,40 +1246,26 @@ class StateManager:
         Raises:
             DatabaseError: If update fails
         """
-        session = self.Session()
+        updates = {
+            field: value
+            for field, value in kwargs.items()
+            if field in _ITERATION_RESULT_UPDATE_FIELDS
+        }
+        updates["timestamp"] = _utc_now_iso()
+
         try:
-            stmt = select(IterationResult).where(IterationResult.result_id == result_id)
-            db_result = session.execute(stmt).scalar_one_or_none()
+            with self._write_session() as session:
+                result = session.execute(
+                    _update_by_pk(IterationResult, "result_id", frozenset(updates)),
+                    _update_params(result_id, updates),
+                )
 
-            if not db_result:
+            if not cast("CursorResult[Any]", result).rowcount:
                 logger.warning(f"IterationResult {result_id} not found for update")
-                return
-
-            # Update allowed fields
-            valid_fields = {
-                "build_result",
-                "boot_result",
-                "test_result",
-                "final_result",
-                "error_message",
-                "test_output",
-            }
-            for field, value in kwargs.items():
-                if field in valid_fields:
-                    setattr(db_result, field, value)
-
-            # Update timestamp
-            db_result.timestamp = datetime.now(timezone.utc).isoformat()
-
-            session.commit()
-
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to update iteration result: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_iteration_results(self, iteration_id: int) -> List[Dict[str, Any]]:
         """Get all per-host results for an iteration.
@@ -878,8 +1276,7 @@ class StateManager:
         Returns:
             List of result dictionaries with host information
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
             stmt = (
                 select(IterationResult, Host)
                 .join(Host, IterationResult.host_id == Host.host_id)
@@ -904,14 +1301,16 @@ class StateManager:
                 }
                 for result, host in results
             ]
-        finally:
-            session.close()
 
     def add_log(
         self, iteration_id: int, log_type: str, message: str, host_id: Optional[int] = None
     ) -> None:
         """Add log entry for an iteration.
 
+        Entries are buffered and written LOG_BUFFER_SIZE at a time in a single
+        transaction; get_logs(), iteration completion and close() flush the
+        buffer first.
+
         Args:
             iteration_id: Iteration ID
             log_type: Type of log entry
@@ -921,26 +1320,39 @@ class StateManager:
         Raises:
             DatabaseError: If log creation fails
         """
-        session = self.Session()
-        try:
-            new_log = Log(
-                iteration_id=iteration_id,
-                host_id=host_id,
-                log_type=log_type,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                message=message,
+        with self._log_buffer_lock:
+            self._log_buffer.append(
+                {
+                    "iteration_id": iteration_id,
+                    "host_id": host_id,
+                    "log_type": log_type,
+                    "timestamp": _utc_now_iso(),
+                    "message": message,
+                }
             )
+            if len(self._log_buffer) < LOG_BUFFER_SIZE:
+                return
+
+        self.flush_logs()
+
+    def flush_logs(self) -> None:
+        """Write all buffered log entries in one transaction.
 
-            session.add(new_log)
-            session.commit()
+        Raises:
+            DatabaseError: If writing the logs fails
+        """
+        with self._log_buffer_lock:
+            if not self._log_buffer:
+                return
+            rows, self._log_buffer = self._log_buffer, []
 
+        try:
+            with self._write_session() as session:
+                session.execute(insert(Log), rows)
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to add log: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_logs(self, iteration_id: int) -> List[Dict[str, Any]]:
         """Get logs for an iteration.
@@ -951,8 +1363,9 @@ class StateManager:
         Returns:
             List of log dictionaries
         """
-        session = self.Session()
-        try:
+        self.flush_logs()
+
+        with self._sessionmaker() as session:
             stmt = select(Log).where(Log.iteration_id == iteration_id).order_by(Log.timestamp)
             results = session.execute(stmt).scalars().all()
 
@@ -966,8 +1379,6 @@ class StateManager:
                 }
                 for log in results
             ]
-        finally:
-            session.close()
 
     def create_build_log(
         self,
@@ -990,39 +1401,34 @@ class StateManager:
         Raises:
             DatabaseError: If log creation fails
         """
-        session = self.Session()
         try:
-            # Compress initial content if provided
-            compressed_content = (
-                gzip.compress(initial_content.encode("utf-8")) if initial_content else b""
-            )
-            size_bytes = len(compressed_content)
-
-            new_log = BuildLog(
-                iteration_id=iteration_id,
-                host_id=host_id,
-                log_type=log_type,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                log_content=compressed_content,
-                compressed=True,
-                size_bytes=size_bytes,
-                exit_code=None,  # Will be set when build completes
-            )
-
-            session.add(new_log)
-            session.commit()
-            log_id = new_log.log_id
+            with self._write_session() as session:
+                # Compress initial content if provided
+                compressed_content = (
+                    gzip.compress(initial_content.encode("utf-8")) if initial_content else b""
+                )
+                size_bytes = len(compressed_content)
+
+                log_id = _insert_row(
+                    session,
+                    BuildLog,
+                    iteration_id=iteration_id,
+                    host_id=host_id,
+                    log_type=log_type,
+                    timestamp=_utc_now_iso(),
+                    log_content=compressed_content,
+                    compressed=True,
+                    size_bytes=size_bytes,
+                    exit_code=None,  # Will be set when build completes
+                )
 
             logger.debug(f"Created {log_type} log {log_id} for streaming")
             return log_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to create build log: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def append_build_log_chunk(self, log_id: int, chunk: str) -> None:
         """Append content to existing build log.
@@ -1034,43 +1440,42 @@ class StateManager:
         Raises:
             DatabaseError: If append fails
         """
-        session = self.Session()
         try:
-            # Get existing log
-            stmt = select(BuildLog).where(BuildLog.log_id == log_id)
-            build_log = session.execute(stmt).scalar_one_or_none()
-
-            if not build_log:
-                raise DatabaseError(f"Build log {log_id} not found")
-
-            # Decompress existing content
-            if build_log.compressed and build_log.log_content:
-                existing_content = gzip.decompress(build_log.log_content).decode("utf-8")
-            else:
-                existing_content = (
-                    build_log.log_content.decode("utf-8") if build_log.log_content else ""
-                )
-
-            # Append new chunk
-            updated_content = existing_content + chunk
+            with self._write_session() as session:
+                # Get existing log
+                build_log = session.execute(
+                    _SELECT_BUILD_LOG_BY_ID, {"log_id": log_id}
+                ).scalar_one_or_none()
+
+                if not build_log:
+                    raise DatabaseError(f"Build log {log_id} not found")
+
+                # Decompress existing content
+                if build_log.compressed and build_log.log_content:
+                    existing_content = gzip.decompress(build_log.log_content).decode("utf-8")
+                else:
+                    existing_content = (
+                        build_log.log_content.decode("utf-8") if build_log.log_content else ""
+                    )
 
-            # Recompress
-            compressed_content = gzip.compress(updated_content.encode("utf-8"))
-            build_log.log_content = compressed_content
-            build_log.size_bytes = len(compressed_content)
+                # Append new chunk
+                updated_content = existing_content + chunk
 
-            session.commit()
-            logger.debug(
-                f"Appended {len(chunk)} bytes to log {log_id} (total compressed: {len(compressed_content)} bytes)"
-            )
+                # Recompress
+                compressed_content = gzip.compress(updated_content.encode("utf-8"))
+                build_log.log_content = compressed_content
+                build_log.size_bytes = len(compressed_content)
 
+            # Called for every streamed chunk; skip formatting unless debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Appended {len(chunk)} bytes to log {log_id} "
+                    f"(total compressed: {len(compressed_content)} bytes)"
+                )
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to append to build log: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def finalize_build_log(self, log_id: int, exit_code: int) -> None:
         """Finalize build log with exit code.
@@ -1082,25 +1487,21 @@ class StateManager:
         Raises:
             DatabaseError: If finalization fails
         """
-        session = self.Session()
         try:
-            stmt = select(BuildLog).where(BuildLog.log_id == log_id)
-            build_log = session.execute(stmt).scalar_one_or_none()
+            with self._write_session() as session:
+                build_log = session.execute(
+                    _SELECT_BUILD_LOG_BY_ID, {"log_id": log_id}
+                ).scalar_one_or_none()
 
-            if not build_log:
-                raise DatabaseError(f"Build log {log_id} not found")
-
-            build_log.exit_code = exit_code
-            session.commit()
-            logger.debug(f"Finalized log {log_id} with exit code {exit_code}")
+                if not build_log:
+                    raise DatabaseError(f"Build log {log_id} not found")
 
+                build_log.exit_code = exit_code
+                logger.debug(f"Finalized log {log_id} with exit code {exit_code}")
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to finalize build log: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def store_build_log(
         self, iteration_id: int, log_type: str, content: str, exit_code: int = 0
@@ -1119,48 +1520,46 @@ class StateManager:
         Raises:
             DatabaseError: If log storage fails
         """
-        session = self.Session()
         try:
-            # Compress log content
-            compressed_content = gzip.compress(content.encode("utf-8"))
-            size_bytes = len(compressed_content)
-
-            new_log = BuildLog(
-                iteration_id=iteration_id,
-                log_type=log_type,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                log_content=compressed_content,
-                compressed=True,
-                size_bytes=size_bytes,
-                exit_code=exit_code,
-            )
-
-            session.add(new_log)
-            session.commit()
-            log_id = new_log.log_id
+            with self._write_session() as session:
+                # Compress log content
+                compressed_content, _ = _gzip_text(content)
+                size_bytes = len(compressed_content)
+
+                log_id = _insert_row(
+                    session,
+                    BuildLog,
+                    iteration_id=iteration_id,
+                    log_type=log_type,
+                    timestamp=_utc_now_iso(),
+                    log_content=compressed_content,
+                    compressed=True,
+                    size_bytes=size_bytes,
+                    exit_code=exit_code,
+                )
 
             logger.debug(f"Stored {log_type} log {log_id} ({size_bytes} bytes compressed)")
             return log_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to store build log: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
-    def get_build_log(self, log_id: int) -> Optional[Dict[str, Any]]:
+    def get_build_log(self, log_id: int, include_content: bool = True) -> Optional[Dict[str, Any]]:
         """Get and decompress build log by ID.
 
+        For large logs prefer stream_build_log(), which avoids holding the
+        whole decompressed content in memory.
+
         Args:
             log_id: Log ID to retrieve
+            include_content: Whether to decompress and include the log content
 
         Returns:
             Dictionary with log data including decompressed content, or None if not found
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
             stmt = (
                 select(BuildLog, Iteration)
                 .join(Iteration, BuildLog.iteration_id == Iteration.iteration_id)
@@ -1173,14 +1572,7 @@ class StateManager:
 
             build_log, iteration = result
 
-            # Decompress content
-            content = build_log.log_content
-            if build_log.compressed:
-                content = gzip.decompress(content).decode("utf-8")
-            else:
-                content = content.decode("utf-8")
-
-            return {
+            log_data = {
                 "log_id": build_log.log_id,
                 "iteration_id": build_log.iteration_id,
                 "iteration_num": iteration.iteration_num,
@@ -1188,13 +1580,42 @@ class StateManager:
                 "commit_message": iteration.commit_message,
                 "log_type": build_log.log_type,
                 "timestamp": build_log.timestamp,
-                "content": content,
                 "size_bytes": build_log.size_bytes,
                 "exit_code": build_log.exit_code,
                 "compressed": build_log.compressed,
             }
-        finally:
-            session.close()
+            if include_content:
+                log_data["content"] = "".join(
+                    _iter_log_content(build_log.log_content, build_log.compressed)
+                )
+
+            return log_data
+
+    def stream_build_log(
+        self, log_id: int, chunk_size: int = LOG_STREAM_CHUNK_SIZE
+    ) -> Iterator[str]:
+        """Stream decompressed build log content in chunks.
+
+        Peak memory is bounded by the compressed BLOB plus a single chunk,
+        instead of the full decompressed log.
+
+        Args:
+            log_id: Log ID to stream
+            chunk_size: Maximum number of characters per yielded chunk
+
+        Yields:
+            Decoded log content chunks (nothing if the log does not exist)
+        """
+        with self._sessionmaker() as session:
+            stmt = select(BuildLog.log_content, BuildLog.compressed).where(
+                BuildLog.log_id == log_id
+            )
+            row = session.execute(stmt).first()
+
+        if not row:
+            return
+
+        yield from _iter_log_content(row.log_content, row.compressed, chunk_size)
 
     def get_iteration_build_logs(self, iteration_id: int) -> List[Dict[str, Any]]:
         """Get all build logs for an iteration.
@@ -1205,27 +1626,22 @@ class StateManager:
         Returns:
             List of log metadata dictionaries (without content)
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
+            # Select columns only so the (potentially large) log_content BLOB
+            # is never loaded and no ORM instances are created
             stmt = (
-                select(BuildLog)
+                select(
+                    BuildLog.log_id,
+                    BuildLog.log_type,
+                    BuildLog.timestamp,
+                    BuildLog.size_bytes,
+                    BuildLog.exit_code,
+                )
                 .where(BuildLog.iteration_id == iteration_id)
                 .order_by(BuildLog.timestamp)
             )
-            results = session.execute(stmt).scalars().all()
 
-            return [
-                {
-                    "log_id": log.log_id,
-                    "log_type": log.log_type,
-                    "timestamp": log.timestamp,
-                    "size_bytes": log.size_bytes,
-                    "exit_code": log.exit_code,
-                }
-                for log in results
-            ]
-        finally:
-            session.close()
+            return [dict(row) for row in session.execute(stmt).mappings()]
 
     def list_build_logs(
         self, session_id: Optional[int] = None, log_type: Optional[str] = None
@@ -1239,10 +1655,20 @@ class StateManager:
         Returns:
             List of log metadata dictionaries
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
+            # Project only the listed columns (no log_content BLOB, no ORM hydration)
             stmt = (
-                select(BuildLog, Iteration, Host)
+                select(
+                    BuildLog.log_id,
+                    BuildLog.iteration_id,
+                    Iteration.iteration_num,
+                    Iteration.commit_sha,
+                    BuildLog.log_type,
+                    BuildLog.timestamp,
+                    BuildLog.size_bytes,
+                    BuildLog.exit_code,
+                    Host.hostname,
+                )
                 .join(Iteration, BuildLog.iteration_id == Iteration.iteration_id)
                 .outerjoin(Host, BuildLog.host_id == Host.host_id)
             )
@@ -1253,34 +1679,20 @@ class StateManager:
             if log_type is not None:
                 stmt = stmt.where(BuildLog.log_type == log_type)
 
-            stmt = stmt.order_by(BuildLog.timestamp.desc())
-
-            results = session.execute(stmt).all()
+            stmt = stmt.order_by(BuildLog.timestamp.desc()).execution_options(
+                yield_per=LIST_YIELD_PER
+            )
 
             logs = []
-            for build_log, iteration, host in results:
-                logs.append(
-                    {
-                        "log_id": build_log.log_id,
-                        "iteration_id": build_log.iteration_id,
-                        "iteration_num": iteration.iteration_num,
-                        "commit_sha": iteration.commit_sha,
-                        "log_type": build_log.log_type,
-                        "timestamp": build_log.timestamp,
-                        "size_bytes": build_log.size_bytes,
-                        "exit_code": build_log.exit_code,
-                        "hostname": host.hostname if host else None,
-                        "status": (
-                            "RUNNING"
-                            if build_log.exit_code is None
-                            else ("SUCCESS" if build_log.exit_code == 0 else "FAILED")
-                        ),
-                    }
+            for row in session.execute(stmt).mappings():
+                log = dict(row)
+                exit_code = log["exit_code"]
+                log["status"] = (
+                    "RUNNING" if exit_code is None else ("SUCCESS" if exit_code == 0 else "FAILED")
                 )
+                logs.append(log)
 
             return logs
-        finally:
-            session.close()
 
     def store_metadata(
         self,
@@ -1303,37 +1715,31 @@ class StateManager:
         Raises:
             DatabaseError: If metadata storage fails
         """
-        session = self.Session()
         try:
-            # Convert metadata to JSON
-            data = json.dumps(metadata_dict, sort_keys=True)
-
-            # Insert new metadata
-            new_metadata = Metadata(
-                session_id=session_id,
-                iteration_id=iteration_id,
-                host_id=host_id,
-                collection_time=metadata_dict.get(
-                    "collection_time", datetime.now(timezone.utc).isoformat()
-                ),
-                collection_type=metadata_dict.get("collection_type", "unknown"),
-                data=data,
-            )
-
-            session.add(new_metadata)
-            session.commit()
-            metadata_id = new_metadata.metadata_id
+            with self._write_session() as session:
+                # Convert metadata to JSON
+                data = _dumps_metadata(metadata_dict)
+
+                # Insert new metadata
+                metadata_id = _insert_row(
+                    session,
+                    Metadata,
+                    session_id=session_id,
+                    iteration_id=iteration_id,
+                    host_id=host_id,
+                    collection_time=metadata_dict.get("collection_time") or _utc_now_iso(),
+                    collection_type=metadata_dict.get("collection_type", "unknown"),
+                    data=data,
+                )
 
+            self._read_cache.clear()
             logger.info(f"Stored metadata {metadata_id} for session {session_id}")
             return metadata_id
 
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to store metadata: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def update_metadata(
         self,
@@ -1352,38 +1758,35 @@ class StateManager:
         Raises:
             DatabaseError: If metadata update fails
         """
-        session = self.Session()
         try:
-            # Get existing metadata record
-            stmt = select(Metadata).where(Metadata.metadata_id == metadata_id)
-            existing = session.execute(stmt).scalar_one_or_none()
-
-            if not existing:
-                logger.warning(f"Metadata record {metadata_id} not found for update")
-                return False
-
-            # Update metadata fields
-            data = json.dumps(metadata_dict, sort_keys=True)
-
-            existing.data = data
-            existing.collection_time = metadata_dict.get(
-                "collection_time", existing.collection_time
-            )
-            existing.collection_type = metadata_dict.get(
-                "collection_type", existing.collection_type
-            )
+            with self._write_session() as session:
+                # Get existing metadata record
+                existing = session.execute(
+                    _SELECT_METADATA_BY_ID, {"metadata_id": metadata_id}
+                ).scalar_one_or_none()
+
+                if not existing:
+                    logger.warning(f"Metadata record {metadata_id} not found for update")
+                    return False
+
+                # Update metadata fields
+                data = _dumps_metadata(metadata_dict)
+
+                existing.data = data
+                existing.collection_time = metadata_dict.get(
+                    "collection_time", existing.collection_time
+                )
+                existing.collection_type = metadata_dict.get(
+                    "collection_type", existing.collection_type
+                )
+                logger.debug(f"Updated metadata record {metadata_id}")
 
-            session.commit()
-            logger.debug(f"Updated metadata record {metadata_id}")
+            self._read_cache.clear()
             return True
-
         except Exception as exc:
-            session.rollback()
             msg = f"Failed to update metadata: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            session.close()
 
     def get_metadata(self, metadata_id: int) -> Optional[Dict[str, Any]]:
         """Get metadata by ID.
@@ -1394,19 +1797,16 @@ class StateManager:
         Returns:
             Metadata dictionary or None if not found
         """
-        session = self.Session()
-        try:
-            stmt = select(Metadata).where(Metadata.metadata_id == metadata_id)
-            result = session.execute(stmt).scalar_one_or_none()
+        with self._sessionmaker() as session:
+            result = session.execute(
+                _SELECT_METADATA_BY_ID, {"metadata_id": metadata_id}
+            ).scalar_one_or_none()
 
             if not result:
                 return None
 
             # Try to parse as JSON, otherwise return raw string
-            try:
-                metadata_content = json.loads(result.data)
-            except (json.JSONDecodeError, ValueError):
-                metadata_content = result.data
+            metadata_content = _metadata_content(result)
 
             return {
                 "metadata_id": result.metadata_id,
@@ -1416,8 +1816,6 @@ class StateManager:
                 "collection_type": result.collection_type,
                 "metadata": metadata_content,
             }
-        finally:
-            session.close()
 
     def get_session_metadata(
         self, session_id: int, collection_type: Optional[str] = None
@@ -1431,8 +1829,7 @@ class StateManager:
         Returns:
             List of metadata dictionaries
         """
-        session = self.Session()
-        try:
+        with self._sessionmaker() as session:
             stmt = (
                 select(Metadata, Host)
                 .outerjoin(Host, Metadata.host_id == Host.host_id)
@@ -1448,10 +1845,7 @@ class StateManager:
             metadata_list = []
             for meta, host in results:
                 # Try to parse as JSON, otherwise use raw string
-                try:
-                    metadata_content = json.loads(meta.data)
-                except (json.JSONDecodeError, ValueError):
-                    metadata_content = meta.data
+                metadata_content = _metadata_content(meta)
 
                 metadata_list.append(
                     {
@@ -1466,20 +1860,24 @@ class StateManager:
                 )
 
             return metadata_list
-        finally:
-            session.close()
 
     def get_baseline_metadata(self, session_id: int) -> Optional[Dict[str, Any]]:
         """Get baseline metadata for a session.
 
+        Cached like get_session().
+
         Args:
             session_id: Session ID
 
         Returns:
             Baseline metadata dictionary or None
         """
-        metadata_list = self.get_session_metadata(session_id, "baseline")
-        return metadata_list[0] if metadata_list else None
+
+        def load() -> Optional[Dict[str, Any]]:
+            metadata_list = self.get_session_metadata(session_id, "baseline")
+            return metadata_list[0] if metadata_list else None
+
+        return self._cached_read(("baseline_metadata", session_id), load)
 
     def store_file_metadata(
         self,
@@ -1488,16 +1886,21 @@ class StateManager:
         file_type: str,
         file_content: str,
         host_id: Optional[int] = None,
+        compress: bool = True,
         **_extra_metadata: Any,
     ) -> int:
         """Store file as a metadata record with collection_type='file'.
 
+        The content goes to the file_content BLOB column (gzip-compressed by
+        default) rather than the JSON data column.
+
         Args:
             session_id: Session ID
             iteration_id: Iteration ID (None for session-level files)
             file_type: Type of file (e.g., 'kernel_config')
             file_content: File content as text
             host_id: Optional host ID to link metadata to specific machine
+            compress: Whether to gzip-compress the stored content
             **extra_metadata: Additional metadata to include in JSON
 
         Returns:
@@ -1506,38 +1909,39 @@ class StateManager:
         Raises:
             DatabaseError: If file storage fails
         """
-        db_session = self.Session()
         try:
-            # Calculate size for logging
-            file_size = len(file_content)
-
-            # Create metadata record with file content as data
-            new_metadata = Metadata(
-                session_id=session_id,
-                iteration_id=iteration_id,
-                host_id=host_id,
-                collection_time=datetime.now(timezone.utc).isoformat(),
-                collection_type=file_type,  # Use file_type as collection_type (e.g., 'kernel_config')
-                data=file_content,  # Store raw file content directly
-            )
-
-            db_session.add(new_metadata)
-            db_session.commit()
-            metadata_id = new_metadata.metadata_id
+            if compress:
+                stored_content, content_size = _gzip_text(file_content)
+            else:
+                stored_content = file_content.encode("utf-8")
+                content_size = len(stored_content)
+
+            with self._write_session() as db_session:
+                # Create metadata record with file content in the BLOB column
+                metadata_id = _insert_row(
+                    db_session,
+                    Metadata,
+                    session_id=session_id,
+                    iteration_id=iteration_id,
+                    host_id=host_id,
+                    collection_time=_utc_now_iso(),
+                    collection_type=file_type,  # Use file_type as collection_type (e.g., 'kernel_config')
+                    data="",
+                    file_content=stored_content,
+                    file_compressed=compress,
+                    uncompressed_size=content_size,
+                )
 
             logger.debug(
                 f"Stored {file_type} file as metadata (metadata_id: {metadata_id}, "
-                f"size: {file_size} bytes)"
+                f"size: {content_size} bytes, stored: {len(stored_content)} bytes)"
             )
             return metadata_id
 
         except Exception as exc:
-            db_session.rollback()
             msg = f"Failed to store file metadata: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            db_session.close()
 
     def get_file_content(self, metadata_id: int) -> Optional[str]:
         """Get file content from a metadata record.
@@ -1551,29 +1955,33 @@ class StateManager:
         Raises:
             DatabaseError: If file retrieval fails
         """
-        db_session = self.Session()
         try:
-            stmt = select(Metadata).where(Metadata.metadata_id == metadata_id)
-            metadata = db_session.execute(stmt).scalar_one_or_none()
-
-            if not metadata:
-                return None
+            with self._sessionmaker() as db_session:
+                metadata = db_session.execute(
+                    _SELECT_METADATA_BY_ID, {"metadata_id": metadata_id}
+                ).scalar_one_or_none()
 
-            # Return raw data content directly
-            return metadata.data
+                if not metadata:
+                    return None
 
+                return _metadata_file_text(metadata)
         except Exception as exc:
             msg = f"Failed to get file content: {exc}"
             logger.error(msg)
             raise DatabaseError(msg) from exc
-        finally:
-            db_session.close()
 
-    def generate_summary(self, session_id: int) -> Dict[str, Any]:
+    def generate_summary(self, session_id: int, include_iterations: bool = True) -> Dict[str, Any]:
         """Generate summary of bisection session.
 
+        Result counts and total duration are aggregated in the database, so
+        per-iteration rows are only fetched when include_iterations is set.
+        Summaries of finished sessions are cached until the session or one of
+        its iterations is updated; cached nested values are shared, so callers
+        must not modify them.
+
         Args:
             session_id: Session ID
+            include_iterations: Whether to include per-iteration details
 
         Returns:
             Summary dictionary
@@ -1582,21 +1990,37 @@ class StateManager:
         if not session_data:
             return {}
 
-        iterations = self.get_iterations(session_id)
+        cache_key = (session_data.status, session_data.end_time)
+        cached = self._summary_cache.get(session_id)
+        if cached and cached[0] == cache_key:
+            cached_summary = dict(cached[1])
+            if not include_iterations:
+                del cached_summary["iterations"]
+            return cached_summary
+        finished = session_data.status in FINISHED_SESSION_STATUSES
 
         # Count results
         results = {"good": 0, "bad": 0, "skip": 0, "unknown": 0}
+        total_iterations = 0
+        total_duration = 0
 
-        for it in iterations:
-            if it.final_result:
-                results[it.final_result] = results.get(it.final_result, 0) + 1
-            else:
-                results["unknown"] += 1
-
-        # Calculate total time
-        total_duration = sum(it.duration for it in iterations if it.duration)
+        with self._sessionmaker() as session:
+            stmt = (
+                select(
+                    Iteration.final_result,
+                    func.count(),
+                    func.coalesce(func.sum(Iteration.duration), 0),
+                )
+                .where(Iteration.session_id == session_id)
+                .group_by(Iteration.final_result)
+            )
+            for final_result, count, duration in session.execute(stmt):
+                key = final_result or "unknown"
+                results[key] = results.get(key, 0) + count
+                total_iterations += count
+                total_duration += duration or 0
 
-        return {
+        summary: Dict[str, Any] = {
             "session_id": session_id,
             "good_commit": session_data.good_commit,
             "bad_commit": session_data.bad_commit,
@@ -1604,12 +2028,24 @@ class StateManager:
             "end_time": session_data.end_time,
             "status": session_data.status,
             "result_commit": session_data.result_commit,
-            "total_iterations": len(iterations),
+            "total_iterations": total_iterations,
             "results": results,
             "total_duration_seconds": total_duration,
-            "iterations": [asdict(it) for it in iterations],
         }
 
+        if include_iterations or finished:
+            with self._sessionmaker() as session:
+                rows = session.execute(_SELECT_SUMMARY_ITERATIONS, {"session_id": session_id})
+                summary["iterations"] = [row._asdict() for row in rows]
+
+        if finished:
+            self._summary_cache[session_id] = (cache_key, summary)
+            summary = dict(summary)
+            if not include_iterations:
+                del summary["iterations"]
+
+        return summary
+
     def export_report(self, session_id: int, format: str = "json") -> str:
         """Export bisection report.
 
@@ -1627,9 +2063,9 @@ class StateManager:
 
         if format == "text":
             report = []
-            report.append("=" * 70)
+            report.append(_REPORT_RULE)
             report.append("KERNEL BISECTION REPORT")
-            report.append("=" * 70)
+            report.append(_REPORT_RULE)
             report.append(f"\nSession ID: {summary['session_id']}")
             report.append(f"Good commit: {summary['good_commit']}")
             report.append(f"Bad commit:  {summary['bad_commit']}")
@@ -1642,15 +2078,18 @@ class StateManager:
             for result, count in summary["results"].items():
                 report.append(f"  {result}: {count}")
 
-            report.append("\n" + "-" * 70)
+            report.append("\n" + _REPORT_SUBRULE)
             report.append("Iteration Details:")
-            report.append("-" * 70)
+            report.append(_REPORT_SUBRULE)
 
             for it in summary["iterations"]:
                 report.append(
-                    f"\n{it['iteration_num']:3d}. {it['commit_sha'][:7]} | "
-                    f"{it['final_result'] or 'unknown':7s} | "
-                    f"{it['duration'] or 0:4d}s"
+                    _REPORT_ITERATION_FMT(
+                        it["iteration_num"],
+                        it["commit_sha"],
+                        it["final_result"] or "unknown",
+                        it["duration"] or 0,
+                    )
                 )
                 report.append(f"     {it['commit_message']}")
 
@@ -1659,16 +2098,20 @@ class StateManager:
 
             # Show first bad commit prominently at the end if found
             if summary["result_commit"]:
-                report.append("\n" + "=" * 70)
+                report.append("\n" + _REPORT_RULE)
                 report.append("FIRST BAD COMMIT:")
-                report.append("=" * 70)
-
-                # Find the iteration matching the first bad commit
-                first_bad_iteration = None
-                for it in summary["iterations"]:
-                    if it["commit_sha"].startswith(summary["result_commit"][:7]):
-                        first_bad_iteration = it
-                        break
+                report.append(_REPORT_RULE)
+
+                # Find the iteration matching the first bad commit (earliest wins)
+                first_bad_prefix = summary["result_commit"][:SHORT_SHA_LENGTH]
+                first_bad_iteration = next(
+                    (
+                        it
+                        for it in summary["iterations"]
+                        if it["commit_sha"].startswith(first_bad_prefix)
+                    ),
+                    None,
+                )
 
                 if first_bad_iteration:
                     report.append(
@@ -1678,7 +2121,7 @@ class StateManager:
                 else:
                     report.append(f"# first bad commit: {summary['result_commit']}")
 
-            report.append("\n" + "=" * 70)
+            report.append("\n" + _REPORT_RULE)
 
             return "\n".join(report)
 
@@ -1687,6 +2130,7 @@ class StateManager:
     def close(self) -> None:
         """Close database connection and cleanup."""
         try:
+            self.flush_logs()
             # Remove scoped session
             self.Session.remove()
             # Dispose of engine connection pool
@@ -8,6 +8,15 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional
 
+from kbisect.remote.base import RemoteClient
+
+
+# Constants
+POWER_DOWN_POLL_INTERVAL = 0.5  # Seconds between SSH checks while waiting for power down
+SHUTDOWN_POLL_MIN_INTERVAL = 0.25  # First delay between shutdown checks after reset
+SHUTDOWN_POLL_MAX_INTERVAL = 2.0
+SHUTDOWN_POLL_BACKOFF = 1.5  # Delay growth factor per failed shutdown check
+
 
 class PowerState(Enum):
     """Power states for remote systems."""
@@ -68,11 +77,14 @@ class PowerController(ABC):
         """
 
     @abstractmethod
-    def power_cycle(self, wait_time: int = 10) -> bool:
+    def power_cycle(self, wait_time: int = 10, ssh_client: Optional[RemoteClient] = None) -> bool:
         """Power cycle the system (off then on).
 
         Args:
             wait_time: Seconds to wait between power off and power on
+            ssh_client: Optional client used to detect that the system is down,
+                so power on need not wait the full wait_time. Implementations
+                that can query power state directly may ignore it.
 
         Returns:
             True if successful, False otherwise
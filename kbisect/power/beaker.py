@@ -5,16 +5,23 @@ Handles power control using the Beaker lab automation system.
 Requires bkr client to be installed and user authenticated via Kerberos.
 """
 
+import functools
 import logging
+import shutil
 import subprocess
 import time
-from typing import Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from kbisect.power.base import (
+    POWER_DOWN_POLL_INTERVAL,
+    SHUTDOWN_POLL_BACKOFF,
+    SHUTDOWN_POLL_MAX_INTERVAL,
+    SHUTDOWN_POLL_MIN_INTERVAL,
     BootDevice,
     PowerController,
     PowerState,
 )
+from kbisect.remote.base import RemoteClient
 from kbisect.remote.ssh import SSHClient
 
 
@@ -23,6 +30,12 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_BEAKER_TIMEOUT = 60
 POWER_CYCLE_WAIT_TIME = 10
+BEAKER_POLL_INTERVAL = 0.1  # Seconds between checks of a running bkr process
+BEAKER_REBOOT_DISPATCH_DELAY = 0.2  # Seconds after starting bkr before probing SSH
+BKR_WHOAMI_CACHE_TTL = 300  # Seconds a successful bkr whoami result is reused
+
+# Process-wide (monotonic timestamp, user) of the last successful bkr whoami
+_bkr_whoami_cache: Optional[Tuple[float, str]] = None
 
 
 class BeakerError(Exception):
@@ -37,6 +50,16 @@ class BeakerCommandError(BeakerError):
     """Exception raised when Beaker command fails."""
 
 
+@functools.lru_cache(maxsize=1)
+def _bkr_path() -> Optional[str]:
+    """Locate the bkr client once per process.
+
+    Returns:
+        Path to bkr, or None if it is not in PATH
+    """
+    return shutil.which("bkr")
+
+
 class BeakerController(PowerController):
     """Beaker controller for remote power management.
 
@@ -57,6 +80,46 @@ class BeakerController(PowerController):
         self.hostname = hostname
         self.ssh_connect_timeout = ssh_connect_timeout
 
+        # Invariant parts of the bkr system-power command line
+        self._bkr_prefix = ("bkr", "system-power", "--action")
+        self._bkr_suffix = ("--force", "--clear-netboot", hostname)
+
+    def _beaker_command(self, action: str) -> Tuple[str, ...]:
+        """Build bkr system-power command line.
+
+        Args:
+            action: Power action (on, off, reboot, interrupt)
+
+        Returns:
+            Command argument tuple
+        """
+        return (*self._bkr_prefix, action, *self._bkr_suffix)
+
+    def _start_beaker_command(self, action: str) -> "subprocess.Popen[str]":
+        """Start bkr system-power command without waiting for it.
+
+        Args:
+            action: Power action (on, off, reboot, interrupt)
+
+        Returns:
+            Running bkr process
+
+        Raises:
+            BeakerCommandError: If command fails to start
+        """
+        try:
+            return subprocess.Popen(
+                self._beaker_command(action),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except Exception as exc:
+            msg = f"Beaker command failed: {exc}"
+            logger.error(msg)
+            raise BeakerCommandError(msg) from exc
+
     def _run_beaker_command(
         self, action: str, timeout: int = DEFAULT_BEAKER_TIMEOUT
     ) -> Tuple[int, str, str]:
@@ -73,19 +136,16 @@ class BeakerController(PowerController):
             BeakerTimeoutError: If command times out
             BeakerCommandError: If command fails to execute
         """
-        cmd = [
-            "bkr",
-            "system-power",
-            "--action",
-            action,
-            "--force",
-            "--clear-netboot",
-            self.hostname,
-        ]
+        cmd = self._beaker_command(action)
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout, check=False
+                cmd,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=timeout,
+                check=False,
             )
             return result.returncode, result.stdout, result.stderr
 
@@ -153,11 +213,16 @@ class BeakerController(PowerController):
         logger.info(f"✓ Power off command sent for {self.hostname}")
         return True
 
-    def power_cycle(self, wait_time: int = POWER_CYCLE_WAIT_TIME) -> bool:
+    def power_cycle(
+        self, wait_time: int = POWER_CYCLE_WAIT_TIME, ssh_client: Optional[RemoteClient] = None
+    ) -> bool:
         """Power cycle the system.
 
         Args:
-            wait_time: Seconds to wait between power off and power on
+            wait_time: Seconds to wait between power off and power on. With
+                ssh_client this is an upper bound: power on is sent as soon
+                as the system stops answering SSH.
+            ssh_client: Optional client used to detect that the system is down
 
         Returns:
             True if power cycle succeeded, False otherwise
@@ -165,13 +230,19 @@ class BeakerController(PowerController):
         logger.info(f"Power cycling system {self.hostname} via Beaker...")
 
         # Power off
-        if not self.power_off(force=True):
+        if not self.power_off():  # bkr always powers off with --force
             logger.error("Failed to power off")
             return False
 
         # Wait for system to fully power down
-        logger.info(f"Waiting {wait_time}s for system to power down...")
-        time.sleep(wait_time)
+        if ssh_client is None:
+            logger.info(f"Waiting {wait_time}s for system to power down...")
+            time.sleep(wait_time)
+        else:
+            logger.info(f"Waiting up to {wait_time}s for system to power down...")
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < wait_time and ssh_client.is_alive():
+                time.sleep(POWER_DOWN_POLL_INTERVAL)
 
         # Power on
         if not self.power_on():
@@ -187,6 +258,8 @@ class BeakerController(PowerController):
         Creates a temporary SSH connection to verify shutdown after sending
         the reboot command. This handles the asynchronous nature of Beaker's
         reboot process where the command returns before the actual reboot starts.
+        SSH probing starts as soon as bkr is dispatched, so a machine that goes
+        down before bkr returns is confirmed as soon as bkr exits successfully.
 
         Returns:
             True if reset command succeeded and shutdown confirmed,
@@ -197,42 +270,74 @@ class BeakerController(PowerController):
         # Create temporary SSH client for shutdown verification
         ssh_client = SSHClient(self.hostname, user="root", connect_timeout=self.ssh_connect_timeout)
 
-        # Pre-reboot connectivity check
-        logger.info("Verifying SSH connectivity before reboot...")
-        if not ssh_client.is_alive():
-            logger.warning("SSH not responsive before reboot - machine may already be down")
-
-        # Send reboot command
         try:
-            ret, _stdout, stderr = self._run_beaker_command("reboot")
-        except BeakerError as exc:
-            logger.error(f"Reset failed: {exc}")
-            return False
-
-        if ret != 0:
-            logger.error(f"Reset failed: {stderr}")
-            return False
-
-        logger.info(f"✓ Reset command sent for {self.hostname}")
-
-        # Wait for shutdown
-        logger.info("Waiting for machine to shut down...")
-        shutdown_timeout = 120  # Fixed timeout to prevent infinite loop
-        shutdown_poll_interval = 2
-        start_time = time.time()
-
-        while time.time() - start_time < shutdown_timeout:
+            # Pre-reboot connectivity check
+            logger.info("Verifying SSH connectivity before reboot...")
             if not ssh_client.is_alive():
-                elapsed = time.time() - start_time
-                logger.info(f"✓ Machine shutdown confirmed after {elapsed:.1f}s")
-                return True
-            time.sleep(shutdown_poll_interval)
-
-        # Timeout reached - shutdown not confirmed
-        logger.warning(
-            f"Shutdown not confirmed within {shutdown_timeout}s - machine may still be up or reboot pending"
-        )
-        return False
+                logger.warning("SSH not responsive before reboot - machine may already be down")
+
+            # Send reboot command
+            try:
+                process = self._start_beaker_command("reboot")
+            except BeakerError as exc:
+                logger.error(f"Reset failed: {exc}")
+                return False
+
+            # Wait for shutdown while bkr is still running
+            logger.info("Waiting for machine to shut down...")
+            shutdown_timeout = 120  # Fixed timeout to prevent infinite loop
+            poll_interval = SHUTDOWN_POLL_MIN_INTERVAL
+            start_time = time.monotonic()
+            bkr_deadline = start_time + DEFAULT_BEAKER_TIMEOUT
+            shutdown_deadline = bkr_deadline + shutdown_timeout
+            next_probe = start_time + BEAKER_REBOOT_DISPATCH_DELAY
+            command_sent = False
+            shutdown_seen = False
+
+            while time.monotonic() < shutdown_deadline:
+                if not command_sent:
+                    ret = process.poll()
+                    if ret is None:
+                        if time.monotonic() > bkr_deadline:
+                            process.kill()
+                            process.communicate()
+                            logger.error(
+                                f"Reset failed: Beaker command timed out after {DEFAULT_BEAKER_TIMEOUT}s"
+                            )
+                            return False
+                    else:
+                        _stdout, stderr = process.communicate()
+                        if ret != 0:
+                            logger.error(f"Reset failed: {stderr}")
+                            return False
+                        logger.info(f"✓ Reset command sent for {self.hostname}")
+                        command_sent = True
+                        shutdown_deadline = time.monotonic() + shutdown_timeout
+
+                # A machine seen down only counts once bkr has succeeded
+                if command_sent and shutdown_seen:
+                    elapsed = time.monotonic() - start_time
+                    logger.info(f"✓ Machine shutdown confirmed after {elapsed:.1f}s")
+                    return True
+
+                if not shutdown_seen and time.monotonic() >= next_probe:
+                    if not ssh_client.is_alive():
+                        shutdown_seen = True
+                        continue
+                    next_probe = time.monotonic() + poll_interval
+                    poll_interval = min(
+                        SHUTDOWN_POLL_MAX_INTERVAL, poll_interval * SHUTDOWN_POLL_BACKOFF
+                    )
+
+                time.sleep(BEAKER_POLL_INTERVAL)
+
+            # Timeout reached - shutdown not confirmed
+            logger.warning(
+                f"Shutdown not confirmed within {shutdown_timeout}s - machine may still be up or reboot pending"
+            )
+            return False
+        finally:
+            ssh_client.close()
 
     def set_boot_device(self, _device: BootDevice, _persistent: bool = False) -> bool:
         """Set next boot device.
@@ -268,15 +373,18 @@ class BeakerController(PowerController):
         - Kerberos authentication (via bkr whoami)
         - System accessibility
 
+        A successful Kerberos check is reused process-wide for
+        BKR_WHOAMI_CACHE_TTL seconds; failures are always re-checked.
+
         Returns:
             Dictionary with health check results
         """
-        import shutil
+        global _bkr_whoami_cache
 
-        result = {"healthy": False, "checks": []}
+        result: Dict[str, Any] = {"healthy": False, "checks": []}
 
         # Check if bkr is installed
-        bkr_path = shutil.which("bkr")
+        bkr_path = _bkr_path()
         if not bkr_path:
             result["error"] = "bkr command not found in PATH"
             result["checks"].append({"name": "bkr", "passed": False})
@@ -286,9 +394,22 @@ class BeakerController(PowerController):
         result["checks"].append({"name": "bkr", "passed": True})
 
         # Test Kerberos authentication with bkr whoami
+        cached = _bkr_whoami_cache
+        if cached is not None and time.monotonic() - cached[0] < BKR_WHOAMI_CACHE_TTL:
+            result["checks"].append({"name": "kerberos_auth", "passed": True})
+            result["authenticated_user"] = cached[1]
+            result["healthy"] = True
+            result["power_status"] = "unknown (Beaker does not support status queries)"
+            return result
+
         try:
             whoami_result = subprocess.run(
-                ["bkr", "whoami"], capture_output=True, text=True, timeout=10, check=False
+                ["bkr", "whoami"],
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=10,
+                check=False,
             )
 
             if whoami_result.returncode != 0:
@@ -297,7 +418,9 @@ class BeakerController(PowerController):
                 return result
 
             result["checks"].append({"name": "kerberos_auth", "passed": True})
-            result["authenticated_user"] = whoami_result.stdout.strip()
+            authenticated_user = whoami_result.stdout.strip()
+            result["authenticated_user"] = authenticated_user
+            _bkr_whoami_cache = (time.monotonic(), authenticated_user)
 
         except subprocess.TimeoutExpired:
             result["error"] = "bkr whoami command timed out"
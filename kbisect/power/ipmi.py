@@ -7,17 +7,23 @@ Handles power control, serial console access, and boot device configuration.
 import contextlib
 import logging
 import os
+import re
+import select
 import subprocess
-import tempfile
+import threading
 import time
-from pathlib import Path
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Generator, List, Optional, Tuple
 
 from kbisect.power.base import (
+    SHUTDOWN_POLL_BACKOFF,
+    SHUTDOWN_POLL_MAX_INTERVAL,
+    SHUTDOWN_POLL_MIN_INTERVAL,
     BootDevice,
     PowerController,
     PowerState,
 )
+from kbisect.remote.base import RemoteClient
 from kbisect.remote.ssh import SSHClient
 
 
@@ -26,7 +32,16 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_IPMI_TIMEOUT = 30
 POWER_CYCLE_WAIT_TIME = 10
+RESET_SETTLE_TIME = 5  # Seconds to let the BMC act on a reset before the host is probed again
 SOL_DEACTIVATE_TIMEOUT = 5
+SOL_READ_CHUNK_SIZE = 4096  # Bytes read from the SOL stream per wakeup
+SOL_STOP_POLL_INTERVAL = 0.5  # Max seconds between stop_event checks while SOL is idle
+POWER_STATE_POLL_INTERVAL = 0.5  # Seconds between BMC power status queries while waiting
+IPMI_PASSWORD_ENV = "IPMI_PASSWORD"  # Read by ipmitool -E
+RECOVERY_SEL_LINES = 10  # Recent SEL entries logged at the start of emergency recovery
+
+# Matches the "Boot Device Selector : <device>" line of `chassis bootparam get 5`
+BOOT_DEVICE_RE = re.compile(r"^\s*Boot Device Selector\s*:\s*(.+?)\s*$", re.MULTILINE)
 
 
 class IPMIError(Exception):
@@ -78,55 +93,55 @@ class IPMIController(PowerController):
         self.ssh_host = ssh_host or host
         self.ssh_connect_timeout = ssh_connect_timeout
         self.cipher_suite = cipher_suite
+        # ipmitool argv prefix and environment, built once. The password goes
+        # through the environment (-E) to keep it out of the process list
+        # without writing a temporary password file on every command.
+        self._ipmi_prefix: Tuple[str, ...] = (
+            "ipmitool",
+            "-I",
+            "lanplus",
+            "-H",
+            host,
+            "-U",
+            user,
+            "-E",
+        )
+        if cipher_suite is not None:
+            self._ipmi_prefix += ("-C", str(cipher_suite))
+        self._ipmi_env = {**os.environ, IPMI_PASSWORD_ENV: password}
 
     def _run_ipmi_command(
-        self, args: List[str], timeout: int = DEFAULT_IPMI_TIMEOUT
+        self, args: List[str], timeout: int = DEFAULT_IPMI_TIMEOUT, capture_stdout: bool = True
     ) -> Tuple[int, str, str]:
         """Run ipmitool command.
 
         Args:
             args: Command arguments to pass to ipmitool
             timeout: Command timeout in seconds
+            capture_stdout: If False, stdout is discarded (sent to /dev/null)
+                instead of being read into memory; for commands where only the
+                exit status and error output matter
 
         Returns:
-            Tuple of (return_code, stdout, stderr)
+            Tuple of (return_code, stdout, stderr); stdout is empty when not captured
 
         Raises:
             IPMITimeoutError: If command times out
             IPMICommandError: If command fails to execute
         """
-        # Use temporary file for password to avoid exposing it in process list
-        password_file = None
-        try:
-            # Create secure temporary file for password
-            fd, password_file = tempfile.mkstemp(prefix="ipmi_", suffix=".tmp", text=True)
-            try:
-                os.write(fd, self.password.encode("utf-8"))
-            finally:
-                os.close(fd)
-
-            # Set restrictive permissions (only owner can read)
-            Path(password_file).chmod(0o600)
-
-            cmd = [
-                "ipmitool",
-                "-I",
-                "lanplus",
-                "-H",
-                self.host,
-                "-U",
-                self.user,
-                "-f",
-                password_file,
-            ]
-            if self.cipher_suite is not None:
-                cmd.extend(["-C", str(self.cipher_suite)])
-            cmd.extend(args)
+        cmd = [*self._ipmi_prefix, *args]
 
+        try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout, check=False
+                cmd,
+                stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                timeout=timeout,
+                check=False,
+                env=self._ipmi_env,
             )
-            return result.returncode, result.stdout, result.stderr
+            return result.returncode, result.stdout or "", result.stderr
 
         except subprocess.TimeoutExpired as exc:
             msg = f"IPMI command timed out after {timeout}s"
@@ -136,38 +151,6 @@ class IPMIController(PowerController):
             msg = f"IPMI command failed: {exc}"
             logger.error(msg)
             raise IPMICommandError(msg) from exc
-        finally:
-            # Clean up password file - CRITICAL for security
-            if password_file and Path(password_file).exists():
-                # Try multiple times with increasing force
-                deleted = False
-                for attempt in range(3):
-                    try:
-                        # Ensure file is writable before deletion
-                        Path(password_file).chmod(0o600)
-                        Path(password_file).unlink()
-                        deleted = True
-                        break
-                    except OSError as e:
-                        if attempt < 2:
-                            time.sleep(0.1)  # Brief delay before retry
-                        else:
-                            # SECURITY WARNING: Password file could not be deleted
-                            logger.error(
-                                f"SECURITY: Failed to delete IPMI password file {password_file} "
-                                f"after {attempt + 1} attempts: {e}. Manual cleanup required!"
-                            )
-
-                if not deleted:
-                    # Last resort: try to zero out the file content
-                    try:
-                        with Path(password_file).open("w") as f:
-                            f.write("")
-                        logger.warning(
-                            f"Zeroed out password file {password_file} but could not delete it"
-                        )
-                    except Exception as zero_exc:
-                        logger.error(f"Failed to zero out password file: {zero_exc}")
 
     def get_power_status(self) -> PowerState:
         """Get current power status of the system.
@@ -200,7 +183,7 @@ class IPMIController(PowerController):
         logger.info("Powering on system via IPMI...")
 
         try:
-            ret, _stdout, stderr = self._run_ipmi_command(["power", "on"])
+            ret, _stdout, stderr = self._run_ipmi_command(["power", "on"], capture_stdout=False)
         except IPMIError:
             return False
 
@@ -224,9 +207,9 @@ class IPMIController(PowerController):
 
         try:
             if force:
-                ret, _stdout, stderr = self._run_ipmi_command(["power", "off"])
+                ret, _stdout, stderr = self._run_ipmi_command(["power", "off"], capture_stdout=False)
             else:
-                ret, _stdout, stderr = self._run_ipmi_command(["power", "soft"])
+                ret, _stdout, stderr = self._run_ipmi_command(["power", "soft"], capture_stdout=False)
         except IPMIError:
             return False
 
@@ -237,11 +220,17 @@ class IPMIController(PowerController):
         logger.info("✓ Power off command sent")
         return True
 
-    def power_cycle(self, wait_time: int = POWER_CYCLE_WAIT_TIME) -> bool:
+    def power_cycle(
+        self,
+        wait_time: int = POWER_CYCLE_WAIT_TIME,
+        ssh_client: Optional[RemoteClient] = None,  # noqa: ARG002
+    ) -> bool:
         """Power cycle the system.
 
         Args:
-            wait_time: Seconds to wait between power off and power on
+            wait_time: Maximum seconds to wait for the BMC to report power off
+                (and then power on); the cycle proceeds as soon as it does
+            ssh_client: Ignored; the BMC reports power state directly
 
         Returns:
             True if power cycle succeeded, False otherwise
@@ -254,17 +243,40 @@ class IPMIController(PowerController):
             return False
 
         # Wait for system to fully power down
-        logger.info(f"Waiting {wait_time}s for system to power down...")
-        time.sleep(wait_time)
+        logger.info(f"Waiting up to {wait_time}s for system to power down...")
+        if not self._wait_for_power(PowerState.OFF, wait_time):
+            logger.warning(f"BMC did not report power off within {wait_time}s, powering on anyway")
 
         # Power on
         if not self.power_on():
             logger.error("Failed to power on")
             return False
 
+        if not self._wait_for_power(PowerState.ON, wait_time):
+            logger.warning(f"BMC did not report power on within {wait_time}s")
+
         logger.info("✓ Power cycle complete")
         return True
 
+    def _wait_for_power(self, state: PowerState, timeout: float) -> bool:
+        """Poll the BMC until it reports the given power state.
+
+        Args:
+            state: Power state to wait for
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the state was reached, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.get_power_status() == state:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(POWER_STATE_POLL_INTERVAL, remaining))
+
     def reset(self) -> bool:
         """Reset (hard reboot) the system.
 
@@ -281,41 +293,45 @@ class IPMIController(PowerController):
         # Create temporary SSH client for shutdown verification
         ssh_client = SSHClient(self.ssh_host, user="root", connect_timeout=self.ssh_connect_timeout)
 
-        # Pre-reboot connectivity check
-        logger.info("Verifying SSH connectivity before reboot...")
-        if not ssh_client.is_alive():
-            logger.warning("SSH not responsive before reboot - machine may already be down")
-
-        # Send reset command
         try:
-            ret, _stdout, stderr = self._run_ipmi_command(["power", "reset"])
-        except IPMIError:
-            return False
-
-        if ret != 0:
-            logger.error(f"Reset failed: {stderr}")
-            return False
-
-        logger.info("✓ Reset command sent")
-
-        # Wait for shutdown
-        logger.info("Waiting for machine to shut down...")
-        shutdown_timeout = 120  # Fixed timeout to prevent infinite loop
-        shutdown_poll_interval = 2
-        start_time = time.time()
-
-        while time.time() - start_time < shutdown_timeout:
+            # Pre-reboot connectivity check
+            logger.info("Verifying SSH connectivity before reboot...")
             if not ssh_client.is_alive():
-                elapsed = time.time() - start_time
-                logger.info(f"✓ Machine shutdown confirmed after {elapsed:.1f}s")
-                return True
-            time.sleep(shutdown_poll_interval)
+                logger.warning("SSH not responsive before reboot - machine may already be down")
 
-        # Timeout reached - shutdown not confirmed
-        logger.warning(
-            f"Shutdown not confirmed within {shutdown_timeout}s - machine may still be up or reboot pending"
-        )
-        return False
+            # Send reset command
+            try:
+                ret, _stdout, stderr = self._run_ipmi_command(["power", "reset"], capture_stdout=False)
+            except IPMIError:
+                return False
+
+            if ret != 0:
+                logger.error(f"Reset failed: {stderr}")
+                return False
+
+            logger.info("✓ Reset command sent")
+
+            # Wait for shutdown
+            logger.info("Waiting for machine to shut down...")
+            shutdown_timeout = 120  # Fixed timeout to prevent infinite loop
+            poll_interval = SHUTDOWN_POLL_MIN_INTERVAL
+            start_time = time.monotonic()
+
+            while time.monotonic() - start_time < shutdown_timeout:
+                if not ssh_client.is_alive():
+                    elapsed = time.monotonic() - start_time
+                    logger.info(f"✓ Machine shutdown confirmed after {elapsed:.1f}s")
+                    return True
+                time.sleep(poll_interval)
+                poll_interval = min(SHUTDOWN_POLL_MAX_INTERVAL, poll_interval * SHUTDOWN_POLL_BACKOFF)
+
+            # Timeout reached - shutdown not confirmed
+            logger.warning(
+                f"Shutdown not confirmed within {shutdown_timeout}s - machine may still be up or reboot pending"
+            )
+            return False
+        finally:
+            ssh_client.close()
 
     def set_boot_device(self, device: BootDevice, persistent: bool = False) -> bool:
         """Set next boot device.
@@ -334,7 +350,7 @@ class IPMIController(PowerController):
             args.append("options=efiboot")
 
         try:
-            ret, _stdout, stderr = self._run_ipmi_command(args)
+            ret, _stdout, stderr = self._run_ipmi_command(args, capture_stdout=False)
         except IPMIError:
             return False
 
@@ -360,12 +376,8 @@ class IPMIController(PowerController):
             logger.error(f"Failed to get boot device: {stderr}")
             return None
 
-        # Parse output
-        for line in stdout.split("\n"):
-            if "Boot Device Selector" in line:
-                return line.split(":")[-1].strip()
-
-        return None
+        match = BOOT_DEVICE_RE.search(stdout)
+        return match.group(1) if match else None
 
     def health_check(self) -> dict:
         """Perform health check on IPMI controller.
@@ -461,7 +473,7 @@ class IPMIController(PowerController):
         logger.info("Clearing SEL log...")
 
         try:
-            ret, _stdout, stderr = self._run_ipmi_command(["sel", "clear"])
+            ret, _stdout, stderr = self._run_ipmi_command(["sel", "clear"], capture_stdout=False)
         except IPMIError:
             return False
 
@@ -484,19 +496,80 @@ class IPMIController(PowerController):
         logger.info(f"Activating serial console for {duration}s...")
 
         try:
-            # Deactivate any existing SOL session first
-            self._run_ipmi_command(["sol", "deactivate"], timeout=SOL_DEACTIVATE_TIMEOUT)
-            time.sleep(1)
+            with contextlib.closing(self.stream_serial_console(duration)) as stream:
+                return "".join(stream)
+        except (IPMIError, OSError) as exc:
+            logger.error(f"Serial console activation failed: {exc}")
+            return None
 
-            # Activate SOL
-            _ret, stdout, _stderr = self._run_ipmi_command(["sol", "activate"], timeout=duration)
+    def stream_serial_console(
+        self, duration: int = 30, stop_event: Optional[threading.Event] = None
+    ) -> Generator[str, None, None]:
+        """Activate serial console and yield its output line by line as it arrives.
 
-            return stdout
+        The SOL session is torn down when the generator finishes or is closed.
+        ipmitool's stdin is kept open (but never written to), since the SOL
+        session ends as soon as it reads EOF there.
 
-        except IPMIError as exc:
-            logger.error(f"Serial console activation failed: {exc}")
-            return None
+        Args:
+            duration: Maximum streaming time in seconds
+            stop_event: Optional event that ends the stream early once set
+
+        Yields:
+            Console lines, including line endings (the last one may lack one)
+
+        Raises:
+            IPMIError: If the existing SOL session cannot be deactivated
+            OSError: If ipmitool cannot be started
+        """
+        # Deactivate any existing SOL session first
+        self._run_ipmi_command(["sol", "deactivate"], timeout=SOL_DEACTIVATE_TIMEOUT)
+        time.sleep(1)
+
+        deadline = time.monotonic() + duration
+        proc = subprocess.Popen(
+            [*self._ipmi_prefix, "sol", "activate"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.PIPE,
+            env=self._ipmi_env,
+        )
+
+        try:
+            fd = proc.stdout.fileno()  # type: ignore[union-attr]
+            partial = b""
+
+            while stop_event is None or not stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                readable, _, _ = select.select(
+                    [fd], [], [], min(remaining, SOL_STOP_POLL_INTERVAL)
+                )
+                if not readable:
+                    continue
+
+                chunk = os.read(fd, SOL_READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+
+                *lines, partial = (partial + chunk).split(b"\n")
+                for line in lines:
+                    yield line.decode(errors="replace") + "\n"
+
+            if partial:
+                yield partial.decode(errors="replace")
         finally:
+            proc.stdin.close()  # type: ignore[union-attr]
+            if proc.poll() is None:
+                proc.terminate()
+                try:
+                    proc.wait(timeout=SOL_DEACTIVATE_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+
             # Deactivate SOL
             with contextlib.suppress(IPMIError):
                 self._run_ipmi_command(["sol", "deactivate"], timeout=SOL_DEACTIVATE_TIMEOUT)
@@ -538,14 +611,24 @@ class IPMIController(PowerController):
         """
         logger.warning("=== Starting Emergency Recovery ===")
 
-        # Try to get current state
-        power_state = self.get_power_status()
+        # Query current state and recent SEL entries concurrently; each ipmitool
+        # call opens its own BMC session, so they do not wait on each other
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            power_future = executor.submit(self.get_power_status)
+            sel_future = executor.submit(self.get_sel_log, RECOVERY_SEL_LINES)
+            power_state = power_future.result()
+            sel_log = sel_future.result()
+
         logger.info(f"Current power state: {power_state.value}")
+        if sel_log:
+            logger.info(f"Recent SEL entries:\n{sel_log.rstrip()}")
 
         # Try reset first (less disruptive)
         logger.info("Attempting reset...")
         if self.reset():
-            time.sleep(5)
+            # An unresponsive host "confirms" shutdown at once; give the BMC
+            # time to actually take it down before callers probe it again
+            time.sleep(RESET_SETTLE_TIME)
             return True
 
         # If reset fails, try power cycle
@@ -556,7 +639,7 @@ class IPMIController(PowerController):
         # If power cycle fails, try force power off then on
         logger.error("Power cycle failed, attempting force power off/on...")
         if self.power_off(force=True):
-            time.sleep(10)
+            self._wait_for_power(PowerState.OFF, POWER_CYCLE_WAIT_TIME)
             if self.power_on():
                 return True
 
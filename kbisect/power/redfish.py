@@ -16,10 +16,15 @@ from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 from kbisect.power.base import (
+    POWER_DOWN_POLL_INTERVAL,
+    SHUTDOWN_POLL_BACKOFF,
+    SHUTDOWN_POLL_MAX_INTERVAL,
+    SHUTDOWN_POLL_MIN_INTERVAL,
     BootDevice,
     PowerController,
     PowerState,
 )
+from kbisect.remote.base import RemoteClient
 from kbisect.remote.ssh import SSHClient
 
 
@@ -213,8 +218,14 @@ class RedfishController(PowerController):
         logger.error("Power off failed")
         return False
 
-    def power_cycle(self, wait_time: int = POWER_CYCLE_WAIT_TIME) -> bool:
-        """Power cycle the system (off then on)."""
+    def power_cycle(
+        self, wait_time: int = POWER_CYCLE_WAIT_TIME, ssh_client: Optional[RemoteClient] = None
+    ) -> bool:
+        """Power cycle the system (off then on).
+
+        With ssh_client, power on is sent as soon as the system stops
+        answering SSH, with wait_time as the upper bound.
+        """
         logger.info("Power cycling system via Redfish...")
 
         # Ensure system boots from disk, not PXE
@@ -224,8 +235,14 @@ class RedfishController(PowerController):
             logger.error("Failed to power off")
             return False
 
-        logger.info(f"Waiting {wait_time}s for system to power down...")
-        time.sleep(wait_time)
+        if ssh_client is None:
+            logger.info(f"Waiting {wait_time}s for system to power down...")
+            time.sleep(wait_time)
+        else:
+            logger.info(f"Waiting up to {wait_time}s for system to power down...")
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < wait_time and ssh_client.is_alive():
+                time.sleep(POWER_DOWN_POLL_INTERVAL)
 
         if not self.power_on():
             logger.error("Failed to power on")
@@ -244,33 +261,39 @@ class RedfishController(PowerController):
 
         ssh_client = SSHClient(self.ssh_host, user="root", connect_timeout=self.ssh_connect_timeout)
 
-        logger.info("Verifying SSH connectivity before reboot...")
-        if not ssh_client.is_alive():
-            logger.warning("SSH not responsive before reboot - machine may already be down")
-
-        if not self._reset_action(RESET_TYPE_FORCE_RESTART):
-            logger.error("Reset command failed")
-            return False
-
-        logger.info("Reset command sent")
-
-        # Wait for shutdown
-        logger.info("Waiting for machine to shut down...")
-        shutdown_timeout = 120
-        shutdown_poll_interval = 2
-        start_time = time.time()
-
-        while time.time() - start_time < shutdown_timeout:
+        try:
+            logger.info("Verifying SSH connectivity before reboot...")
             if not ssh_client.is_alive():
-                elapsed = time.time() - start_time
-                logger.info(f"Machine shutdown confirmed after {elapsed:.1f}s")
-                return True
-            time.sleep(shutdown_poll_interval)
-
-        logger.warning(
-            f"Shutdown not confirmed within {shutdown_timeout}s - machine may still be up"
-        )
-        return False
+                logger.warning("SSH not responsive before reboot - machine may already be down")
+
+            if not self._reset_action(RESET_TYPE_FORCE_RESTART):
+                logger.error("Reset command failed")
+                return False
+
+            logger.info("Reset command sent")
+
+            # Wait for shutdown
+            logger.info("Waiting for machine to shut down...")
+            shutdown_timeout = 120
+            poll_interval = SHUTDOWN_POLL_MIN_INTERVAL
+            start_time = time.monotonic()
+
+            while time.monotonic() - start_time < shutdown_timeout:
+                if not ssh_client.is_alive():
+                    elapsed = time.monotonic() - start_time
+                    logger.info(f"Machine shutdown confirmed after {elapsed:.1f}s")
+                    return True
+                time.sleep(poll_interval)
+                poll_interval = min(
+                    SHUTDOWN_POLL_MAX_INTERVAL, poll_interval * SHUTDOWN_POLL_BACKOFF
+                )
+
+            logger.warning(
+                f"Shutdown not confirmed within {shutdown_timeout}s - machine may still be up"
+            )
+            return False
+        finally:
+            ssh_client.close()
 
     def set_boot_device(self, device: BootDevice, persistent: bool = False) -> bool:
         """Set boot device for next boot or permanently."""
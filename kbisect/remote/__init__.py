@@ -1,10 +1,11 @@
 """Remote communication implementations for interacting with slave machines."""
 
-from kbisect.remote.base import RemoteClient
+from kbisect.remote.base import RemoteClient, check_alive
 from kbisect.remote.ssh import SSHClient
 
 
 __all__ = [
     "RemoteClient",
     "SSHClient",
+    "check_alive",
 ]
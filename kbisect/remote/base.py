@@ -5,7 +5,8 @@ Provides interface for remote command execution and file transfer.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 
 
 # Constants
@@ -73,3 +74,29 @@ class RemoteClient(ABC):
         Returns:
             True if copy succeeded, False otherwise
         """
+
+    def close(self) -> None:  # noqa: B027
+        """Release any resources held by the client.
+
+        Default implementation does nothing. Implementations that keep
+        persistent connections should override this.
+        """
+
+
+def check_alive(clients: Sequence[RemoteClient]) -> List[bool]:
+    """Check several remote hosts for reachability in parallel.
+
+    Each is_alive() call mostly waits on the network, so running them on
+    threads makes a sweep over N hosts take about as long as the slowest one.
+
+    Args:
+        clients: Remote clients to check
+
+    Returns:
+        is_alive() result for each client, in the same order
+    """
+    if not clients:
+        return []
+
+    with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+        return list(executor.map(lambda client: client.is_alive(), clients))
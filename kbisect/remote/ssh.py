@@ -4,23 +4,113 @@
 Provides SSH-based remote client implementation for slave communication.
 """
 
+import functools
 import logging
+import os
+import re
 import select
 import shlex
+import shutil
+import socket
 import subprocess
+import tempfile
+import threading
 import time
-from typing import Callable, Optional, Tuple
+import uuid
+import weakref
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple, Union
 
 from kbisect.remote.base import RemoteClient
 
 
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+
 logger = logging.getLogger(__name__)
 
+# Constants
+SSH_CONTROL_PERSIST = 600  # Seconds an idle multiplexed master connection is kept open
+SSH_SERVER_ALIVE_INTERVAL = 5  # Keepalive interval so a master to a rebooted host dies quickly
+SSH_SERVER_ALIVE_COUNT_MAX = 3
+SSH_BACKEND_ENV = "KBISECT_SSH_BACKEND"  # "openssh" (default) or "paramiko"
+RSYNC_MIN_FILE_SIZE = 1_000_000  # Bytes above which copy_file prefers rsync delta transfer
+COPY_MIN_THROUGHPUT = 512 * 1024  # Bytes/s assumed when sizing copy_file timeouts
+SSH_PORT = 22
+BISECT_LIBRARY_PATH = "/root/kernel-bisect/lib/bisect-functions.sh"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_command(library_path: str) -> str:
+    """Build (once per library path) the shell command that sources the bisect library.
+
+    Args:
+        library_path: Path to the bisect library on slave
+
+    Returns:
+        ``source <quoted path>`` command string
+    """
+    return f"source {shlex.quote(library_path)}"
+
+
+def _decode_output(data: Union[bytes, bytearray]) -> str:
+    """Decode raw command output the way a text-mode pipe would.
+
+    Args:
+        data: Raw output bytes
+
+    Returns:
+        Decoded text with CRLF/CR translated to LF
+    """
+    return data.decode(errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _stop_control_master(
+    control_path: str, control_dir: str, ssh_target: str, timeout: int
+) -> None:
+    """Stop a multiplexed master connection and remove its socket directory.
+
+    Kept outside SSHClient so a weakref finalizer can call it without holding
+    a reference to the client.
+
+    Args:
+        control_path: ControlPath of the master connection
+        control_dir: Directory holding the control socket
+        ssh_target: ``user@host`` the master is connected to
+        timeout: Seconds to wait for ssh to stop the master
+    """
+    try:
+        subprocess.run(
+            ["ssh", "-o", f"ControlPath={control_path}", "-O", "exit", ssh_target],
+            capture_output=True,
+            timeout=timeout,
+            check=False,
+        )
+    except Exception as exc:
+        logger.debug(f"Failed to stop SSH master connection: {exc}")
+
+    shutil.rmtree(control_dir, ignore_errors=True)
+
 
 class SSHClient(RemoteClient):
     """SSH client for slave communication.
 
     Provides methods to execute commands on slave via SSH and copy files.
+    All ssh/scp invocations share one multiplexed master connection
+    (OpenSSH ControlMaster), so only the first call pays for the TCP
+    handshake and authentication.
+
+    Setting KBISECT_SSH_BACKEND=paramiko (with paramiko installed) runs
+    commands and file copies over a persistent in-process paramiko
+    connection instead, avoiding a local ssh process per call. Streaming
+    calls always use the ssh binary.
+
+    Either way, commands issued concurrently from several threads (e.g. a
+    streaming build plus control commands) run as separate channels over
+    the one connection to the host.
 
     Attributes:
         host: Slave hostname or IP
@@ -39,6 +129,132 @@ class SSHClient(RemoteClient):
         super().__init__(host, user)
         self.connect_timeout = connect_timeout
 
+        # Per-instance directory for the ControlMaster socket
+        control_dir = tempfile.mkdtemp(prefix="kbisect-ssh-")
+        self._control_path = f"{control_dir}/cm-%C"
+        # Common ssh/scp/rsync options and the full ssh argv prefix, built once
+        self._ssh_base_opts = (
+            "-o",
+            "StrictHostKeyChecking=no",
+            "-o",
+            "BatchMode=yes",
+            "-o",
+            f"ConnectTimeout={self.connect_timeout}",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            f"ControlPath={self._control_path}",
+            "-o",
+            f"ControlPersist={SSH_CONTROL_PERSIST}s",
+            "-o",
+            f"ServerAliveInterval={SSH_SERVER_ALIVE_INTERVAL}",
+            "-o",
+            f"ServerAliveCountMax={SSH_SERVER_ALIVE_COUNT_MAX}",
+        )
+        self._ssh_target = f"{self.user}@{self.host}"
+        self._ssh_prefix = ("ssh", *self._ssh_base_opts, self._ssh_target)
+
+        self._paramiko_client: Optional[paramiko.SSHClient] = None
+        self._paramiko_lock = threading.Lock()
+        self._use_paramiko = os.environ.get(SSH_BACKEND_ENV, "openssh").lower() == "paramiko"
+        if self._use_paramiko and paramiko is None:
+            logger.warning(
+                f"{SSH_BACKEND_ENV}=paramiko requested but paramiko is not installed, "
+                "using the ssh binary"
+            )
+            self._use_paramiko = False
+
+        # Stop the master when the client is closed, collected or at interpreter exit
+        self._finalizer = weakref.finalize(
+            self,
+            _stop_control_master,
+            self._control_path,
+            control_dir,
+            self._ssh_target,
+            self.connect_timeout,
+        )
+
+    @property
+    def rsync_shell(self) -> str:
+        """SSH command line for ``rsync -e`` that reuses this client's master connection."""
+        return " ".join(("ssh", *self._ssh_base_opts))
+
+    def _get_paramiko_client(self) -> "paramiko.SSHClient":
+        """Return the persistent paramiko connection, reconnecting if it dropped.
+
+        Returns:
+            Connected paramiko SSHClient
+        """
+        with self._paramiko_lock:
+            client = self._paramiko_client
+            if client is not None:
+                transport = client.get_transport()
+                if transport is not None and transport.is_active():
+                    return client
+                client.close()
+
+            client = paramiko.SSHClient()
+            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            client.connect(
+                self.host,
+                username=self.user,
+                timeout=self.connect_timeout,
+                banner_timeout=self.connect_timeout,
+                auth_timeout=self.connect_timeout,
+            )
+            self._paramiko_client = client
+            return client
+
+    def _drop_paramiko_client(self) -> None:
+        """Close the paramiko connection so the next call reconnects."""
+        with self._paramiko_lock:
+            if self._paramiko_client is not None:
+                self._paramiko_client.close()
+                self._paramiko_client = None
+
+    def _run_command_paramiko(
+        self, command: str, timeout: Optional[int] = None
+    ) -> Tuple[int, str, str]:
+        """Run command over the persistent paramiko connection.
+
+        Args:
+            command: Command to execute
+            timeout: Command timeout in seconds
+
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
+        try:
+            client = self._get_paramiko_client()
+            _stdin, stdout, stderr = client.exec_command(command, timeout=timeout)
+        except Exception as exc:
+            logger.error(f"SSH command failed: {exc}")
+            self._drop_paramiko_client()
+            return -1, "", str(exc)
+
+        # Drain stderr on a helper thread: reading stdout to EOF first would
+        # deadlock once the remote blocks on a full stderr window
+        err_chunks: List[bytes] = []
+        err_reader = threading.Thread(
+            target=lambda: err_chunks.append(stderr.read()), daemon=True
+        )
+        err_reader.start()
+
+        try:
+            out = stdout.read().decode(errors="replace")
+            err_reader.join()
+            err = b"".join(err_chunks).decode(errors="replace")
+            return stdout.channel.recv_exit_status(), out, err
+        except socket.timeout:
+            # Abandon only this channel; concurrent commands keep the connection
+            logger.error(f"SSH command timed out after {timeout}s")
+            stdout.channel.close()
+            return -1, "", "Timeout"
+        except Exception as exc:
+            logger.error(f"SSH command failed: {exc}")
+            self._drop_paramiko_client()
+            return -1, "", str(exc)
+
     def run_command(self, command: str, timeout: Optional[int] = None) -> Tuple[int, str, str]:
         """Run command on slave via SSH.
 
@@ -49,20 +265,15 @@ class SSHClient(RemoteClient):
         Returns:
             Tuple of (return_code, stdout, stderr)
         """
-        ssh_command = [
-            "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            f"ConnectTimeout={self.connect_timeout}",
-            f"{self.user}@{self.host}",
-            command,
-        ]
+        if self._use_paramiko:
+            return self._run_command_paramiko(command, timeout=timeout)
+
+        ssh_command = (*self._ssh_prefix, command)
 
         try:
             result = subprocess.run(
-                ssh_command, capture_output=True, text=True, timeout=timeout, check=False,
-                errors="replace",
+                ssh_command, stdin=subprocess.DEVNULL, capture_output=True, timeout=timeout,
+                check=False, encoding="utf-8", errors="replace",
             )
             return result.returncode, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
@@ -72,11 +283,37 @@ class SSHClient(RemoteClient):
             logger.error(f"SSH command failed: {exc}")
             return -1, "", str(exc)
 
+    def _run_raw(self, argv: Sequence[str], timeout: Optional[int] = None) -> int:
+        """Run a local command for its exit status only, without capturing output.
+
+        Args:
+            argv: Command and arguments
+            timeout: Command timeout in seconds
+
+        Returns:
+            Process return code, or -1 on timeout or failure to run
+        """
+        try:
+            return subprocess.run(
+                argv,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+                check=False,
+            ).returncode
+        except subprocess.TimeoutExpired:
+            logger.error(f"SSH command timed out after {timeout}s")
+            return -1
+        except Exception as exc:
+            logger.error(f"SSH command failed: {exc}")
+            return -1
+
     def call_function(
         self,
         function_name: str,
         *args: str,
-        library_path: str = "/root/kernel-bisect/lib/bisect-functions.sh",
+        library_path: str = BISECT_LIBRARY_PATH,
         timeout: Optional[int] = None,
     ) -> Tuple[int, str, str]:
         """Call a bash function from the bisect library.
@@ -94,15 +331,62 @@ class SSHClient(RemoteClient):
         args_str = " ".join(shlex.quote(str(arg)) for arg in args)
 
         # Source library and call function (quote paths for safety)
-        command = f"source {shlex.quote(library_path)} && {function_name} {args_str}"
+        command = f"{_source_command(library_path)} && {function_name} {args_str}"
 
         return self.run_command(command, timeout=timeout)
 
+    def batch_run(
+        self, commands: Sequence[str], timeout: Optional[int] = None
+    ) -> List[Tuple[int, str, str]]:
+        """Run independent commands through one SSH invocation and split the results.
+
+        Each command runs in its own subshell, so a failure or exit in one
+        does not affect the others, and every command gets its own return
+        code and output.
+
+        Args:
+            commands: Shell commands to run in order
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            (return_code, stdout, stderr) per command. Commands that did not
+            complete (connection failure, timeout) get return code -1.
+        """
+        if not commands:
+            return []
+
+        # Unique per batch so command output cannot forge a marker
+        marker = f"__KBISECT_RC_{uuid.uuid4().hex}_"
+        lines = []
+        for command in commands:
+            lines.append(f"(\n{command}\n)")
+            lines.append(f"rc=$?; printf '{marker}%d__\\n' $rc; printf '{marker}%d__\\n' $rc >&2")
+        script = "\n".join(lines)
+
+        ret, stdout, stderr = self.run_command(f"bash -c {shlex.quote(script)}", timeout=timeout)
+
+        pattern = re.compile(re.escape(marker) + r"(\d+)__\n")
+        out_parts = pattern.split(stdout)
+        err_parts = pattern.split(stderr)
+
+        results = []
+        for i in range(len(commands)):
+            if 2 * i + 1 < len(out_parts):
+                err = err_parts[2 * i] if 2 * i + 1 < len(err_parts) else ""
+                results.append((int(out_parts[2 * i + 1]), out_parts[2 * i], err))
+            else:
+                # Batch stopped before this command finished
+                out = out_parts[2 * i] if 2 * i < len(out_parts) else ""
+                err = err_parts[2 * i] if 2 * i < len(err_parts) else stderr
+                results.append((-1 if ret == 0 else ret, out, err))
+
+        return results
+
     def call_function_streaming(
         self,
         function_name: str,
         *args: str,
-        library_path: str = "/root/kernel-bisect/lib/bisect-functions.sh",
+        library_path: str = BISECT_LIBRARY_PATH,
         timeout: Optional[int] = None,
         chunk_callback: Optional[Callable[[str, str], None]] = None,
     ) -> Tuple[int, str, str]:
@@ -122,73 +406,91 @@ class SSHClient(RemoteClient):
         args_str = " ".join(shlex.quote(str(arg)) for arg in args)
 
         # Source library and call function
-        command = f"source {shlex.quote(library_path)} && {function_name} {args_str}"
+        command = f"{_source_command(library_path)} && {function_name} {args_str}"
 
-        ssh_command = [
-            "ssh",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            f"ConnectTimeout={self.connect_timeout}",
-            f"{self.user}@{self.host}",
-            command,
-        ]
+        ssh_command = (*self._ssh_prefix, command)
 
         try:
-            # Use Popen for streaming
+            # Use Popen for streaming; pipes are read as raw non-blocking fds
             process = subprocess.Popen(
                 ssh_command,
+                stdin=subprocess.DEVNULL,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,  # Line buffered
-                errors="replace",
             )
 
-            stdout_lines = []
-            stderr_lines = []
-            start_time = time.time()
-
-            # Read output as it arrives
-            while True:
-                # Check timeout
-                if timeout and (time.time() - start_time) > timeout:
-                    process.kill()
-                    logger.error(f"SSH command timed out after {timeout}s")
-                    return -1, "".join(stdout_lines), "Timeout"
+            stdout = process.stdout
+            stderr = process.stderr
+            assert stdout is not None
+            assert stderr is not None
+            stdout_fd = stdout.fileno()
+            stderr_fd = stderr.fileno()
+            os.set_blocking(stdout_fd, False)
+            os.set_blocking(stderr_fd, False)
+
+            # Raw output per fd, decoded once at the end; delivered tracks how
+            # far complete lines have been passed to chunk_callback
+            output = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+            delivered = {stdout_fd: 0, stderr_fd: 0}
+            open_fds = [stdout_fd, stderr_fd]
+            start_time = time.monotonic()
+
+            def deliver(fd: int, end: int, callback: Callable[[str, str], None]) -> None:
+                buf = output[fd]
+                start = delivered[fd]
+                while start < end:
+                    newline = buf.find(b"\n", start, end)
+                    stop = end if newline == -1 else newline + 1
+                    text = _decode_output(buf[start:stop])
+                    if fd == stdout_fd:
+                        callback(text, "")
+                    else:
+                        callback("", text)
+                    start = stop
+                delivered[fd] = end
+
+            # Read output as it arrives, until both pipes reach EOF
+            while open_fds:
+                wait = None
+                if timeout:
+                    wait = timeout - (time.monotonic() - start_time)
+                    if wait <= 0:
+                        process.kill()
+                        process.wait()
+                        logger.error(f"SSH command timed out after {timeout}s")
+                        return -1, _decode_output(output[stdout_fd]), "Timeout"
 
-                # Use select to check which pipes have data
                 # Note: select() doesn't work on Windows, but kbisect is Linux-focused
-                readable, _, _ = select.select([process.stdout, process.stderr], [], [], 0.1)
-
-                for stream in readable:
-                    line = stream.readline()
-                    if line:
-                        if stream == process.stdout:
-                            stdout_lines.append(line)
-                            if chunk_callback:
-                                chunk_callback(line, "")
-                        else:
-                            stderr_lines.append(line)
-                            if chunk_callback:
-                                chunk_callback("", line)
-
-                # Check if process has ended
-                if process.poll() is not None:
-                    # Read any remaining output
-                    remaining_stdout = process.stdout.read()
-                    remaining_stderr = process.stderr.read()
-                    if remaining_stdout:
-                        stdout_lines.append(remaining_stdout)
-                        if chunk_callback:
-                            chunk_callback(remaining_stdout, "")
-                    if remaining_stderr:
-                        stderr_lines.append(remaining_stderr)
-                        if chunk_callback:
-                            chunk_callback("", remaining_stderr)
-                    break
-
-            return process.returncode, "".join(stdout_lines), "".join(stderr_lines)
+                readable, _, _ = select.select(open_fds, [], [], wait)
+
+                for fd in readable:
+                    try:
+                        data = os.read(fd, 65536)
+                    except BlockingIOError:
+                        continue
+
+                    buf = output[fd]
+                    if not data:
+                        # EOF: deliver any unterminated last line
+                        open_fds.remove(fd)
+                        if chunk_callback and delivered[fd] < len(buf):
+                            deliver(fd, len(buf), chunk_callback)
+                        continue
+
+                    buf += data
+                    if chunk_callback:
+                        newline = buf.rfind(b"\n", len(buf) - len(data))
+                        if newline != -1:
+                            deliver(fd, newline + 1, chunk_callback)
+
+            process.wait()
+            stdout.close()
+            stderr.close()
+            return (
+                process.returncode,
+                _decode_output(output[stdout_fd]),
+                _decode_output(output[stderr_fd]),
+            )
 
         except Exception as exc:
             logger.error(f"SSH streaming command failed: {exc}")
@@ -198,36 +500,139 @@ class SSHClient(RemoteClient):
         """Check if slave is reachable via SSH.
 
         Uses the configured connect_timeout instead of hardcoded default.
+        Only the exit status is checked, so output is neither captured nor decoded.
 
         Returns:
             True if host is reachable, False otherwise
         """
-        ret, _, _ = self.run_command("echo alive", timeout=self.connect_timeout)
+        if self._use_paramiko:
+            ret, _, _ = self.run_command("echo alive", timeout=self.connect_timeout)
+        else:
+            ssh_command = (*self._ssh_prefix, "echo alive")
+            ret = self._run_raw(ssh_command, timeout=self.connect_timeout)
+
         return ret == 0
 
-    def copy_file(self, local_path: str, remote_path: str) -> bool:
+    def tcp_probe(self, timeout: Optional[float] = None) -> bool:
+        """Check if the SSH port accepts TCP connections.
+
+        Much cheaper than is_alive() (no process spawn or SSH handshake), so it
+        suits polling a host that is still rebooting. A successful probe does
+        not guarantee sshd is ready to authenticate, and a failed one does not
+        prove the host is down: ssh itself may reach it through ~/.ssh/config
+        (HostName aliases, Port, ProxyJump), which this probe ignores.
+
+        Args:
+            timeout: Connect timeout in seconds (defaults to connect_timeout)
+
+        Returns:
+            True if the port is open, False otherwise
+        """
+        try:
+            with socket.create_connection(
+                (self.host, SSH_PORT), timeout=timeout or self.connect_timeout
+            ):
+                return True
+        except OSError:
+            return False
+
+    def copy_file(
+        self, local_path: str, remote_path: str, use_rsync: Optional[bool] = None
+    ) -> bool:
         """Copy file to slave.
 
+        Large files are sent with rsync over the multiplexed SSH connection, so
+        re-uploading a mostly unchanged file only transfers the delta. The
+        transfer times out based on file size (at least COPY_MIN_THROUGHPUT).
+
         Args:
             local_path: Local file path
             remote_path: Remote destination path
+            use_rsync: Force (True) or disable (False) rsync; by default it is
+                used for files over RSYNC_MIN_FILE_SIZE when rsync is installed
 
         Returns:
             True if copy succeeded, False otherwise
         """
+        try:
+            size = Path(local_path).stat().st_size
+        except OSError:
+            size = 0
+        timeout = max(self.connect_timeout + 30, size // COPY_MIN_THROUGHPUT + 60)
+
+        if use_rsync is None:
+            use_rsync = size > RSYNC_MIN_FILE_SIZE and shutil.which("rsync") is not None
+
+        if use_rsync:
+            rsync_command = [
+                "rsync",
+                "-e",
+                self.rsync_shell,
+                "--inplace",
+                "--partial",
+                "-z",
+                local_path,
+                f"{self._ssh_target}:{remote_path}",
+            ]
+
+            try:
+                result = subprocess.run(
+                    rsync_command,
+                    capture_output=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    timeout=timeout,
+                    check=False,
+                )
+                if result.returncode != 0:
+                    logger.error(f"rsync failed: {result.stderr.strip()}")
+                return result.returncode == 0
+            except subprocess.TimeoutExpired:
+                logger.error(f"rsync timed out after {timeout}s")
+                return False
+            except Exception as exc:
+                logger.error(f"rsync failed: {exc}")
+                return False
+
+        if self._use_paramiko:
+            try:
+                sftp = self._get_paramiko_client().open_sftp()
+                sftp.get_channel().settimeout(timeout)
+                try:
+                    sftp.put(local_path, remote_path)
+                finally:
+                    sftp.close()
+                return True
+            except Exception as exc:
+                logger.error(f"SFTP copy failed: {exc}")
+                self._drop_paramiko_client()
+                return False
+
         scp_command = [
             "scp",
-            "-o",
-            "StrictHostKeyChecking=no",
-            "-o",
-            f"ConnectTimeout={self.connect_timeout}",
+            *self._ssh_base_opts,
             local_path,
-            f"{self.user}@{self.host}:{remote_path}",
+            f"{self._ssh_target}:{remote_path}",
         ]
 
         try:
-            result = subprocess.run(scp_command, capture_output=True, text=True, check=False)
-            return result.returncode == 0
+            # Output is not used, so it is not decoded
+            scp_result = subprocess.run(
+                scp_command, capture_output=True, timeout=timeout, check=False
+            )
+            return scp_result.returncode == 0
+        except subprocess.TimeoutExpired:
+            logger.error(f"SCP timed out after {timeout}s")
+            return False
         except Exception as exc:
             logger.error(f"SCP failed: {exc}")
             return False
+
+    def close(self) -> None:
+        """Stop the multiplexed master connection and remove its socket directory.
+
+        Safe to call more than once; also runs when the client is garbage
+        collected or at interpreter exit.
+        """
+        self._drop_paramiko_client()
+        self._finalizer()